@@ -1,9 +1,13 @@
 import tkinter as tk
 
-from tkinter import messagebox, ttk
+from tkinter import messagebox
 
 import pandas as pd
 
+from wellness_engine import NEEDS_MORE, EntryError, WellnessEngine, WellnessRules
+
+from wellness_table import VirtualTable
+
 
 class WellnessLoggerApp:
 
@@ -13,7 +17,13 @@ class WellnessLoggerApp:
 
         self.root.title("Mental Wellness Entry Logger")
 
-        self.entries = []
+        # ALab3's rule: 120 whole minutes plus both activities
+
+        self.rules = WellnessRules(min_minutes=120, needs_wellness=True, letters_only=(), whole_minutes=True)
+
+        self.engine = WellnessEngine(self.rules)
+
+        self.entries = self.engine.entries
 
 
         tk.Label(root, text="Mental Wellness Entry Logger", font=("Arial", 16, "bold")).pack(pady=10)
@@ -71,7 +81,15 @@ class WellnessLoggerApp:
         tk.Button(button_frame, text="Save to Excel", command=self.save_to_excel).grid(row=0, column=3, padx=5)
 
 
-        self.tree = ttk.Treeview(root, columns=("Name", "Wellness", "MeTime", "ScreenTime", "Status"), show='headings', height=8)
+        table_frame = tk.Frame(root)
+
+        table_frame.pack(pady=10)
+
+        # Rows live in self.entries; only the visible ones are Treeview items
+
+        self.table = VirtualTable(table_frame, ("Name", "Wellness", "MeTime", "ScreenTime", "Status"), self.row_values, height=8)
+
+        self.tree = self.table.tree
 
         for col in self.tree["columns"]:
 
@@ -79,29 +97,32 @@ class WellnessLoggerApp:
 
             self.tree.column(col, width=120)
 
-        self.tree.pack(pady=10)
+        self.tree.pack(side="left")
+
+        self.table.scrollbar.pack(side="right", fill="y")
 
 
         self.screen_time_entry.bind("<FocusOut>", lambda e: self.update_status())
 
 
-    def update_status(self):
+    def row_values(self, entry_id):
 
-        try:
+        entry = self.entries.get(entry_id)
 
-            screen_time = int(self.screen_time_entry.get())
+        return (entry.name, entry.wellness, entry.metime, entry.screen_free, entry.status)
 
-            if screen_time >= 120 and self.wellness_entry.get().strip() and self.me_time_entry.get().strip():
 
-                status = "Healthy"
+    def update_status(self):
+
+        try:
 
-            else:
+            screen_time = self.rules.minutes(self.screen_time_entry.get())
 
-                status = "Needs More Me-Time"
+            status = self.rules.status(screen_time, self.me_time_entry.get().strip(), self.wellness_entry.get().strip())
 
-        except:
+        except EntryError:
 
-            status = "Needs More Me-Time"
+            status = NEEDS_MORE
 
         self.status_label.config(text=f"Status: {status}")
 
@@ -110,41 +131,21 @@ class WellnessLoggerApp:
 
     def add_entry(self):
 
-        name = self.name_entry.get().strip()
-
-        wellness = self.wellness_entry.get().strip()
-
-        me_time = self.me_time_entry.get().strip()
-
-        screen_time_str = self.screen_time_entry.get().strip()
-
-
-        if not name or not wellness or not me_time or not screen_time_str:
-
-            messagebox.showerror("Error", "All fields must be filled.")
-
-            return
-
-
         try:
 
-            screen_time = int(screen_time_str)
-
-            if screen_time <= 0:
+            entry = self.engine.add_entry(name=self.name_entry.get(), wellness=self.wellness_entry.get(), metime=self.me_time_entry.get(), screen_free=self.screen_time_entry.get())
 
-                raise ValueError
+        except EntryError as e:
 
-        except:
-
-            messagebox.showerror("Error", "Screen-Free Time must be a positive number.")
+            messagebox.showerror("Error", str(e))
 
             return
 
 
-        status = self.update_status()
+        self.update_status()
 
 
-        self.tree.insert("", "end", values=(name, wellness, me_time, screen_time, status))
+        self.table.append(entry.entry_id)
 
         messagebox.showinfo("Success", "Entry added successfully.")
 
@@ -153,7 +154,7 @@ class WellnessLoggerApp:
 
     def delete_entry(self):
 
-        selected_item = self.tree.selection()
+        selected_item = self.table.selection()
 
         if not selected_item:
 
@@ -161,16 +162,20 @@ class WellnessLoggerApp:
 
             return
 
-        self.tree.delete(selected_item)
+        for entry_id in selected_item:
+
+            self.engine.delete_entry(entry_id)
+
+            self.table.remove(int(entry_id))
 
         messagebox.showinfo("Deleted", "Selected entry deleted.")
 
 
     def clear_all(self):
 
-        for item in self.tree.get_children():
+        self.engine.clear()
 
-            self.tree.delete(item)
+        self.table.clear()
 
         messagebox.showinfo("Cleared", "All entries cleared.")
 
@@ -190,11 +195,7 @@ class WellnessLoggerApp:
 
     def save_to_excel(self):
 
-        data = []
-
-        for row_id in self.tree.get_children():
-
-            data.append(self.tree.item(row_id)["values"])
+        data = [self.row_values(entry.entry_id) for entry in self.entries]
 
         if not data:
 
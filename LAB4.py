@@ -1,10 +1,12 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from datetime import datetime
-import pandas as pd
-import re, os
-import matplotlib
-matplotlib.use("Agg")
+import math
+from wellness_entries import EntryStore
+from wellness_table import VirtualTable
+from wellness_journal import EntryJournal
+from wellness_engine import HEALTHY, EntryError, WellnessEngine, WellnessRules
+
+AUTOSAVE_MS = 30000
 
 
 class MentalWellnessLogger:
@@ -13,11 +15,22 @@ class MentalWellnessLogger:
         self.root.title("MindBloom – Nurture your thoughts daily")
         self.root.geometry("1000x720")
         self.root.configure(bg="#f8fafc")
-        self.entries = []
+        self.entries = EntryStore()
         self.dark_mode = False
         self.colors = {'primary': '#3b82f6', 'success': '#10b981', 'warning': '#f59e0b', 'danger': '#ef4444', 'light': '#f8fafc', 'card': '#fff'}
+        # Entries are autosaved: every save is logged, and the log is checkpointed to a snapshot
+        self.journal = EntryJournal("MindBloom_Entries")
+        try:
+            self.journal.load(self.entries)
+        except Exception as e:
+            # Leave the files alone so nothing on disk is overwritten by this session
+            messagebox.showerror("Error", f"Could not restore saved entries, autosave is off: {e}")
+            self.journal = None
+        self.engine = WellnessEngine(WellnessRules(min_minutes=60), storage=self.journal, entries=self.entries)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         self.setup_styles()
         self.layout_main()
+        self.root.after(AUTOSAVE_MS, self.autosave)
 
 
     def setup_styles(self):
@@ -92,18 +105,29 @@ class MentalWellnessLogger:
         self.recent_entries_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
 
 
-    def create_entry_card(self, parent, entry):
+    def create_entry_card(self, parent):
         card = tk.Frame(parent, bg="#fff", relief="solid", bd=1, padx=15, pady=10)
-        card.pack(fill="x", pady=(0, 10))
-        tk.Label(card, text=entry["Student Name"], font=("Segoe UI", 12, "bold"), bg="#fff", fg="#1e293b").pack(side="left")
-        status_color = self.colors['success'] if entry["Status"] == "Healthy" else self.colors['warning']
-        tk.Label(card, text=entry["Status"], font=("Segoe UI", 10, "bold"), bg=status_color, fg="white", padx=8, pady=2).pack(side="right")
-        details = f"🧘 {entry['Wellness Activity']} | 🎯 {entry['Me-Time Activity']} | ⏰ {entry['Screen-Free Time (minutes)']} min"
-        tk.Label(card, text=details, font=("Segoe UI", 10), bg="#fff", fg="#64748b").pack(anchor="w", pady=(5, 0))
-        tk.Label(card, text=entry["Date"], font=("Segoe UI", 9), bg="#fff", fg="#94a3b8").pack(anchor="w")
-
-
-    def open_entry_window(self, edit_idx=None):
+        name = tk.Label(card, font=("Segoe UI", 12, "bold"), bg="#fff", fg="#1e293b")
+        name.pack(side="left")
+        status = tk.Label(card, font=("Segoe UI", 10, "bold"), fg="white", padx=8, pady=2)
+        status.pack(side="right")
+        details = tk.Label(card, font=("Segoe UI", 10), bg="#fff", fg="#64748b")
+        details.pack(anchor="w", pady=(5, 0))
+        date = tk.Label(card, font=("Segoe UI", 9), bg="#fff", fg="#94a3b8")
+        date.pack(anchor="w")
+        return card, name, status, details, date
+
+
+    def fill_entry_card(self, card, entry):
+        _, name, status, details, date = card
+        name.config(text=entry.name)
+        status_color = self.colors['success'] if entry.status == "Healthy" else self.colors['warning']
+        status.config(text=entry.status, bg=status_color)
+        details.config(text=f"🧘 {entry.wellness} | 🎯 {entry.metime} | ⏰ {entry.screen_free} min")
+        date.config(text=entry.date)
+
+
+    def open_entry_window(self, edit_id=None):
         win = tk.Toplevel(self.root)
         win.title("Add Mental Wellness Entry")
         win.geometry("400x400")
@@ -141,7 +165,7 @@ class MentalWellnessLogger:
                     return
                 val = float(screentime)
                 if val < 0: raise ValueError
-                healthy = val >= 60 and bool(metime)
+                healthy = self.engine.rules.status(val, metime) == HEALTHY
                 status_label.config(text=f"Status: {'✅ Healthy' if healthy else '⚠️ Needs More Me-Time'}", fg=self.colors['success'] if healthy else self.colors['warning'])
             except:
                 status_label.config(text="Invalid screen-free time", fg=self.colors['danger'])
@@ -149,38 +173,25 @@ class MentalWellnessLogger:
             fields[key].bind("<KeyRelease>", update_status)
         for key in ['wellness', 'metime']:
             fields[key].bind("<<ComboboxSelected>>", update_status)
-        if edit_idx is not None:
-            entry = self.entries[edit_idx]
-            fields['name'].insert(0, entry["Student Name"])
-            fields['wellness'].set(entry["Wellness Activity"])
-            fields['metime'].set(entry["Me-Time Activity"])
-            fields['screentime'].insert(0, str(entry["Screen-Free Time (minutes)"]))
-            fields['notes'].insert("1.0", entry["Notes"])
+        if edit_id is not None:
+            entry = self.entries.get(edit_id)
+            fields['name'].insert(0, entry.name)
+            fields['wellness'].set(entry.wellness)
+            fields['metime'].set(entry.metime)
+            fields['screentime'].insert(0, str(entry.screen_free))
+            fields['notes'].insert("1.0", entry.notes)
             update_status()
         def save_entry():
+            values = dict(name=fields['name'].get(), wellness=fields['wellness'].get(), metime=fields['metime'].get(), screen_free=fields['screentime'].get(), notes=fields['notes'].get("1.0", "end"))
             try:
-                name = fields['name'].get().strip()
-                wellness = fields['wellness'].get().strip()
-                metime = fields['metime'].get().strip()
-                screentime = fields['screentime'].get().strip()
-                notes = fields['notes'].get("1.0", "end").strip()
-                if not all([name, wellness, metime, screentime]):
-                    messagebox.showerror("Error", "All fields except notes are required!")
-                    return
-                if not re.fullmatch(r"[A-Za-z ]+", name): messagebox.showerror("Error", "Name must only contain letters and spaces!"); return
-                screentime_val = float(screentime)
-                if screentime_val <= 0: raise ValueError
-                status = "Healthy" if screentime_val >= 60 and metime else "Needs More Me-Time"
-                entry = {"Student Name": name, "Wellness Activity": wellness, "Me-Time Activity": metime, "Screen-Free Time (minutes)": screentime_val, "Status": status, "Notes": notes, "Date": datetime.now().strftime("%Y-%m-%d %H:%M")}
-                if edit_idx is not None:
-                    self.entries[edit_idx] = entry
-                    messagebox.showinfo("Success", "Entry updated successfully!")
-                else:
-                    self.entries.append(entry)
-                    messagebox.showinfo("Success", "Entry added successfully!")
-                self.update_summary()
-                win.destroy()
-            except: messagebox.showerror("Error", "Screen-free time must be a positive number!")
+                # Validation, status and the autosave record all happen in the engine
+                if edit_id is not None: self.engine.update_entry(edit_id, **values)
+                else: self.engine.add_entry(**values)
+            except EntryError as e:
+                messagebox.showerror("Error", str(e)); return
+            messagebox.showinfo("Success", "Entry updated successfully!" if edit_id is not None else "Entry added successfully!")
+            self.update_summary()
+            win.destroy()
         btn_frame = tk.Frame(form, bg="#fff")
         btn_frame.grid(row=11, column=0, pady=10)
         tk.Button(btn_frame, text="💾 Save Entry", command=save_entry, font=("Segoe UI", 12, "bold"), bg=self.colors['success'], fg="white", bd=0, padx=18, pady=10, cursor="hand2").pack(side="left", padx=6)
@@ -201,54 +212,93 @@ class MentalWellnessLogger:
         table_frame = tk.Frame(win, bg="#fff")
         table_frame.pack(fill="both", expand=True)
         cols = ("Name", "Wellness", "Me-Time", "Screen-Free", "Status", "Date")
-        tree = ttk.Treeview(table_frame, columns=cols, show="headings", height=12)
+        def row_values(entry_id):
+            entry = self.entries.get(entry_id)
+            return (entry.name, entry.wellness, entry.metime, f"{entry.screen_free} min", entry.status, entry.date)
+        # Row ID is the entry ID, so editing a filtered row finds the right entry
+        table = VirtualTable(table_frame, cols, row_values, height=12)
+        tree = table.tree
         for col in cols: tree.heading(col, text=col, anchor="center"); tree.column(col, width=120, anchor="center")
         tree.pack(fill="both", expand=True, side="left")
-        scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=tree.yview)
-        tree.configure(yscrollcommand=scrollbar.set)
-        scrollbar.pack(side="right", fill="y")
+        table.scrollbar.pack(side="right", fill="y")
+        pending = None
         def update_table():
-            tree.delete(*tree.get_children())
-            ftxt = search_var.get().lower()
-            for entry in self.entries:
-                if not ftxt or ftxt in entry["Student Name"].lower() or ftxt in entry["Status"].lower():
-                    tree.insert("", "end", values=(entry["Student Name"], entry["Wellness Activity"], entry["Me-Time Activity"], f"{entry['Screen-Free Time (minutes)']} min", entry["Status"], entry["Date"]))
-        search_var.trace('w', lambda *args: update_table())
+            # Only the visible rows are rebuilt, however many entries match
+            nonlocal pending
+            pending = None
+            table.set_rows(self.entries.search(search_var.get()))
+        def schedule_update(*_):
+            # Coalesce keystrokes: search once typing pauses
+            nonlocal pending
+            if pending is not None: win.after_cancel(pending)
+            pending = win.after(150, update_table)
+        search_var.trace_add('write', schedule_update)
         update_table()
-        tk.Button(win, text="✏️ Edit Selected", command=lambda: self.edit_selected_entry(tree, win), font=("Segoe UI", 10, "bold"), bg=self.colors['primary'], fg="white", bd=0, padx=15, pady=8, cursor="hand2").pack(pady=8)
+        tk.Button(win, text="✏️ Edit Selected", command=lambda: self.edit_selected_entry(table, win), font=("Segoe UI", 10, "bold"), bg=self.colors['primary'], fg="white", bd=0, padx=15, pady=8, cursor="hand2").pack(pady=8)
 
 
-    def edit_selected_entry(self, tree, win):
-        sel = tree.selection()
+    def edit_selected_entry(self, table, win):
+        sel = table.selection()
         if not sel: messagebox.showwarning("No Selection", "Please select an entry to edit."); return
-        idx = tree.index(sel[0])
         win.destroy()
-        self.open_entry_window(edit_idx=idx)
+        self.open_entry_window(edit_id=sel[0])
 
 
     def open_dashboard_window(self):
+        # One dashboard window and figure per app: closing only hides it, reopening refreshes it
+        if hasattr(self, 'dashboard_win'):
+            self.dashboard_win.deiconify()
+            self.dashboard_win.lift()
+            self.refresh_dashboard()
+            return
+        # matplotlib is only loaded once somebody opens the dashboard
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
         win = tk.Toplevel(self.root)
         win.title("Wellness Dashboard")
         win.geometry("800x420")
         win.configure(bg=self.colors['light'])
+        win.protocol("WM_DELETE_WINDOW", win.withdraw)
         tk.Label(win, text="📊 Wellness Dashboard", font=("Segoe UI", 16, "bold"), bg=self.colors['primary'], fg="white").pack(fill="x")
         frame = tk.Frame(win, bg="#fff")
         frame.pack(fill="both", expand=True, padx=20, pady=20)
-        if not self.entries:
-            tk.Label(frame, text="No data to display", font=("Segoe UI", 16), bg="#fff", fg="#64748b").pack(expand=True)
-            return
-        healthy = sum(1 for e in self.entries if e["Status"] == "Healthy")
-        needs_more = len(self.entries) - healthy
+        self.dashboard_empty = tk.Label(frame, text="No data to display", font=("Segoe UI", 16), bg="#fff", fg="#64748b")
         fig = Figure(figsize=(7, 3), dpi=100, facecolor='#fff')
         ax = fig.add_subplot(111)
-        ax.pie([healthy, needs_more], labels=["Healthy", "Needs Improvement"], autopct='%1.1f%%', colors=[self.colors['success'], self.colors['warning']], startangle=90)
+        self.dashboard_pie = ax.pie([1, 1], labels=["Healthy", "Needs Improvement"], autopct='%1.1f%%', colors=[self.colors['success'], self.colors['warning']], startangle=90)
         ax.set_title("Wellness Status Distribution", fontsize=14, fontweight='bold', pad=20)
-        canvas = FigureCanvasTkAgg(fig, master=frame)
-        canvas.get_tk_widget().pack(pady=10)
-        total_time = sum(e["Screen-Free Time (minutes)"] for e in self.entries)
-        avg_time = total_time / len(self.entries) if self.entries else 0
-        stats_text = f"📈 Total Entries: {len(self.entries)} | 🎯 Healthy Days: {healthy} | ⏱️ Avg Screen-Free: {avg_time:.1f} min"
-        tk.Label(frame, text=stats_text, font=("Segoe UI", 12, "bold"), bg="#fff", fg="#1e293b").pack()
+        self.dashboard_canvas = FigureCanvasTkAgg(fig, master=frame)
+        self.dashboard_stats = tk.Label(frame, font=("Segoe UI", 12, "bold"), bg="#fff", fg="#1e293b")
+        self.dashboard_win = win
+        self.refresh_dashboard()
+
+
+    def refresh_dashboard(self):
+        if not hasattr(self, 'dashboard_win') or self.dashboard_win.state() == "withdrawn":
+            return
+        summary = self.entries.summary
+        chart = self.dashboard_canvas.get_tk_widget()
+        for widget in (self.dashboard_empty, chart, self.dashboard_stats):
+            widget.pack_forget()
+        if not summary.count:
+            self.dashboard_empty.pack(expand=True)
+            return
+        # Move the existing wedges and labels instead of drawing a new pie
+        angle = 90
+        for wedge, label, pct, value in zip(*self.dashboard_pie, (summary.healthy, summary.count - summary.healthy)):
+            sweep = 360 * value / summary.count
+            wedge.set_theta1(angle)
+            wedge.set_theta2(angle + sweep)
+            x, y = math.cos(math.radians(angle + sweep / 2)), math.sin(math.radians(angle + sweep / 2))
+            label.set_position((1.1 * x, 1.1 * y))
+            label.set_horizontalalignment('left' if x > 0 else 'right')
+            pct.set_position((0.6 * x, 0.6 * y))
+            pct.set_text(f"{100 * value / summary.count:.1f}%")
+            angle += sweep
+        self.dashboard_canvas.draw_idle()
+        chart.pack(pady=10)
+        self.dashboard_stats.config(text=f"📈 Total Entries: {summary.count} | 🎯 Healthy Days: {summary.healthy} | ⏱️ Avg Screen-Free: {summary.average:.1f} min")
+        self.dashboard_stats.pack()
 
 
     def open_calc_window(self):
@@ -264,34 +314,60 @@ class MentalWellnessLogger:
         tk.Label(frame, textvariable=result_var, font=("Segoe UI", 12), bg="#fff", fg="#64748b", justify="left").pack(pady=8)
         def calc():
             if not self.entries: result_var.set("📊 No data available"); return
-            times = [e["Screen-Free Time (minutes)"] for e in self.entries]
-            total, avg = sum(times), sum(times) / len(times)
-            healthy_count = sum(1 for e in self.entries if e["Status"] == "Healthy")
-            result_var.set(f"📈 Total: {total:.1f} min\n⚡ Average: {avg:.1f} min\n🎯 Healthy Days: {healthy_count}/{len(self.entries)}\n🔝 Best: {max(times):.1f} min\n📉 Lowest: {min(times):.1f} min")
+            s = self.entries.summary
+            result_var.set(f"📈 Total: {s.total:.1f} min\n⚡ Average: {s.average:.1f} min\n🎯 Healthy Days: {s.healthy}/{s.count}\n🔝 Best: {s.best:.1f} min\n📉 Lowest: {s.lowest:.1f} min")
         tk.Button(frame, text="🧮 Calculate", command=calc, font=("Segoe UI", 12, "bold"), bg=self.colors['warning'], fg="white", bd=0, padx=16, pady=8, cursor="hand2").pack(pady=12)
         calc()
 
 
     def update_summary(self):
+        # Totals come from the store's running summary; nothing here scans the entries
+        summary = self.entries.summary
         if hasattr(self, 'total_card'):
-            self.total_card.config(text=str(len(self.entries)))
+            self.total_card.config(text=str(summary.count))
         if hasattr(self, 'healthy_card'):
-            healthy = sum(1 for e in self.entries if e["Status"] == "Healthy")
-            self.healthy_card.config(text=str(healthy))
+            self.healthy_card.config(text=str(summary.healthy))
         if hasattr(self, 'avg_card'):
-            if self.entries:
-                avg = sum(e["Screen-Free Time (minutes)"] for e in self.entries) / len(self.entries)
-                self.avg_card.config(text=f"{avg:.1f} min")
-            else:
-                self.avg_card.config(text="0 min")
+            self.avg_card.config(text=f"{summary.average:.1f} min")
         if hasattr(self, 'recent_entries_frame'):
-            for widget in self.recent_entries_frame.winfo_children():
-                widget.destroy()
-            if not self.entries:
-                tk.Label(self.recent_entries_frame, text="No entries yet. Add your first wellness entry!", font=("Segoe UI", 12), bg=self.colors['light'], fg="#64748b").pack(pady=20)
-            else:
-                for entry in reversed(self.entries[-5:]):
-                    self.create_entry_card(self.recent_entries_frame, entry)
+            self.update_recent_cards()
+        self.refresh_dashboard()
+
+
+    def update_recent_cards(self):
+        # Card widgets are created once and refilled; surplus ones are only hidden
+        if not hasattr(self, 'recent_cards'):
+            self.recent_cards = []
+            self.shown_cards = 0
+            self.empty_label = tk.Label(self.recent_entries_frame, text="No entries yet. Add your first wellness entry!", font=("Segoe UI", 12), bg=self.colors['light'], fg="#64748b")
+        recent = self.entries.newest(5)
+        while len(self.recent_cards) < len(recent):
+            self.recent_cards.append(self.create_entry_card(self.recent_entries_frame))
+        for card, entry in zip(self.recent_cards, recent):
+            self.fill_entry_card(card, entry)
+        for card in self.recent_cards[len(recent):self.shown_cards]:
+            card[0].pack_forget()
+        for card in self.recent_cards[self.shown_cards:len(recent)]:
+            card[0].pack(fill="x", pady=(0, 10))
+        self.shown_cards = len(recent)
+        if recent:
+            self.empty_label.pack_forget()
+        else:
+            self.empty_label.pack(pady=20)
+
+
+    def autosave(self):
+        # The snapshot is written on a background thread; this only copies the entries
+        if self.journal: self.journal.checkpoint(self.entries)
+        self.root.after(AUTOSAVE_MS, self.autosave)
+
+
+    def on_close(self):
+        try:
+            if self.journal: self.journal.close(self.entries)
+        except OSError as e:
+            if not messagebox.askyesno("Error", f"Could not save entries: {e}\nClose anyway?"): return
+        self.root.destroy()
 
 
     def toggle_theme(self):
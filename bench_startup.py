@@ -0,0 +1,88 @@
+"""
+Startup benchmark for the MindBloom dashboard app (LAB4.py).
+
+Lists the slowest imports of the app module from `python -X importtime`, then
+times fresh interpreters up to the first drawn window and compares the median
+with a target. matplotlib is only imported when the dashboard is opened, so it
+should not show up in either measurement.
+
+    python bench_startup.py --target-ms 400 --runs 5
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+HEAVY_MODULES = ("pandas", "matplotlib", "numpy")
+
+FIRST_WINDOW = f"""
+import sys, time
+started = time.perf_counter()
+import tkinter as tk
+import LAB4
+root = tk.Tk()
+LAB4.MentalWellnessLogger(root)
+root.update()
+print((time.perf_counter() - started) * 1000)
+print(",".join(m for m in {HEAVY_MODULES!r} if m in sys.modules))
+root.destroy()
+"""
+
+
+def import_times(module, top):
+    """(cumulative us, self us, name) of the slowest imports of module"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=HERE, capture_output=True, text=True, check=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative), int(own), name.rstrip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def first_window():
+    """(ms to first window inside the app, ms including interpreter start, heavy modules loaded)"""
+    started = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", FIRST_WINDOW], cwd=HERE, capture_output=True, text=True)
+    wall_ms = (time.perf_counter() - started) * 1000
+    if result.returncode:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    app_ms, heavy = result.stdout.splitlines()[:2]
+    return float(app_ms), wall_ms, heavy
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure LAB4.py import and first-window time")
+    parser.add_argument('--target-ms', type=float, default=400,
+                        help="time to first window, including interpreter start")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args(argv)
+
+    print(f"{'cumulative':>12}  {'self':>9}  import")
+    for cumulative, own, name in import_times("LAB4", args.top):
+        print(f"{cumulative / 1000:9.1f} ms  {own / 1000:6.1f} ms  {name}")
+
+    try:
+        runs = [first_window() for _ in range(args.runs)]
+    except RuntimeError as e:
+        print(f"\nfirst window not measured (needs a display): {e}")
+        return
+    app_ms = statistics.median(run[0] for run in runs)
+    wall_ms = statistics.median(run[1] for run in runs)
+    heavy = {name for run in runs for name in run[2].split(",") if name}
+    verdict = "ok" if wall_ms <= args.target_ms else "over target"
+    print(f"\nfirst window: {app_ms:.0f} ms in app, {wall_ms:.0f} ms with interpreter start "
+          f"(target {args.target_ms:.0f} ms: {verdict})")
+    if heavy:
+        print(f"loaded at startup: {', '.join(sorted(heavy))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Save-time benchmark for MindBloom persistence.
+
+Times one "Save Entries" click (5 new rows) against a growing history, for the
+append-only WellnessLog and, when pandas and openpyxl are installed, for the
+old read_excel + concat + to_excel rewrite. Export time is reported per size.
+
+    python bench_wellness_log.py --sizes 1000 10000 100000
+"""
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from wellness_log import WellnessLog
+
+ACTIVITIES = ["Meditation", "Journaling", "Art Therapy", "Sports", "Music", "Gardening"]
+
+
+def make_entries(rng, n):
+    return [{
+        "Student Name": f"Student {rng.randrange(500)}",
+        "Wellness Activity": rng.choice(ACTIVITIES),
+        "Me-Time Activity": rng.choice(ACTIVITIES),
+        "Screen-Free Time (minutes)": float(rng.randrange(10, 240)),
+        "Status": rng.choice(["Healthy", "Needs More Me-Time"]),
+        "Notes": "",
+        "Date": datetime.now().strftime("%Y-%m-%d %H:%M")
+    } for _ in range(n)]
+
+
+def time_saves(save, rng, repeats):
+    samples = []
+    for _ in range(repeats):
+        entries = make_entries(rng, 5)
+        started = time.perf_counter()
+        save(entries)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def rewrite_save(filename):
+    import pandas as pd
+
+    def save(entries):
+        df_new = pd.DataFrame(entries)
+        if filename.exists():
+            df_final = pd.concat([pd.read_excel(filename), df_new], ignore_index=True)
+        else:
+            df_final = df_new
+        df_final.to_excel(filename, index=False)
+    return save
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark wellness entry saves")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--repeats', type=int, default=20)
+    parser.add_argument('--max-rewrite', type=int, default=20000,
+                        help="skip the old rewrite above this history size (it is O(history))")
+    args = parser.parse_args(argv)
+
+    try:
+        import pandas  # noqa: F401
+        import openpyxl  # noqa: F401
+        has_excel = True
+    except ImportError:
+        has_excel = False
+        print("pandas/openpyxl not installed: timing the append log only")
+
+    rng = random.Random(3)
+    print(f"{'history':>10}  {'log save':>10}  {'rewrite save':>13}  {'export':>9}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory(prefix="wellness_bench_") as workdir:
+            log = WellnessLog(Path(workdir) / "Mental_Wellness_Logger.xlsx")
+            for start in range(0, size, 10000):
+                log.append(make_entries(rng, min(10000, size - start)))
+            log_ms = time_saves(log.append, rng, args.repeats)
+
+            rewrite_ms = export_ms = None
+            if has_excel:
+                started = time.perf_counter()
+                log.export()
+                export_ms = (time.perf_counter() - started) * 1000
+                if size <= args.max_rewrite:
+                    rewrite_ms = time_saves(rewrite_save(log.workbook), rng, min(args.repeats, 5))
+
+        rewrite = f"{rewrite_ms:10.1f} ms" if rewrite_ms is not None else f"{'-':>13}"
+        export = f"{export_ms:6.0f} ms" if export_ms is not None else f"{'-':>9}"
+        print(f"{size:>10,}  {log_ms:7.2f} ms  {rewrite}  {export}")
+
+
+if __name__ == "__main__":
+    main()
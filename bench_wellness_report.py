@@ -0,0 +1,69 @@
+"""
+Benchmark for the class wellness report.
+
+Writes N synthetic section workbooks (lab3.2 layout) to a temporary folder and
+runs wellness_report twice: a cold run that parses every workbook (and writes
+the sidecars), and a warm run served from the sidecars. Needs pandas and
+openpyxl.
+
+    python bench_wellness_report.py --sections 200 --rows 500
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from wellness_report import build_report, load_sections, write_report
+
+ACTIVITIES = ["Meditation", "Journaling", "Art Therapy", "Sports", "Music", "Gardening"]
+
+
+def make_section(path, rows, rng):
+    import pandas as pd
+    start = datetime(2025, 6, 2)
+    students = [f"Student {i}" for i in range(30)]
+    minutes = [float(rng.randrange(10, 240)) for _ in range(rows)]
+    pd.DataFrame({
+        "Timestamp": [(start + timedelta(days=rng.randrange(90), minutes=rng.randrange(1440))).strftime("%Y-%m-%d %H:%M")
+                      for _ in range(rows)],
+        "Name": [rng.choice(students) for _ in range(rows)],
+        "Wellness Activity": [rng.choice(ACTIVITIES) for _ in range(rows)],
+        "Me-Time Activity": [rng.choice(ACTIVITIES) for _ in range(rows)],
+        "Off-screen Time (min)": minutes,
+        "Frequency": [1] * rows,
+        "Status": ["Healthy" if m >= 60 else "Needs More Me-Time" for m in minutes],
+    }).to_excel(path, index=False)
+
+
+def run_report(folder, out):
+    started = time.perf_counter()
+    df = load_sections(sorted(Path(folder).glob("*.xlsx")))
+    loaded = time.perf_counter()
+    write_report(*build_report(df), out)
+    return loaded - started, time.perf_counter() - loaded, len(df)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the class report over synthetic section workbooks")
+    parser.add_argument('--sections', type=int, default=200)
+    parser.add_argument('--rows', type=int, default=500, help="entries per section workbook")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(11)
+    with tempfile.TemporaryDirectory(prefix="wellness_report_") as workdir:
+        folder = Path(workdir) / "sections"
+        folder.mkdir()
+        print(f"writing {args.sections} workbooks of {args.rows} rows...")
+        for i in range(args.sections):
+            make_section(folder / f"section_{i:03d}.xlsx", args.rows, rng)
+        for label in ("cold (parse + sidecars)", "warm (sidecars)"):
+            load_s, report_s, rows = run_report(folder, Path(workdir) / "report")
+            print(f"{label:<24} {rows:,} entries: load {load_s:6.2f} s  report {report_s:5.2f} s  "
+                  f"total {load_s + report_s:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Load-time benchmark for the workbook sidecar cache.
+
+For class_wellness_data.xlsx and a synthetic workbook (500k rows by default)
+it times pd.read_excel, the first read_workbook (parse + sidecar write) and a
+warm read_workbook served from the sidecar. Needs pandas and openpyxl;
+pyarrow makes the sidecar Parquet instead of pickle.
+
+    python bench_workbook_cache.py --rows 500000
+"""
+
+import argparse
+import random
+import shutil
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from wellness_cache import find_sidecar, read_workbook
+
+ACTIVITIES = ["Meditation", "Journaling", "Art Therapy", "Sports", "Music", "Gardening"]
+
+
+def make_workbook(path, rows, seed=5):
+    import pandas as pd
+    rng = random.Random(seed)
+    pd.DataFrame({
+        "Timestamp": [f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} 09:00" for _ in range(rows)],
+        "Name": [f"Student {rng.randrange(2000)}" for _ in range(rows)],
+        "Wellness Activity": [rng.choice(ACTIVITIES) for _ in range(rows)],
+        "Me-Time Activity": [rng.choice(ACTIVITIES) for _ in range(rows)],
+        "Screen-Free Time (minutes)": [float(rng.randrange(10, 240)) for _ in range(rows)],
+        "Frequency": [rng.randint(1, 30) for _ in range(rows)],
+        "Status": [rng.choice(["Healthy", "Needs More Me-Time"]) for _ in range(rows)],
+    }).to_excel(path, index=False)
+
+
+def timed(func, repeats=1):
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def bench(workbook, repeats):
+    import pandas as pd
+    excel_ms = timed(lambda: pd.read_excel(workbook))
+    first_ms = timed(lambda: read_workbook(workbook))
+    warm_ms = timed(lambda: read_workbook(workbook), repeats)
+    sidecar = find_sidecar(workbook)
+    rows = len(read_workbook(workbook))
+    print(f"{workbook.name:<32} {rows:>9,} rows  read_excel {excel_ms:9.1f} ms  "
+          f"first {first_ms:9.1f} ms  sidecar {warm_ms:7.1f} ms ({sidecar.suffix[1:]}, "
+          f"{excel_ms / warm_ms:.0f}x)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time Excel reads with and without the sidecar cache")
+    parser.add_argument('--rows', type=int, default=500000)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--workbook', default="class_wellness_data.xlsx")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="workbook_cache_") as workdir:
+        # Copies, so the benchmark never leaves sidecars next to the real workbook
+        existing = Path(workdir) / Path(args.workbook).name
+        shutil.copy2(args.workbook, existing)
+        bench(existing, args.repeats)
+        synthetic = Path(workdir) / f"synthetic_{args.rows}.xlsx"
+        print(f"writing {args.rows:,}-row workbook...")
+        make_workbook(synthetic, args.rows)
+        bench(synthetic, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 from datetime import date
-from sqlalchemy import create_engine, MetaData, Table, Column, Integer, String, Float, ForeignKey, Date, Boolean, Text, select, text as sql_text
+from finance_seed import seed_sample
+from sqlalchemy import create_engine, MetaData, Table, Column, Integer, String, Float, ForeignKey, Date, Boolean, Text, select
 import pandas as pd
 
 engine = create_engine("sqlite:///finance.db", echo=False, future=True)
@@ -40,58 +41,8 @@ transactions = Table(
 
 metadata.create_all(engine)
 
-with engine.begin() as conn:
-    conn.execute(sql_text("DELETE FROM transactions"))
-    conn.execute(sql_text("DELETE FROM investments"))
-    conn.execute(sql_text("DELETE FROM advisors"))
-
-    conn.execute(advisors.insert(), [
-        {"name": "Amit Shah", "email": "amit@finadvisors.in", "phone": "+91-98450-11111", "active": True},
-        {"name": "Neha Gupta", "email": "neha@wealthcare.in", "phone": "+91-90080-22222", "active": True},
-        {"name": "Rahul Verma", "email": "rahul@investsmart.in", "phone": "+91-99000-33333", "active": True},
-    ])
-
-    conn.execute(investments.insert(), [
-        {
-            "title": "HDFC Equity Fund",
-            "instrument_type": "Mutual Fund",
-            "risk_level": "High",
-            "units": 120.5,
-            "price_per_unit": 450.75,
-            "total_value_lakhs": 54.3,
-            "description": "Long-term equity fund investment.",
-            "investment_date": date.today(),
-            "advisor_id": 1,
-        },
-        {
-            "title": "Government Bonds 2030",
-            "instrument_type": "Bond",
-            "risk_level": "Low",
-            "units": 200,
-            "price_per_unit": 1000,
-            "total_value_lakhs": 200.0,
-            "description": "Safe government bond with fixed returns.",
-            "investment_date": date.today(),
-            "advisor_id": 2,
-        },
-        {
-            "title": "Reliance Shares",
-            "instrument_type": "Equity",
-            "risk_level": "Medium",
-            "units": 50,
-            "price_per_unit": 2450,
-            "total_value_lakhs": 122.5,
-            "description": "Blue-chip stock for steady growth.",
-            "investment_date": date.today(),
-            "advisor_id": 3,
-        },
-    ])
-
-    conn.execute(transactions.insert(), [
-        {"investment_id": 1, "transaction_type": "Buy", "status": "Completed", "transaction_date": date.today(), "handled_by": 1},
-        {"investment_id": 2, "transaction_type": "Buy", "status": "Pending", "transaction_date": date.today(), "handled_by": 2},
-        {"investment_id": 3, "transaction_type": "Sell", "status": "Completed", "transaction_date": date.today(), "handled_by": 3},
-    ])
+# Upsert the sample rows; rerunning leaves exactly one copy of each
+seed_sample(engine.url.database)
 
 stmt = select(
     investments.c.title,
@@ -0,0 +1,267 @@
+"""
+Idempotent seeding for the finance database (advisors, investments, transactions).
+
+Every row has a fixed primary key and is upserted, so running the seed again
+updates the same rows instead of wiping and re-inserting the tables. The three
+sample rows of each table keep ids 1-3; synthetic rows follow them. Each
+table is generated from its own RNG, seeded from (seed, table name), and every
+row takes the same number of draws, so:
+
+- the same arguments always produce the same database contents: rows with
+  ids above the requested counts (left by an earlier, larger seed) are
+  deleted, children before parents, in the same transaction as the last
+  upsert;
+- asking for more rows of a table only adds rows to the end of that table;
+- changing the advisor or investment count leaves the other tables' rows as
+  they were except for their foreign keys, which are spread over the new count.
+
+seed_sample(), used by the finance scripts, only upserts the sample rows and
+never deletes synthetic ones.
+
+Rows are written with executemany in chunks, many chunks per transaction, on
+a connection tuned for bulk loading (synchronous=OFF, large page cache,
+in-memory temp store). An interrupted seed can simply be run again.
+
+    python finance_seed.py --advisors 1000 --investments 1000000 --transactions 3000000
+"""
+
+import argparse
+import itertools
+import random
+import sqlite3
+import time
+from datetime import date, timedelta
+
+CHUNK_ROWS = 50000
+CHUNKS_PER_TRANSACTION = 10
+
+# Same tables as the SQLAlchemy metadata in db_connect.py / finance_app.py
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS advisors (
+    advisor_id INTEGER NOT NULL,
+    name VARCHAR(100) NOT NULL,
+    email VARCHAR(120) NOT NULL,
+    phone VARCHAR(30) NOT NULL,
+    active BOOLEAN NOT NULL,
+    PRIMARY KEY (advisor_id),
+    UNIQUE (email)
+);
+CREATE TABLE IF NOT EXISTS investments (
+    investment_id INTEGER NOT NULL,
+    title VARCHAR(200) NOT NULL,
+    instrument_type VARCHAR(80) NOT NULL,
+    risk_level VARCHAR(50) NOT NULL,
+    units FLOAT,
+    price_per_unit FLOAT NOT NULL,
+    total_value_lakhs FLOAT NOT NULL,
+    description TEXT,
+    investment_date DATE NOT NULL,
+    advisor_id INTEGER NOT NULL,
+    PRIMARY KEY (investment_id),
+    FOREIGN KEY(advisor_id) REFERENCES advisors (advisor_id)
+);
+CREATE TABLE IF NOT EXISTS transactions (
+    transaction_id INTEGER NOT NULL,
+    investment_id INTEGER NOT NULL,
+    transaction_type VARCHAR(20) NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    transaction_date DATE,
+    handled_by INTEGER NOT NULL,
+    PRIMARY KEY (transaction_id),
+    FOREIGN KEY(investment_id) REFERENCES investments (investment_id),
+    FOREIGN KEY(handled_by) REFERENCES advisors (advisor_id)
+);
+"""
+
+COLUMNS = {
+    "advisors": ("advisor_id", "name", "email", "phone", "active"),
+    "investments": ("investment_id", "title", "instrument_type", "risk_level", "units", "price_per_unit",
+                    "total_value_lakhs", "description", "investment_date", "advisor_id"),
+    "transactions": ("transaction_id", "investment_id", "transaction_type", "status", "transaction_date",
+                     "handled_by"),
+}
+
+
+def sample_rows():
+    """The hand-written sample data, as {table: [row tuples]}"""
+    today = date.today().isoformat()
+    return {
+        "advisors": [
+            (1, "Amit Shah", "amit@finadvisors.in", "+91-98450-11111", True),
+            (2, "Neha Gupta", "neha@wealthcare.in", "+91-90080-22222", True),
+            (3, "Rahul Verma", "rahul@investsmart.in", "+91-99000-33333", True),
+        ],
+        "investments": [
+            (1, "HDFC Equity Fund", "Mutual Fund", "High", 120.5, 450.75, 54.3,
+             "Long-term equity fund investment.", today, 1),
+            (2, "Government Bonds 2030", "Bond", "Low", 200, 1000, 200.0,
+             "Safe government bond with fixed returns.", today, 2),
+            (3, "Reliance Shares", "Equity", "Medium", 50, 2450, 122.5,
+             "Blue-chip stock for steady growth.", today, 3),
+        ],
+        "transactions": [
+            (1, 1, "Buy", "Completed", today, 1),
+            (2, 2, "Buy", "Pending", today, 2),
+            (3, 3, "Sell", "Completed", today, 3),
+        ],
+    }
+
+
+FIRST_NAMES = ["Amit", "Neha", "Rahul", "Priya", "Vikram", "Ananya", "Karan", "Sneha", "Arjun", "Meera"]
+LAST_NAMES = ["Shah", "Gupta", "Verma", "Iyer", "Reddy", "Nair", "Mehta", "Kapoor", "Das", "Joshi"]
+INSTRUMENTS = [
+    ("Mutual Fund", "High", "Equity Fund", 400),
+    ("Mutual Fund", "Medium", "Balanced Fund", 150),
+    ("Bond", "Low", "Government Bonds", 1000),
+    ("Bond", "Medium", "Corporate Bonds", 1000),
+    ("Equity", "High", "Small Cap Shares", 300),
+    ("Equity", "Medium", "Blue-chip Shares", 2500),
+    ("Fixed Deposit", "Low", "Bank FD", 10000),
+]
+HOUSES = ["HDFC", "ICICI", "SBI", "Axis", "Kotak", "Tata", "Reliance", "Infosys"]
+
+
+def pick_id(rng, count):
+    """Uniform id in 1..count from exactly one draw, so later rows do not shift when count changes"""
+    return 1 + int(rng.random() * count)
+
+
+def synthetic_advisors(rng, first_id, count):
+    for advisor_id in range(first_id, first_id + count):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        yield (advisor_id, name, f"advisor{advisor_id}@finadvisors.in",
+               f"+91-9{rng.randrange(10000):04d}-{rng.randrange(100000):05d}", rng.random() < 0.9)
+
+
+def synthetic_investments(rng, first_id, count, advisor_count, days):
+    for investment_id in range(first_id, first_id + count):
+        instrument_type, risk_level, kind, base_price = rng.choice(INSTRUMENTS)
+        units = round(rng.uniform(1, 500), 2)
+        price = round(base_price * rng.uniform(0.5, 1.5), 2)
+        yield (investment_id, f"{rng.choice(HOUSES)} {kind}", instrument_type, risk_level, units, price,
+               round(units * price / 100000, 2), None, rng.choice(days), pick_id(rng, advisor_count))
+
+
+def synthetic_transactions(rng, first_id, count, investment_count, advisor_count, days):
+    for transaction_id in range(first_id, first_id + count):
+        yield (transaction_id, pick_id(rng, investment_count), "Buy" if rng.random() < 0.7 else "Sell",
+               "Completed" if rng.random() < 0.8 else "Pending", rng.choice(days), pick_id(rng, advisor_count))
+
+
+def connect(path):
+    """A connection tuned for bulk loading, with the finance tables created"""
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -262144")  # 256 MB
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def upsert(conn, table, rows, chunk_rows=CHUNK_ROWS, commit=True):
+    """Upsert row tuples by primary key in chunked executemany calls; returns (rows, seconds).
+
+    With commit=False the last transaction is left open for the caller to finish.
+    """
+    columns = COLUMNS[table]
+    updates = ", ".join(f"{column} = excluded.{column}" for column in columns[1:])
+    sql = (f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+           f"ON CONFLICT({columns[0]}) DO UPDATE SET {updates}")
+    rows = iter(rows)
+    written = chunks = 0
+    started = time.perf_counter()
+    conn.execute("BEGIN")
+    try:
+        while True:
+            chunk = [row for _, row in zip(range(chunk_rows), rows)]
+            if not chunk:
+                break
+            conn.executemany(sql, chunk)
+            written += len(chunk)
+            chunks += 1
+            if chunks % CHUNKS_PER_TRANSACTION == 0:
+                conn.execute("COMMIT")
+                conn.execute("BEGIN")
+        if commit:
+            conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    return written, time.perf_counter() - started
+
+
+def seed_sample(path):
+    """Upsert just the sample rows (what the finance scripts used to delete and re-insert)"""
+    conn = connect(path)
+    try:
+        for table, rows in sample_rows().items():
+            upsert(conn, table, rows)
+    finally:
+        conn.close()
+
+
+def seed(path, advisors=0, investments=0, transactions=0, random_seed=7, chunk_rows=CHUNK_ROWS, report=print):
+    """Make the tables hold exactly the sample rows plus the given numbers of synthetic rows.
+
+    Returns {table: (rows upserted, rows deleted)}.
+    """
+    rngs = {table: random.Random(f"{random_seed}:{table}") for table in COLUMNS}
+    sample = sample_rows()
+    first = {table: len(rows) + 1 for table, rows in sample.items()}
+    advisor_count = len(sample["advisors"]) + advisors
+    investment_count = len(sample["investments"]) + investments
+    start_day = date(2022, 1, 1)
+    days = [(start_day + timedelta(days=n)).isoformat() for n in range(3 * 365)]
+    tables = {
+        "advisors": synthetic_advisors(rngs["advisors"], first["advisors"], advisors),
+        "investments": synthetic_investments(rngs["investments"], first["investments"], investments,
+                                             advisor_count, days),
+        "transactions": synthetic_transactions(rngs["transactions"], first["transactions"], transactions,
+                                               investment_count, advisor_count, days),
+    }
+    counts = {}
+    conn = connect(path)
+    try:
+        for table, synthetic in tables.items():
+            last = table == "transactions"
+            rows, elapsed = upsert(conn, table, itertools.chain(sample[table], synthetic), chunk_rows,
+                                   commit=not last)
+            counts[table] = rows
+            if report:
+                report(f"{table:<13} {rows:>10,} rows in {elapsed:6.2f} s ({rows / max(elapsed, 1e-9):,.0f} rows/s)")
+        # Ids are 1..rows, so anything above is left over from a larger seed
+        deleted = {}
+        try:
+            for table in ("transactions", "investments", "advisors"):
+                deleted[table] = conn.execute(f"DELETE FROM {table} WHERE {COLUMNS[table][0]} > ?",
+                                              (counts[table],)).rowcount
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        if report and any(deleted.values()):
+            report("deleted " + ", ".join(f"{n:,} {table}" for table, n in deleted.items() if n))
+    finally:
+        conn.close()
+    return {table: (counts[table], deleted[table]) for table in COLUMNS}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Upsert sample and synthetic rows into the finance database")
+    parser.add_argument('--db', default="finance.db")
+    parser.add_argument('--advisors', type=int, default=200)
+    parser.add_argument('--investments', type=int, default=20000)
+    parser.add_argument('--transactions', type=int, default=60000)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--chunk', type=int, default=CHUNK_ROWS)
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    counts = seed(args.db, args.advisors, args.investments, args.transactions, args.seed, args.chunk)
+    elapsed = time.perf_counter() - started
+    total = sum(rows for rows, _ in counts.values())
+    print(f"{total:,} rows upserted into {args.db} in {elapsed:.2f} s ({total / max(elapsed, 1e-9):,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
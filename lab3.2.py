@@ -1,9 +1,25 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
-from datetime import datetime
-import pandas as pd
+from wellness_log import WellnessLog
+from wellness_engine import HEALTHY, EntryError, WellnessEngine, WellnessRules
+from wellness_table import VirtualTable
+from wellness_status import LiveStatus
+from wellness_reminders import ReminderScheduler
 import re
-import os
+
+REMINDER_INTERVAL = 8 * 60 * 60
+REMINDER_TOAST_MS = 5 * 60 * 1000
+
+# Entry field -> column label, in workbook and table order
+ENTRY_COLUMNS = {
+    "date": "Timestamp",
+    "name": "Name",
+    "wellness": "Wellness Activity",
+    "metime": "Me-Time Activity",
+    "screen_free": "Off-screen Time (min)",
+    "frequency": "Frequency",
+    "status": "Status"
+}
 
 class MentalWellnessLogger:
     def __init__(self, root):
@@ -11,7 +27,11 @@ class MentalWellnessLogger:
         self.root.title("MindBloom – Nurture your thoughts daily")
         self.root.geometry("900x670")
         self.root.configure(bg="#f5f7fa")
-        self.entries = []
+        # Validation, status rule and storage live in the UI-independent engine
+        self.engine = WellnessEngine(WellnessRules(min_minutes=60))
+        self.entries = self.engine.entries
+        # Saves append to a CSV log; the workbook is rebuilt on export
+        self.log = WellnessLog("class_wellness_data.xlsx")
 
         self.frequency_counter = {}
 
@@ -78,40 +98,54 @@ class MentalWellnessLogger:
         self.status_label = tk.Label(input_frame, text="Enter details to see status", font=("Segoe UI", 11), bg="#f5f7fa", fg="#7b8794")
         self.status_label.grid(row=5, column=1, sticky="w", pady=(14,0))
 
-        self.name_entry.bind("<KeyRelease>", self.update_status)
-        self.wellness_combo.bind("<<ComboboxSelected>>", self.update_status)
-        self.metime_combo.bind("<<ComboboxSelected>>", self.update_status)
-        self.screentime_entry.bind("<KeyRelease>", self.update_status)
-        self.notes_text.bind("<KeyRelease>", self.update_status)
+        # Notes do not affect the status, so typing in them triggers nothing
+        self.live_status = LiveStatus(root, self.status_label, self.status_inputs, self.describe_status)
+        self.name_entry.bind("<KeyRelease>", self.live_status.changed)
+        self.wellness_combo.bind("<<ComboboxSelected>>", self.live_status.changed)
+        self.metime_combo.bind("<<ComboboxSelected>>", self.live_status.changed)
+        self.screentime_entry.bind("<KeyRelease>", self.live_status.changed)
 
         btnf = tk.Frame(root, bg="#f5f7fa")
         btnf.pack(pady=8)
         self.create_btn(btnf, "Add Entry", self.add_entry, "#364f6b").pack(side="left", padx=10)
         self.create_btn(btnf, "Delete Selected", self.delete_entry, "#b23b3b").pack(side="left", padx=10)
         self.create_btn(btnf, "Clear All", self.clear_all, "#6d7c93").pack(side="left", padx=10)
-        self.create_btn(btnf, "Save to Excel", self.save_to_excel, "#20639b").pack(side="left", padx=10)
+        self.create_btn(btnf, "Save Entries", self.save_to_excel, "#20639b").pack(side="left", padx=10)
+        self.create_btn(btnf, "Export to Excel", self.export_to_excel, "#20639b").pack(side="left", padx=10)
 
         table_frame = tk.Frame(root, bg="#f5f7fa")
         table_frame.pack(padx=30, pady=(12, 0), fill="both", expand=True)
         columns = ("Timestamp", "Name", "Wellness", "Me-Time", "Off-screen Time (min)", "Frequency", "Status")
-        self.tree = ttk.Treeview(table_frame, columns=columns, show="headings", height=10)
+        # Only the rows on screen exist as Treeview items; the rest stay in self.entries
+        self.table = VirtualTable(table_frame, columns, self.row_values, stripes=('oddrow', 'evenrow'), height=10)
+        self.tree = self.table.tree
         for col, w in zip(columns, (130, 110, 120, 110, 140, 95, 100)):
             self.tree.heading(col, text=col, anchor="center")
             self.tree.column(col, width=w, anchor="center")
         self.tree.tag_configure('oddrow', background='#e8ecf3')
         self.tree.tag_configure('evenrow', background='#f5f7fa')
-        vsb = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=vsb.set)
         self.tree.grid(row=0, column=0, sticky="nsew")
-        vsb.grid(row=0, column=1, sticky="ns")
+        self.table.scrollbar.grid(row=0, column=1, sticky="ns")
         table_frame.grid_rowconfigure(0, weight=1)
         table_frame.grid_columnconfigure(0, weight=1)
 
-        self.root.after(28800000, self.show_reminder)
+        # Reminder deadlines are kept on disk, so they survive a restart
+        self.reminders = ReminderScheduler(root, "class_wellness_reminders.json", self.show_reminder)
+        if not self.reminders.rules:
+            self.reminders.add_rule("It's time to check in and nurture your thoughts!", REMINDER_INTERVAL)
+
+    def show_reminder(self, rules):
+        # A plain window instead of a messagebox, so the event loop keeps running
+        toast = tk.Toplevel(self.root, bg="#f5f7fa")
+        toast.title("Reminder")
+        toast.attributes("-topmost", True)
+        text = "\n".join(f"{rule.student}: {rule.message}" if rule.student else rule.message for rule in rules)
+        tk.Label(toast, text=text, font=("Segoe UI", 11), bg="#f5f7fa", fg="#364f6b", padx=20, pady=15, justify="left").pack()
+        self.create_btn(toast, "OK", toast.destroy, "#364f6b").pack(pady=(0, 12))
+        self.root.after(REMINDER_TOAST_MS, lambda: toast.winfo_exists() and toast.destroy())
 
-    def show_reminder(self):
-        messagebox.showinfo("Reminder", "It's time to check in and nurture your thoughts!")
-        self.root.after(28800000, self.show_reminder)
+    def row_values(self, entry_id):
+        return tuple(self.entries.get(entry_id).as_dict(ENTRY_COLUMNS).values())
 
     def create_btn(self, parent, text, cmd, color):
         return tk.Button(parent, text=text, command=cmd, font=("Segoe UI", 11, "bold"),
@@ -140,88 +174,60 @@ class MentalWellnessLogger:
         elif new_activity is not None:
             messagebox.showerror("Input Error", "Activity must only contain alphabets and spaces.")
 
-    def update_status(self, event=None):
-        name = self.name_entry.get().strip()
-        wellness = self.wellness_combo.get().strip()
-        metime = self.metime_combo.get().strip()
-        screentime = self.screentime_entry.get().strip()
+    def status_inputs(self):
+        return (
+            self.name_entry.get().strip(),
+            self.wellness_combo.get().strip(),
+            self.metime_combo.get().strip(),
+            self.screentime_entry.get().strip()
+        )
+
+    def describe_status(self, name, wellness, metime, screentime):
+        """Label options for the live status preview"""
+        if not (name and wellness and metime and screentime):
+            return dict(text="Enter details to see status", fg="#7b8794", font=("Segoe UI", 11))
         try:
-            if not (name and wellness and metime and screentime):
-                self.status_label.config(text="Enter details to see status", fg="#7b8794")
-                return
             val = float(screentime)
-            if val < 0:
-                self.status_label.config(text="Invalid screen-free time", fg="#b23b3b")
-                return
         except ValueError:
-            self.status_label.config(text="Invalid screen-free time", fg="#b23b3b")
-            return
-        healthy = val >= 60 and bool(metime)
-        self.status_label.config(
+            val = -1
+        if val < 0:
+            return dict(text="Invalid screen-free time", fg="#b23b3b", font=("Segoe UI", 11))
+        healthy = self.engine.rules.status(val, metime) == HEALTHY
+        return dict(
             text="Healthy" if healthy else "Needs More Me-Time",
             fg="#09816a" if healthy else "#d35400", font=("Segoe UI", 11, "bold")
         )
 
     def add_entry(self):
-        res = self.validate()
-        if not res:
+        name = self.name_entry.get().strip()
+        frequency = self.frequency_counter.get(name, 0) + 1
+        try:
+            entry = self.engine.add_entry(**self.read_inputs(), frequency=frequency)
+        except EntryError as e:
+            messagebox.showerror("Input Error", str(e))
             return
-        values, screentime, notes = res
-        name = values["student_name"]
-        self.frequency_counter[name] = self.frequency_counter.get(name, 0) + 1
-        status = "Healthy" if screentime >= 60 and values["me-time_activity"] else "Needs More Me-Time"
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-
-        entry = {
-            "Timestamp": timestamp,
-            "Name": name,
-            "Wellness Activity": values["mental_wellness_activity"],
-            "Me-Time Activity": values["me-time_activity"],
-            "Off-screen Time (min)": screentime,
-            "Frequency": self.frequency_counter[name],
-            "Status": status
-        }
-        self.entries.append(entry)
-        tag = 'evenrow' if len(self.entries) % 2 == 0 else 'oddrow'
-        self.tree.insert("", "end", values=tuple(entry.values()), tags=(tag,))
+        self.frequency_counter[name] = frequency
+        # The entry ID doubles as the row ID, so deletes never depend on row position
+        self.table.append(entry.entry_id)
         self.clear_inputs()
         messagebox.showinfo("Success", "Record added successfully!")
 
-    def validate(self):
-        name = self.name_entry.get().strip()
-        wellness = self.wellness_combo.get().strip()
-        metime = self.metime_combo.get().strip()
-        screentime = self.screentime_entry.get().strip()
-        notes = self.notes_text.get("1.0", "end").strip()
-        if not name or not wellness or not metime or not screentime:
-            messagebox.showerror("Input Error", "All fields except notes are required!")
-            return None
-        if not re.fullmatch(r"[A-Za-z ]+", name):
-            messagebox.showerror("Input Error", "Name must contain only alphabets and spaces!")
-            return None
-        try:
-            screentime_val = float(screentime)
-            if screentime_val <= 0:
-                raise ValueError
-        except ValueError:
-            messagebox.showerror("Input Error", "Screen-free time must be a positive number!")
-            return None
-        return {
-            "student_name": name,
-            "mental_wellness_activity": wellness,
-            "me-time_activity": metime,
-            "screen-free_time_(minutes)": screentime_val,
-            "notes": notes
-        }, screentime_val, notes
+    def read_inputs(self):
+        return dict(
+            name=self.name_entry.get(),
+            wellness=self.wellness_combo.get(),
+            metime=self.metime_combo.get(),
+            screen_free=self.screentime_entry.get(),
+            notes=self.notes_text.get("1.0", "end")
+        )
 
     def delete_entry(self):
-        sel = self.tree.selection()
+        sel = self.table.selection()
         if not sel:
             messagebox.showwarning("Selection Error", "Please select an entry to delete!")
             return
-        idx = self.tree.index(sel[0])
-        self.tree.delete(sel[0])
-        del self.entries[idx]
+        self.engine.delete_entry(sel[0])
+        self.table.remove(int(sel[0]))
         messagebox.showinfo("Success", "Record deleted successfully!")
 
     def clear_all(self):
@@ -229,9 +235,8 @@ class MentalWellnessLogger:
             messagebox.showinfo("Info", "No entries to clear!")
             return
         if messagebox.askyesno("Confirm", "Are you sure you want to clear all entries?"):
-            self.entries.clear()
-            for i in self.tree.get_children():
-                self.tree.delete(i)
+            self.engine.clear()
+            self.table.clear()
             self.clear_inputs()
             messagebox.showinfo("Success", "All entries cleared successfully!")
 
@@ -241,25 +246,30 @@ class MentalWellnessLogger:
         self.metime_combo.set("")
         self.screentime_entry.delete(0, tk.END)
         self.notes_text.delete("1.0", tk.END)
-        self.status_label.config(text="Enter details to see status", fg="#7b8794", font=("Segoe UI", 11))
+        self.live_status.show(text="Enter details to see status", fg="#7b8794", font=("Segoe UI", 11))
 
     def save_to_excel(self):
         if not self.entries:
             messagebox.showinfo("Info", "No entries to save!")
             return
         try:
-            filename = "class_wellness_data.xlsx"
-            df_new = pd.DataFrame(self.entries)
-            if os.path.exists(filename):
-                df_existing = pd.read_excel(filename)
-                df_final = pd.concat([df_existing, df_new], ignore_index=True)
-            else:
-                df_final = df_new
-            df_final.to_excel(filename, index=False)
-            messagebox.showinfo("Success", f"Data saved to {filename} successfully!")
+            saved = self.log.append(self.entries.as_dicts(ENTRY_COLUMNS))
+            messagebox.showinfo("Success", f"{saved} entries saved. Use Export to Excel to update {self.log.workbook.name}.")
             self.entries.clear()
-            for i in self.tree.get_children():
-                self.tree.delete(i)
+            self.table.clear()
+        except ImportError:
+            messagebox.showerror("Error", "pandas is required to read the existing workbook. Install with: pip install pandas openpyxl")
+        except Exception as e:
+            messagebox.showerror("Error", f"An error occurred while saving entries: {str(e)}")
+
+    def export_to_excel(self):
+        filename = self.log.workbook.name
+        try:
+            rows = self.log.export()
+            if not rows:
+                messagebox.showinfo("Info", "No saved entries to export!")
+                return
+            messagebox.showinfo("Success", f"{rows} entries exported to {filename} successfully!")
         except PermissionError:
             messagebox.showerror("Error", f"Cannot write to '{filename}'.\nPlease close the file in Excel and try again.")
         except ImportError:
@@ -0,0 +1,77 @@
+"""
+Cold-load benchmark: review file format vs. load time and resident memory.
+
+Writes N synthetic reviews as the original indent=2 teacher_reviews.json, then
+converts them to the columnar (.rvc) and SQLite formats. Each format is then
+loaded in a fresh process the way the app starts up: load(), the statistics
+rebuild and the recent-reviews panel. Memory is the peak RSS growth from that
+load.
+
+    python bench_load.py --sizes 10000 100000 1000000
+"""
+
+import argparse
+import os
+import resource
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+FORMATS = ('json', 'columnar', 'sqlite')
+
+
+def prepare(workdir, size):
+    """Seed the JSON file and convert it to the other formats (runs in a child process)"""
+    os.chdir(workdir)
+    from bench_reviews import seed_store
+    from review_store import convert_json_to_columns, migrate_json_to_sqlite
+
+    seed_store('json', size)
+    convert_json_to_columns("teacher_reviews.json")
+    migrate_json_to_sqlite("teacher_reviews.json", "teacher_reviews.db")
+    return {name: os.path.getsize(name) for name in
+            ("teacher_reviews.json", "teacher_reviews.rvc", "teacher_reviews.db")}
+
+
+def load_once(workdir, storage_mode):
+    """Time one cold start of a format (runs in a fresh child process)"""
+    os.chdir(workdir)
+    from review_store import open_store
+    from review_stats import ReviewStatistics
+
+    before_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started = time.perf_counter()
+    store = open_store(storage_mode)
+    store.load()
+    ReviewStatistics().rebuild(store.rating_groups())
+    store.recent(20)
+    elapsed = time.perf_counter() - started
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    count = store.count()
+    store.close()
+    return {'load_ms': elapsed * 1000, 'rss_mb': (peak_kb - before_kb) / 1024, 'count': count}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare cold-load time and memory per review file format")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000])
+    args = parser.parse_args(argv)
+
+    file_names = {'json': "teacher_reviews.json", 'columnar': "teacher_reviews.rvc",
+                  'sqlite': "teacher_reviews.db"}
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory(prefix="review_load_") as workdir:
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                sizes = pool.submit(prepare, workdir, size).result()
+            print(f"\n{size:,} reviews")
+            for storage_mode in FORMATS:
+                # A new process per load so nothing is cached in-process
+                with ProcessPoolExecutor(max_workers=1) as pool:
+                    result = pool.submit(load_once, workdir, storage_mode).result()
+                file_mb = sizes[file_names[storage_mode]] / 2 ** 20
+                print(f"  {storage_mode:<9} load {result['load_ms']:9.1f} ms   "
+                      f"RSS +{result['rss_mb']:7.1f} MB   file {file_mb:7.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+"""
+Load and latency benchmark for TeacherReviewSystem.
+
+Seeds a temporary store with N synthetic reviews, starts the app with its Tk
+widgets replaced by stubs, then times the hot paths:
+
+    startup                - setup_data_storage + first update_reviews_display
+                             (cold: first start, which also builds the search
+                             index; warm: second start)
+    submit_review          - validate, build and queue one review
+    save_reviews           - synchronous store write of one review
+    update_statistics      - fold one review into the running statistics
+    update_reviews_display - diffed refresh of the recent panel
+
+Each (backend, size) case runs in its own process so peak RSS is per case.
+
+    python bench_reviews.py --sizes 1000 10000 100000 --output results.json
+    python bench_reviews.py --sizes 1000000 --storage sqlite --compare results.json
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+
+DEPARTMENTS = ["Computer Science", "Electronics", "Mechanical", "Civil", "Business Administration"]
+SUBJECTS = ["Data Structures", "Circuits", "Thermodynamics", "Surveying", "Marketing", "Calculus"]
+WORDS = ("clear lectures helpful patient engaging assignments feedback notes "
+         "explains concepts examples labs punctual fair grading approachable").split()
+
+
+class StubVar:
+    """Stands in for tk.StringVar / IntVar / BooleanVar"""
+
+    def __init__(self, value=""):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+class StubWidget:
+    """Accepts any widget call and does nothing"""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class StubText(StubWidget):
+    def __init__(self):
+        self.text = ""
+
+    def get(self, *args):
+        return self.text + "\n"
+
+    def delete(self, *args):
+        self.text = ""
+
+
+class StubTree(StubWidget):
+    """Enough of ttk.Treeview to track inserted and deleted rows"""
+
+    def __init__(self):
+        self.rows = {}
+        self.counter = 0
+
+    def insert(self, parent, index, values=(), **kwargs):
+        self.counter += 1
+        iid = kwargs.get('iid') or f"I{self.counter:06d}"
+        self.rows[iid] = values
+        return iid
+
+    def delete(self, *items):
+        for item in items:
+            self.rows.pop(item, None)
+
+    def get_children(self, *args):
+        return tuple(self.rows)
+
+
+def make_review(rng, n, timestamp):
+    return {
+        'id': f"SYN_{n}",
+        'student_id': f"{rng.getrandbits(64):016x}",
+        'student_name': "Anonymous",
+        'department': rng.choice(DEPARTMENTS),
+        'teacher_name': f"Teacher {rng.randrange(200)}",
+        'subject': rng.choice(SUBJECTS),
+        'rating': rng.randint(1, 5),
+        'review_text': ' '.join(rng.choice(WORDS) for _ in range(rng.randint(8, 30))),
+        'anonymous': True,
+        'timestamp': timestamp.isoformat(),
+        'ip_hash': "0" * 16
+    }
+
+
+def seed_store(storage_mode, size, seed=7):
+    """Write `size` synthetic reviews into a fresh store in the current directory"""
+    from review_store import open_store
+
+    rng = random.Random(seed)
+    store = open_store(storage_mode)
+    store.load()
+    start = datetime.datetime(2024, 1, 1)
+    batch = []
+    for n in range(size):
+        batch.append(make_review(rng, n, start + datetime.timedelta(seconds=n)))
+        if len(batch) == 10000:
+            store.add_many(batch)
+            batch = []
+    if batch:
+        store.add_many(batch)
+    store.save()
+    store.close()
+
+
+def headless_app(storage_mode, durability):
+    """TeacherReviewSystem with stub widgets instead of a Tk root"""
+    import lab4
+
+    lab4.messagebox = SimpleNamespace(showerror=lambda *a, **k: None,
+                                      showinfo=lambda *a, **k: None)
+    app = lab4.TeacherReviewSystem.__new__(lab4.TeacherReviewSystem)
+    app.storage_mode = storage_mode
+    app.durability = durability
+    app.root = StubWidget()
+    app.setup_data_storage()
+    app.student_id_var = StubVar()
+    app.student_name_var = StubVar()
+    app.department_var = StubVar()
+    app.teacher_name_var = StubVar()
+    app.subject_var = StubVar()
+    app.rating_var = StubVar(5)
+    app.anonymous_var = StubVar(False)
+    app.review_text = StubText()
+    app.reviews_tree = StubTree()
+    app.stats_label = StubWidget()
+    app.status_label = StubWidget()
+    app.validation_label = StubWidget()
+    app.update_reviews_display()
+    return app
+
+
+def fill_form(app, rng):
+    app.student_id_var.set(f"STU{rng.randrange(10 ** 6)}")
+    app.department_var.set(rng.choice(DEPARTMENTS))
+    app.teacher_name_var.set(f"Teacher {rng.randrange(200)}")
+    app.subject_var.set(rng.choice(SUBJECTS))
+    app.rating_var.set(rng.randint(1, 5))
+    app.review_text.text = ' '.join(rng.choice(WORDS) for _ in range(20))
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def summarize(samples):
+    return {
+        'n': len(samples),
+        'p50_ms': percentile(samples, 50) * 1000,
+        'p99_ms': percentile(samples, 99) * 1000,
+        'mean_ms': statistics.fmean(samples) * 1000
+    }
+
+
+def run_case(storage_mode, size, iterations, durability):
+    """Seed, start and time one backend at one history size (runs in a child process)"""
+    with tempfile.TemporaryDirectory(prefix="review_bench_") as workdir:
+        os.chdir(workdir)
+        seed_started = time.perf_counter()
+        seed_store(storage_mode, size)
+        seed_seconds = time.perf_counter() - seed_started
+
+        started = time.perf_counter()
+        app = headless_app(storage_mode, durability)
+        startup_cold = time.perf_counter() - started
+        app.writer.stop()
+        app.search_index.save()
+        app.store.close()
+
+        started = time.perf_counter()
+        app = headless_app(storage_mode, durability)
+        startup = time.perf_counter() - started
+
+        rng = random.Random(11)
+        timings = {name: [] for name in
+                   ('submit_review', 'save_reviews', 'update_statistics', 'update_reviews_display')}
+        for _ in range(iterations):
+            fill_form(app, rng)
+            t0 = time.perf_counter()
+            app.submit_review()
+            timings['submit_review'].append(time.perf_counter() - t0)
+
+            review = make_review(rng, 0, datetime.datetime.now())
+            review['id'] = app.generate_review_id()
+            t0 = time.perf_counter()
+            app.save_reviews(review)
+            timings['save_reviews'].append(time.perf_counter() - t0)
+
+            t0 = time.perf_counter()
+            app.update_statistics(review)
+            timings['update_statistics'].append(time.perf_counter() - t0)
+
+            t0 = time.perf_counter()
+            app.update_reviews_display(review)
+            timings['update_reviews_display'].append(time.perf_counter() - t0)
+
+            # Results of queued submits are not needed here
+            app.writer.poll()
+
+        app.writer.stop()
+        app.store.close()
+        os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        'storage': storage_mode,
+        'size': size,
+        'seed_seconds': seed_seconds,
+        'startup_cold_ms': startup_cold * 1000,
+        'startup_ms': startup * 1000,
+        'peak_rss_mb': peak_kb / 1024,
+        'operations': {name: summarize(samples) for name, samples in timings.items()}
+    }
+
+
+def print_case(result, baseline=None):
+    print(f"\n{result['storage']} @ {result['size']:,} reviews: startup {result['startup_ms']:.1f} ms "
+          f"(cold {result['startup_cold_ms']:.1f} ms), peak RSS {result['peak_rss_mb']:.0f} MB")
+    for name, stats in result['operations'].items():
+        line = f"  {name:<24} p50 {stats['p50_ms']:8.3f} ms   p99 {stats['p99_ms']:8.3f} ms"
+        if baseline is not None and name in baseline['operations']:
+            before = baseline['operations'][name]['p99_ms']
+            if before:
+                line += f"   p99 vs baseline {(stats['p99_ms'] - before) / before * 100:+.0f}%"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark TeacherReviewSystem hot paths")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--storage', nargs='+',
+                        choices=['json', 'journal', 'shared', 'columnar', 'sqlite'],
+                        default=['journal', 'sqlite'])
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--durability', choices=['review', 'batch', 'interval'], default='batch')
+    parser.add_argument('--output', help="write machine-readable results to this JSON file")
+    parser.add_argument('--compare', help="previous results JSON to compare p99 against")
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            for case in json.load(f)['cases']:
+                baseline[(case['storage'], case['size'])] = case
+
+    results = []
+    for storage_mode in args.storage:
+        for size in args.sizes:
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                result = pool.submit(run_case, storage_mode, size, args.iterations,
+                                     args.durability).result()
+            results.append(result)
+            print_case(result, baseline.get((storage_mode, size)))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({
+                'generated': datetime.datetime.now().isoformat(),
+                'python': sys.version.split()[0],
+                'platform': platform.platform(),
+                'iterations': args.iterations,
+                'durability': args.durability,
+                'cases': results
+            }, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark: per-pattern substring loop vs. the compiled ContentScanner.
+
+    python bench_validation.py [--reviews 20000]
+
+Scans the same synthetic reviews against blocklists of 10, 100 and 1000
+patterns with both approaches and prints reviews/second.
+"""
+
+import argparse
+import random
+import string
+import time
+
+from review_validation import ContentScanner, DANGEROUS_PATTERNS
+
+WORDS = ("clear lectures helpful patient engaging assignments feedback notes "
+         "explains concepts examples labs punctual fair grading approachable").split()
+
+
+def make_patterns(n, rng):
+    patterns = list(DANGEROUS_PATTERNS)
+    while len(patterns) < n:
+        patterns.append(''.join(rng.choice(string.ascii_lowercase + '<(:')
+                                for _ in range(rng.randint(5, 12))))
+    return patterns[:n]
+
+
+def make_reviews(n, rng):
+    reviews = [' '.join(rng.choice(WORDS) for _ in range(rng.randint(10, 40))) for _ in range(n)]
+    # A few hostile ones so both paths exercise the hit case
+    for i in range(0, n, 97):
+        reviews[i] += " <script>alert(1)</script>"
+    return reviews
+
+
+def old_scan(patterns, reviews):
+    """The original validate_input loop"""
+    hits = 0
+    for review in reviews:
+        content = review.lower()
+        for pattern in patterns:
+            if pattern in content:
+                hits += 1
+                break
+    return hits
+
+
+def new_scan(scanner, reviews):
+    return len(scanner.scan_many(reviews))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--reviews', type=int, default=20000)
+    args = parser.parse_args()
+    rng = random.Random(42)
+    reviews = make_reviews(args.reviews, rng)
+
+    print(f"{'patterns':>8} {'old rev/s':>12} {'new rev/s':>12} {'speedup':>8} {'build ms':>9}")
+    for n in (10, 100, 1000):
+        patterns = make_patterns(n, rng)
+        started = time.perf_counter()
+        scanner = ContentScanner(patterns)
+        build = time.perf_counter() - started
+
+        started = time.perf_counter()
+        old_hits = old_scan(patterns, reviews)
+        old = time.perf_counter() - started
+
+        started = time.perf_counter()
+        new_hits = new_scan(scanner, reviews)
+        new = time.perf_counter() - started
+
+        assert old_hits == new_hits, (old_hits, new_hits)
+        print(f"{n:>8} {len(reviews) / old:>12,.0f} {len(reviews) / new:>12,.0f} "
+              f"{old / new:>7.1f}x {build * 1000:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+Headless bulk review ingestion for the Teacher Review System.
+
+Streams a CSV or JSON-lines export of reviews, validates chunks in a process
+pool with the same rules as the Tk form, hashes student IDs and writes accepted
+reviews to the store in batches. Only a bounded number of chunks is in flight
+at any time, so memory stays flat regardless of file size (with the SQLite
+backend; the JSON backends keep their whole history in memory by design).
+
+    python bulk_ingest.py reviews.csv --storage sqlite --rejects rejects.csv
+
+Expected columns: student_id, student_name, department, teacher_name, subject,
+rating, review_text, and optionally anonymous and timestamp. Timestamps may be
+ISO 8601 or month/day/year (the format the app displays); they are stored as
+ISO 8601, and rows with any other timestamp are rejected.
+"""
+
+import argparse
+import csv
+import datetime
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from review_store import SqliteReviewStore, new_review_id, open_store
+from review_validation import validate_review_fields, hash_sensitive_data
+
+TRUE_VALUES = ('1', 'true', 'yes', 'y')
+# Accepted besides ISO 8601; month first, like the dates the app shows
+TIMESTAMP_FORMATS = ('%m/%d/%Y %H:%M:%S', '%m/%d/%Y %H:%M', '%m/%d/%Y')
+
+
+def read_rows(path):
+    """Yield (line_number, row dict) from a CSV or JSON-lines file"""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.lower().endswith(('.jsonl', '.ndjson')):
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield line_no, json.loads(line)
+                except ValueError:
+                    yield line_no, None
+        else:
+            # Header is line 1, so data rows start at 2
+            for line_no, row in enumerate(csv.DictReader(f), start=2):
+                yield line_no, row
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def parse_timestamp(value):
+    """ISO 8601 string for a timestamp column value; now when blank, None when unparseable"""
+    value = str(value or '').strip()
+    if not value:
+        return datetime.datetime.now().isoformat()
+    try:
+        return datetime.datetime.fromisoformat(value).isoformat()
+    except ValueError:
+        pass
+    for fmt in TIMESTAMP_FORMATS:
+        try:
+            return datetime.datetime.strptime(value, fmt).isoformat()
+        except ValueError:
+            continue
+    return None
+
+
+def prepare_review(row, ip_hash):
+    """Validate one raw row; return (review, None) or (None, errors)"""
+    if not isinstance(row, dict):
+        return None, ["Malformed row"]
+    fields = {k: str(row.get(k) or '') for k in
+              ('student_id', 'student_name', 'department', 'teacher_name', 'subject', 'review_text')}
+    try:
+        rating = int(row.get('rating'))
+    except (TypeError, ValueError):
+        rating = None
+    errors = validate_review_fields(fields['student_id'], fields['department'],
+                                    fields['teacher_name'], fields['subject'],
+                                    fields['review_text'], rating)
+    timestamp = parse_timestamp(row.get('timestamp'))
+    if timestamp is None:
+        errors.append(f"Unrecognised timestamp: {row.get('timestamp')}")
+    if errors:
+        return None, errors
+    anonymous = str(row.get('anonymous', '')).strip().lower() in TRUE_VALUES
+    return {
+        'student_id': hash_sensitive_data(fields['student_id'].strip()),
+        'student_name': "Anonymous" if anonymous else fields['student_name'].strip(),
+        'department': fields['department'].strip(),
+        'teacher_name': fields['teacher_name'].strip(),
+        'subject': fields['subject'].strip(),
+        'rating': rating,
+        'review_text': fields['review_text'].strip(),
+        'anonymous': anonymous,
+        'timestamp': timestamp,
+        'ip_hash': ip_hash
+    }, None
+
+
+def validate_chunk(rows):
+    """Worker entry point: split a chunk into accepted reviews and rejects"""
+    ip_hash = hash_sensitive_data("bulk-import")
+    accepted, rejected = [], []
+    for line_no, row in rows:
+        review, errors = prepare_review(row, ip_hash)
+        if errors:
+            rejected.append((line_no, errors))
+        else:
+            accepted.append(review)
+    return accepted, rejected
+
+
+def ingest(path, store, batch_size=5000, workers=None, rejects_file=None, progress=None):
+    """Stream `path` into `store`; return a summary dict"""
+    workers = workers or os.cpu_count() or 1
+    summary = {'rows': 0, 'accepted': 0, 'rejected': 0}
+    rejects_writer = None
+    if rejects_file is not None:
+        rejects_writer = csv.writer(rejects_file)
+        rejects_writer.writerow(['line', 'errors'])
+    # SQLite would otherwise read every batch straight back as "new rows"
+    add_options = {'return_new': False} if isinstance(store, SqliteReviewStore) else {}
+    started = time.perf_counter()
+
+    def drain(future):
+        accepted, rejected = future.result()
+        for review in accepted:
+            review['id'] = new_review_id()
+        summary['accepted'] += len(accepted)
+        if accepted:
+            store.add_many(accepted, **add_options)
+        summary['rejected'] += len(rejected)
+        summary['rows'] += len(accepted) + len(rejected)
+        if rejects_writer is not None:
+            for line_no, errors in rejected:
+                rejects_writer.writerow([line_no, " | ".join(errors)])
+        if progress is not None:
+            progress(summary, time.perf_counter() - started)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = deque()
+        for chunk in chunked(read_rows(path), batch_size):
+            in_flight.append(pool.submit(validate_chunk, chunk))
+            # Keep a couple of chunks per worker queued, then write results in order
+            if len(in_flight) >= workers * 2:
+                drain(in_flight.popleft())
+        while in_flight:
+            drain(in_flight.popleft())
+
+    store.save()
+    summary['seconds'] = time.perf_counter() - started
+    summary['rows_per_sec'] = summary['rows'] / summary['seconds'] if summary['seconds'] else 0
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk-load reviews without the Tk form")
+    parser.add_argument('path', help="CSV or JSON-lines file of reviews")
+    parser.add_argument('--storage', choices=['sqlite', 'journal', 'shared', 'columnar', 'json'],
+                        default='sqlite')
+    parser.add_argument('--data-file', default="teacher_reviews.json")
+    parser.add_argument('--db-file', default="teacher_reviews.db")
+    parser.add_argument('--batch-size', type=int, default=5000)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--rejects', help="write rejected rows (line, errors) to this CSV")
+    args = parser.parse_args(argv)
+
+    def progress(summary, elapsed):
+        rate = summary['rows'] / elapsed if elapsed else 0
+        print(f"\r{summary['rows']:,} rows | {summary['accepted']:,} accepted | "
+              f"{summary['rejected']:,} rejected | {rate:,.0f} rows/s", end='', flush=True)
+
+    store = open_store(args.storage, args.data_file, args.db_file)
+    store.load()
+    rejects_file = open(args.rejects, 'w', encoding='utf-8', newline='') if args.rejects else None
+    try:
+        summary = ingest(args.path, store, args.batch_size, args.workers, rejects_file, progress)
+    finally:
+        store.close()
+        if rejects_file is not None:
+            rejects_file.close()
+    print()
+    print(f"Ingested {summary['accepted']:,} of {summary['rows']:,} rows "
+          f"({summary['rejected']:,} rejected) in {summary['seconds']:.1f}s "
+          f"= {summary['rows_per_sec']:,.0f} rows/s")
+    return 0 if summary['rows'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -34,20 +34,33 @@ COMPREHENSIVE DESIGN PLAN FOR TEACHER REVIEW SYSTEM
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
-import json
-import hashlib
+import argparse
 import datetime
-import re
+import time
 from pathlib import Path
 import base64
 
+from review_store import open_store, new_review_id
+from review_stats import ReviewStatistics, RecentReviews
+from review_validation import validate_review_fields, hash_sensitive_data, default_scanner
+from review_writer import ReviewWriter
+from review_search import ReviewIndex
+from review_duplicates import DuplicateDetector
+
+# Longest the startup duplicate indexing may hold the Tk loop per tick (seconds)
+INDEX_TICK_BUDGET = 0.02
+
 class TeacherReviewSystem:
-    def __init__(self):
+    def __init__(self, storage_mode="journal", durability="batch"):
+        self.storage_mode = storage_mode
+        self.durability = durability
         self.root = tk.Tk()
         self.setup_window()
         self.setup_styles()
         self.setup_data_storage()
         self.create_interface()
+        self.poll_writer()
+        self.index_duplicates()
         
     def setup_window(self):
         """Configure main window properties"""
@@ -95,24 +108,74 @@ class TeacherReviewSystem:
     def setup_data_storage(self):
         """Initialize data storage and security"""
         self.data_file = Path("teacher_reviews.json")
-        self.reviews_data = self.load_reviews()
+        self.db_file = Path("teacher_reviews.db")
+        self.store = open_store(self.storage_mode, self.data_file, self.db_file)
+        self.scanner = default_scanner()
+        self.statistics = ReviewStatistics()
+        self.recent_reviews = RecentReviews(limit=20)
+        self.load_reviews()
+        self.reindex_statistics()
+        store_file = {"sqlite": self.db_file,
+                      "columnar": self.data_file.with_suffix(".rvc")}.get(self.storage_mode, self.data_file)
+        self.search_index = ReviewIndex(store_file.with_name(store_file.name + ".index"))
+        self.load_search_index()
+        # Filled in chunks from the Tk loop so startup is not held up; see index_duplicates
+        self.duplicates = DuplicateDetector()
+        self.duplicates_ready = False
+        self.failed_reviews = []
+        self.sync_warned = False
+        # Persistence runs off the Tk thread; see poll_writer
+        self.writer = ReviewWriter(self.store, durability=self.durability).start()
         
     def load_reviews(self):
         """Load existing reviews from storage"""
         try:
-            if self.data_file.exists():
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            return {"reviews": [], "statistics": {}}
+            self.store.load()
+            # First start on SQLite or columnar: bring over the existing JSON history
+            if (self.storage_mode in ("sqlite", "columnar") and self.data_file.exists()
+                    and not self.store.count()):
+                self.store.import_json(self.data_file)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load data: {str(e)}")
-            return {"reviews": [], "statistics": {}}
     
-    def save_reviews(self):
-        """Save reviews to storage with basic encryption"""
+    def load_search_index(self):
+        """Load the saved search index and index any reviews added since"""
+        try:
+            index = self.search_index
+            index.load()
+            stale = len(index) > self.store.count()
+            if len(index) and not stale:
+                stale = not self.store.get_many([index.review_ids[-1]])
+            if stale:
+                index.clear()
+            index.catch_up(self.store)
+            index.save()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load search index: {str(e)}")
+    
+    def index_duplicates(self):
+        """Add stored reviews to the duplicate detector, a few milliseconds per Tk tick"""
+        deadline = time.perf_counter() + INDEX_TICK_BUDGET
+        try:
+            for review in self.store.iter_reviews(start=len(self.duplicates)):
+                self.duplicates.add(review)
+                if time.perf_counter() >= deadline:
+                    break
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to index reviews for duplicates: {str(e)}")
+            return
+        if len(self.duplicates) < self.store.count():
+            self.root.after(1, self.index_duplicates)
+        else:
+            self.duplicates_ready = True
+    
+    def save_reviews(self, review=None):
+        """Persist a new review, or the whole store when no review is given"""
         try:
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(self.reviews_data, f, indent=2, ensure_ascii=False)
+            if review is not None:
+                self.store.add(review)
+            else:
+                self.store.save()
             return True
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save data: {str(e)}")
@@ -332,6 +395,11 @@ class TeacherReviewSystem:
                                     font=('Arial', 9))
         self.stats_label.pack()
         
+        search_btn = ttk.Button(reviews_frame, text="🔍 Search Reviews",
+                               command=self.open_search_window,
+                               style='Professional.TButton')
+        search_btn.pack(fill='x', padx=15, pady=(0, 15))
+        
         # Reviews list
         list_frame = ttk.LabelFrame(reviews_frame, text="Latest Reviews", padding=10)
         list_frame.pack(fill='both', expand=True, padx=15, pady=(0, 15))
@@ -384,40 +452,13 @@ class TeacherReviewSystem:
         
     def validate_input(self):
         """Validate form input with security checks"""
-        errors = []
-        
-        # Required field validation
-        if not self.student_id_var.get().strip():
-            errors.append("Student ID is required")
-        elif not re.match(r'^[A-Za-z0-9]+$', self.student_id_var.get().strip()):
-            errors.append("Student ID must contain only letters and numbers")
-            
-        if not self.department_var.get().strip():
-            errors.append("Department is required")
-            
-        if not self.teacher_name_var.get().strip():
-            errors.append("Teacher name is required")
-        elif len(self.teacher_name_var.get().strip()) < 2:
-            errors.append("Teacher name must be at least 2 characters")
-            
-        if not self.subject_var.get().strip():
-            errors.append("Subject is required")
-            
-        if not self.review_text.get("1.0", tk.END).strip():
-            errors.append("Review comments are required")
-        elif len(self.review_text.get("1.0", tk.END).strip()) < 10:
-            errors.append("Review must be at least 10 characters long")
-            
-        # Security validation - check for malicious input
-        dangerous_patterns = ['<script', 'javascript:', 'eval(', 'exec(']
-        review_content = self.review_text.get("1.0", tk.END).lower()
-        
-        for pattern in dangerous_patterns:
-            if pattern in review_content:
-                errors.append("Invalid characters detected in review")
-                break
-                
-        return errors
+        return validate_review_fields(self.student_id_var.get(),
+                                      self.department_var.get(),
+                                      self.teacher_name_var.get(),
+                                      self.subject_var.get(),
+                                      self.review_text.get("1.0", tk.END),
+                                      self.rating_var.get(),
+                                      self.scanner)
     
     def submit_review(self):
         """Submit review with validation and security measures"""
@@ -447,32 +488,51 @@ class TeacherReviewSystem:
             'ip_hash': self.hash_sensitive_data("127.0.0.1")  # In real app, get actual IP
         }
         
-        # Add to reviews data
-        if 'reviews' not in self.reviews_data:
-            self.reviews_data['reviews'] = []
-            
-        self.reviews_data['reviews'].append(review_data)
-        
-        # Update statistics
-        self.update_statistics()
+        # Same student pasting one review for several teachers
+        if self.duplicates.check(review_data):
+            self.validation_label.config(text="This review is nearly identical to one you already submitted")
+            self.status_label.config(text="Please fix validation errors")
+            return
         
-        # Save to file
-        if self.save_reviews():
-            messagebox.showinfo("Success", "Review submitted successfully!")
-            self.clear_form()
-            self.update_reviews_display()
-            self.status_label.config(text="Review submitted successfully")
-        else:
-            self.status_label.config(text="Failed to save review")
+        # Hand off to the background writer; poll_writer reports the outcome
+        self.writer.submit(review_data)
+        self.clear_form()
+        self.status_label.config(text="Saving review...")
+    
+    def poll_writer(self):
+        """Apply finished background writes to the UI"""
+        for written, error, sync_error, submitted in self.writer.poll():
+            if error is not None:
+                self.failed_reviews.extend(submitted)
+                messagebox.showerror("Error", f"Failed to save data: {str(error)}")
+                self.status_label.config(text="Failed to save review")
+                continue
+            # Includes reviews other kiosks saved to a shared store
+            for review in written:
+                self.update_statistics(review)
+                self.search_index.add(review)
+                # Until the initial pass finishes it picks these up from the store
+                if self.duplicates_ready:
+                    self.duplicates.add(review)
+                self.update_reviews_display(review)
+            if sync_error is not None:
+                # Written but not flushed; the writer retries the sync, so nothing is resubmitted
+                self.status_label.config(text="Review saved, but not yet flushed to disk")
+                if not self.sync_warned:
+                    self.sync_warned = True
+                    messagebox.showwarning("Warning", f"Could not flush reviews to disk: {str(sync_error)}")
+            elif submitted:
+                self.sync_warned = False
+                self.status_label.config(text="Review submitted successfully")
+        self.root.after(100, self.poll_writer)
     
     def generate_review_id(self):
-        """Generate unique review ID"""
-        timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
-        return f"REV_{timestamp}_{len(self.reviews_data.get('reviews', []))}"
+        """Generate unique review ID, collision-free across kiosks"""
+        return new_review_id()
     
     def hash_sensitive_data(self, data):
         """Hash sensitive data for security"""
-        return hashlib.sha256(data.encode()).hexdigest()[:16]
+        return hash_sensitive_data(data)
     
     def clear_form(self):
         """Clear all form fields"""
@@ -487,72 +547,162 @@ class TeacherReviewSystem:
         self.validation_label.config(text="")
         self.status_label.config(text="Form cleared")
     
-    def update_statistics(self):
-        """Update review statistics"""
-        reviews = self.reviews_data.get('reviews', [])
-        
-        if not reviews:
-            return
-            
-        total_reviews = len(reviews)
-        avg_rating = sum(r['rating'] for r in reviews) / total_reviews
-        
-        # Department breakdown
-        dept_counts = {}
-        for review in reviews:
-            dept = review['department']
-            dept_counts[dept] = dept_counts.get(dept, 0) + 1
-        
-        self.reviews_data['statistics'] = {
-            'total_reviews': total_reviews,
-            'average_rating': round(avg_rating, 2),
-            'department_breakdown': dept_counts,
-            'last_updated': datetime.datetime.now().isoformat()
-        }
+    def update_statistics(self, review):
+        """Fold one new review into the running statistics in O(1)"""
+        self.statistics.add(review)
     
-    def update_reviews_display(self):
-        """Update the reviews display panel"""
-        # Clear existing items
-        for item in self.reviews_tree.get_children():
-            self.reviews_tree.delete(item)
-        
-        # Add recent reviews
-        reviews = self.reviews_data.get('reviews', [])
-        recent_reviews = sorted(reviews, key=lambda x: x['timestamp'], reverse=True)[:20]
-        
-        for review in recent_reviews:
-            date_str = datetime.datetime.fromisoformat(review['timestamp']).strftime("%m/%d")
-            rating_str = "★" * review['rating']
-            
-            self.reviews_tree.insert('', 'end', values=(
-                review['teacher_name'][:15],
-                review['subject'][:12],
-                rating_str,
-                date_str
-            ))
+    def reindex_statistics(self):
+        """Rebuild the running statistics from the store (load or explicit reindex)"""
+        try:
+            self.statistics.rebuild(self.store.rating_groups())
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to build statistics: {str(e)}")
+    
+    def review_row(self, review):
+        """Treeview values for one review"""
+        date_str = datetime.datetime.fromisoformat(review['timestamp']).strftime("%m/%d")
+        return (review['teacher_name'][:15], review['subject'][:12], "★" * review['rating'], date_str)
+    
+    def update_reviews_display(self, new_review=None):
+        """Update the reviews display panel.
+        
+        With no argument the recent window is reloaded from the store. With a
+        newly submitted review only that row is inserted and the oldest row
+        evicted, so the cost does not depend on the size of the history.
+        """
+        if new_review is None:
+            for item in self.reviews_tree.get_children():
+                self.reviews_tree.delete(item)
+            self.recent_reviews.clear()
+            for review in reversed(self.store.recent(self.recent_reviews.limit)):
+                iid = self.reviews_tree.insert('', 0, values=self.review_row(review))
+                self.recent_reviews.push((iid, review))
+        else:
+            iid = self.reviews_tree.insert('', 0, values=self.review_row(new_review))
+            evicted = self.recent_reviews.push((iid, new_review))
+            if evicted is not None:
+                self.reviews_tree.delete(evicted[0])
         
         # Update statistics display
-        stats = self.reviews_data.get('statistics', {})
-        if stats:
-            stats_text = f"Total Reviews: {stats.get('total_reviews', 0)}\n"
-            stats_text += f"Average Rating: {stats.get('average_rating', 0):.1f}/5\n"
+        stats = self.statistics
+        if stats.total_reviews:
+            stats_text = f"Total Reviews: {stats.total_reviews}\n"
+            stats_text += f"Average Rating: {stats.average_rating:.1f}/5\n"
+            stats_text += "Ratings: " + "  ".join(
+                f"{rating}★ {count}" for rating, count in sorted(stats.rating_histogram.items(), reverse=True)) + "\n"
+            for label, kind in (("Top Teacher", "teachers"), ("Top Subject", "subjects")):
+                leader = stats.leader(kind)
+                if leader is not None:
+                    name, rollup = leader
+                    stats_text += f"{label}: {name[:18]} ({rollup.average:.1f}, {rollup.count})\n"
             stats_text += f"Last Updated: {datetime.datetime.now().strftime('%m/%d/%Y %H:%M')}"
         else:
             stats_text = "No statistics available"
             
         self.stats_label.config(text=stats_text)
     
+    def open_search_window(self):
+        """Search reviews by keywords with department and rating filters"""
+        win = tk.Toplevel(self.root)
+        win.title("Search Reviews")
+        win.geometry("760x560")
+        win.transient(self.root)
+        
+        # Query controls
+        query_frame = ttk.Frame(win, padding=10)
+        query_frame.pack(fill='x')
+        
+        ttk.Label(query_frame, text="Keywords:").grid(row=0, column=0, sticky='w')
+        query_var = tk.StringVar()
+        query_entry = ttk.Entry(query_frame, textvariable=query_var, width=30, font=('Arial', 10))
+        query_entry.grid(row=0, column=1, sticky='ew', padx=(5, 15))
+        
+        ttk.Label(query_frame, text="Department:").grid(row=0, column=2, sticky='w')
+        department_var = tk.StringVar(value="All")
+        ttk.Combobox(query_frame, textvariable=department_var, state='readonly', width=18,
+                     values=["All"] + sorted(self.statistics.departments)).grid(row=0, column=3, padx=(5, 15))
+        
+        ttk.Label(query_frame, text="Min Rating:").grid(row=0, column=4, sticky='w')
+        rating_var = tk.StringVar(value="Any")
+        ttk.Combobox(query_frame, textvariable=rating_var, state='readonly', width=5,
+                     values=["Any", "1", "2", "3", "4", "5"]).grid(row=0, column=5, padx=(5, 0))
+        query_frame.columnconfigure(1, weight=1)
+        
+        # Results
+        columns = ('Teacher', 'Subject', 'Department', 'Rating', 'Date')
+        results_tree = ttk.Treeview(win, columns=columns, show='headings', height=12)
+        for col, width in zip(columns, (150, 130, 150, 70, 80)):
+            results_tree.heading(col, text=col)
+            results_tree.column(col, width=width)
+        results_tree.pack(fill='both', expand=True, padx=10)
+        
+        count_label = ttk.Label(win, text="", font=('Arial', 9))
+        count_label.pack(anchor='w', padx=10, pady=(5, 0))
+        
+        review_view = scrolledtext.ScrolledText(win, height=6, font=('Arial', 10), wrap='word')
+        review_view.pack(fill='x', padx=10, pady=10)
+        
+        found = {}
+        
+        def run_search(*_):
+            department = department_var.get()
+            rating = rating_var.get()
+            ids, total = self.search_index.search(query_var.get(),
+                                           department=None if department == "All" else department,
+                                           min_rating=None if rating == "Any" else int(rating))
+            found.clear()
+            found.update(self.store.get_many(ids))
+            results_tree.delete(*results_tree.get_children())
+            for review_id in ids:
+                review = found.get(review_id)
+                if review is None:
+                    continue
+                date_str = datetime.datetime.fromisoformat(review['timestamp']).strftime("%m/%d/%Y")
+                results_tree.insert('', 'end', iid=review_id, values=(
+                    review['teacher_name'], review['subject'], review['department'],
+                    "★" * review['rating'], date_str))
+            count_label.config(text=f"{total} matching reviews (showing the newest {len(ids)})")
+        
+        def show_review(*_):
+            selection = results_tree.selection()
+            review_view.delete("1.0", tk.END)
+            if selection and selection[0] in found:
+                review_view.insert("1.0", found[selection[0]]['review_text'])
+        
+        ttk.Button(query_frame, text="Search", command=run_search,
+                   style='Professional.TButton').grid(row=0, column=6, padx=(15, 0))
+        query_entry.bind('<Return>', run_search)
+        results_tree.bind('<<TreeviewSelect>>', show_review)
+        run_search()
+    
+    def on_close(self):
+        """Flush the writer, retry failed saves, compact and release the store"""
+        self.writer.stop()
+        for review in self.failed_reviews:
+            self.save_reviews(review)
+        self.save_reviews()
+        self.search_index.save()
+        self.store.close()
+        self.root.destroy()
+    
     def run(self):
         """Start the application"""
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         self.root.mainloop()
 
 def main():
     """Main function to run the Teacher Review System"""
+    parser = argparse.ArgumentParser(description="Teacher Review System")
+    # "shared" lets several kiosks write to one teacher_reviews.json at once
+    parser.add_argument('--storage', choices=['journal', 'shared', 'columnar', 'sqlite', 'json'], default='journal')
+    parser.add_argument('--durability', choices=['review', 'batch', 'interval'], default='batch')
+    args = parser.parse_args()
+
     print("Initializing Christ University Teacher Review System...")
     print("Security features: Input validation, data encryption, audit trail")
     print("Starting application...")
     
-    app = TeacherReviewSystem()
+    app = TeacherReviewSystem(storage_mode=args.storage, durability=args.durability)
     app.run()
 
 if __name__ == "__main__":
@@ -0,0 +1,235 @@
+"""
+Compact columnar file format for review snapshots (.rvc).
+
+Layout:
+    8 bytes   magic b"RVCOL1\\n\\0"
+    4 bytes   header length (little-endian u32)
+    header    JSON: review count, one entry per column, the rating groups and
+              (start, length) of every section relative to the data start
+    sections  8-byte aligned column data, starting at the next 8-byte boundary
+
+Column kinds:
+    dict - u32 code per review plus the distinct strings in the header
+           (department, teacher_name, subject, student_name, ip_hash)
+    text - u64 offsets (count + 1) followed by one UTF-8 blob
+           (id, student_id, review_text, timestamp)
+    u8   - one byte per review (rating, anonymous)
+
+The file is memory-mapped and nothing is decoded up front. The rating groups
+behind the statistics panel are precomputed in the header. The newest-first and
+by-id permutations let recent() and get_many() decode only the reviews they
+return.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import Counter
+from pathlib import Path
+
+MAGIC = b"RVCOL1\n\0"
+
+FIELD_ORDER = ('id', 'student_id', 'student_name', 'department', 'teacher_name',
+               'subject', 'rating', 'review_text', 'anonymous', 'timestamp', 'ip_hash')
+
+DICT_COLUMNS = ('department', 'teacher_name', 'subject', 'student_name', 'ip_hash')
+TEXT_COLUMNS = ('id', 'student_id', 'review_text', 'timestamp')
+BYTE_COLUMNS = ('rating', 'anonymous')
+
+
+def _align(offset):
+    return (offset + 7) & ~7
+
+
+def encode_review_columns(reviews):
+    """Encode reviews (any iterable of dicts) into (header bytes, section spans, sections)"""
+    dictionaries = {name: {} for name in DICT_COLUMNS}
+    codes = {name: array('I') for name in DICT_COLUMNS}
+    offsets = {name: array('Q', [0]) for name in TEXT_COLUMNS}
+    blobs = {name: bytearray() for name in TEXT_COLUMNS}
+    bytes_columns = {name: bytearray() for name in BYTE_COLUMNS}
+    groups = Counter()
+    count = 0
+    for review in reviews:
+        for name in DICT_COLUMNS:
+            value = review.get(name) or ''
+            code = dictionaries[name].get(value)
+            if code is None:
+                code = dictionaries[name][value] = len(dictionaries[name])
+            codes[name].append(code)
+        for name in TEXT_COLUMNS:
+            blobs[name] += str(review.get(name) or '').encode('utf-8')
+            offsets[name].append(len(blobs[name]))
+        bytes_columns['rating'].append(int(review['rating']))
+        bytes_columns['anonymous'].append(1 if review.get('anonymous') else 0)
+        groups[(codes['department'][-1], codes['teacher_name'][-1],
+                codes['subject'][-1], review['rating'])] += 1
+        count += 1
+
+    def text_values(name):
+        blob, ends = blobs[name], offsets[name]
+        return [blob[ends[i]:ends[i + 1]] for i in range(count)]
+
+    # Ties keep insertion order, matching the other backends
+    timestamps = text_values('timestamp')
+    newest = array('I', sorted(range(count), key=lambda i: timestamps[i], reverse=True))
+    del timestamps
+    ids = text_values('id')
+    by_id = array('I', sorted(range(count), key=ids.__getitem__))
+    del ids
+
+    sections = []
+    columns = {}
+    for name in DICT_COLUMNS:
+        columns[name] = {'kind': 'dict', 'values': list(dictionaries[name]),
+                         'codes': len(sections)}
+        sections.append(codes[name])
+    for name in TEXT_COLUMNS:
+        columns[name] = {'kind': 'text', 'offsets': len(sections), 'blob': len(sections) + 1}
+        sections.extend((offsets[name], blobs[name]))
+    for name in BYTE_COLUMNS:
+        columns[name] = {'kind': 'u8', 'data': len(sections)}
+        sections.append(bytes_columns[name])
+    sections.extend((newest, by_id))
+
+    names = {name: columns[name]['values'] for name in ('department', 'teacher_name', 'subject')}
+    header = {
+        'count': count,
+        'byteorder': sys.byteorder,
+        'columns': columns,
+        'rating_groups': [[names['department'][d], names['teacher_name'][t], names['subject'][s], r, n]
+                          for (d, t, s, r), n in groups.items()],
+        'newest': len(sections) - 2,
+        'by_id': len(sections) - 1,
+        'sections': []
+    }
+    position = 0
+    for section in sections:
+        length = len(section) * getattr(section, 'itemsize', 1)
+        header['sections'].append([position, length])
+        position = _align(position + length)
+    header_bytes = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    return header_bytes, header['sections'], sections
+
+
+def save_review_columns(path, encoded):
+    """Write the output of encode_review_columns atomically"""
+    path = Path(path)
+    header_bytes, spans, sections = encoded
+    data_start = _align(len(MAGIC) + 4 + len(header_bytes))
+    tmp_file = path.with_name(path.name + '.tmp')
+    with open(tmp_file, 'wb') as f:
+        f.write(MAGIC)
+        f.write(struct.pack('<I', len(header_bytes)))
+        f.write(header_bytes)
+        for (start, length), section in zip(spans, sections):
+            f.write(b'\0' * (data_start + start - f.tell()))
+            f.write(section)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, path)
+
+
+def write_review_columns(path, reviews):
+    """Encode reviews into a .rvc file; returns how many were written"""
+    encoded = encode_review_columns(reviews)
+    save_review_columns(path, encoded)
+    # The first section holds one department code per review
+    return len(encoded[2][0])
+
+
+class ReviewColumns:
+    """Read-only, memory-mapped view of a .rvc file"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.file = open(self.path, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.views = []
+        if self.map[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} is not a review column file")
+        header_length = struct.unpack_from('<I', self.map, len(MAGIC))[0]
+        header_start = len(MAGIC) + 4
+        header = json.loads(self.map[header_start:header_start + header_length])
+        if header['byteorder'] != sys.byteorder:
+            self.close()
+            raise ValueError(f"{self.path} was written on a {header['byteorder']}-endian machine")
+        self.count = header['count']
+        self.groups = [tuple(group) for group in header['rating_groups']]
+
+        # Slicing and casting a memoryview copies nothing
+        whole = self._view(memoryview(self.map))
+        data = self._view(whole[_align(header_start + header_length):])
+        sections = [self._view(data[start:start + length]) for start, length in header['sections']]
+        self.dictionaries, self.codes = {}, {}
+        self.offsets, self.blobs, self.bytes = {}, {}, {}
+        for name, column in header['columns'].items():
+            if column['kind'] == 'dict':
+                self.dictionaries[name] = column['values']
+                self.codes[name] = self._view(sections[column['codes']].cast('I'))
+            elif column['kind'] == 'text':
+                self.offsets[name] = self._view(sections[column['offsets']].cast('Q'))
+                self.blobs[name] = sections[column['blob']]
+            else:
+                self.bytes[name] = sections[column['data']]
+        self.newest_order = self._view(sections[header['newest']].cast('I'))
+        self.id_order = self._view(sections[header['by_id']].cast('I'))
+
+    def _view(self, view):
+        self.views.append(view)
+        return view
+
+    def __len__(self):
+        return self.count
+
+    def value(self, name, i):
+        """Decode one field of review i"""
+        if name in self.codes:
+            return self.dictionaries[name][self.codes[name][i]]
+        if name in self.offsets:
+            ends = self.offsets[name]
+            return str(self.blobs[name][ends[i]:ends[i + 1]], 'utf-8')
+        if name == 'anonymous':
+            return bool(self.bytes[name][i])
+        return self.bytes[name][i]
+
+    def review(self, i):
+        """Decode review i as the usual dict"""
+        return {name: self.value(name, i) for name in FIELD_ORDER}
+
+    def reviews(self, start=0):
+        for i in range(start, self.count):
+            yield self.review(i)
+
+    def newest(self, limit):
+        """Positions of the newest `limit` reviews, newest first"""
+        return list(self.newest_order[:limit])
+
+    def find(self, review_id):
+        """Position of the review with this id, or None, by binary search over the id order"""
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self.value('id', self.id_order[middle]) < review_id:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.count and self.value('id', self.id_order[low]) == review_id:
+            return self.id_order[low]
+        return None
+
+    def rating_groups(self):
+        """(department, teacher, subject, rating, count) precomputed when the file was written"""
+        return list(self.groups)
+
+    def close(self):
+        # Views must be released before the map can close
+        for view in reversed(self.views):
+            view.release()
+        self.views = []
+        self.map.close()
+        self.file.close()
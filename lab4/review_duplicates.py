@@ -0,0 +1,197 @@
+"""
+Near-duplicate review detection with MinHash signatures and LSH buckets.
+
+Each review_text is reduced to word-bigram shingles and summarised by a
+one-permutation MinHash signature: every shingle is hashed once and the smallest
+hash is kept in each of `num_bins` bins, with empty bins filled from their
+neighbours. The share of equal bins between two signatures estimates the
+Jaccard similarity of their shingle sets.
+
+Signatures are split into `bands` and each band is hashed; two reviews become
+candidates when any band hash matches. By default the buckets are keyed by the
+(already hashed) student_id: a new review is only banded against that
+student's own reviews, so a check never scans the store. With
+by_student=False (batch runs across all students) the band hashes index a
+global bucket table instead. Candidates are confirmed against `threshold`
+using their signatures.
+
+    python review_duplicates.py --storage journal            # flag existing clusters
+    python review_duplicates.py --storage sqlite --any-student
+"""
+
+import argparse
+import re
+from array import array
+
+WORD_PATTERN = re.compile(r"[a-z0-9']+")
+HASH_MASK = (1 << 64) - 1
+
+
+def shingles(text):
+    """Word bigrams of the normalised text (single words for one-word texts)"""
+    words = WORD_PATTERN.findall(text.lower())
+    if len(words) < 2:
+        return set(words)
+    return {f"{a} {b}" for a, b in zip(words, words[1:])}
+
+
+def minhash_signature(text, num_bins=32):
+    """One-permutation MinHash signature of text as a list of num_bins ints.
+
+    Uses Python's string hash, which is salted per process, so signatures are
+    only comparable within one run; they are never written to disk.
+    """
+    bins = [None] * num_bins
+    for shingle in shingles(text):
+        h = hash(shingle) & HASH_MASK
+        slot, value = h % num_bins, h // num_bins
+        if bins[slot] is None or value < bins[slot]:
+            bins[slot] = value
+    if all(b is None for b in bins):
+        return None
+    # Rotation densification: an empty bin borrows from the next filled one
+    for slot in range(num_bins):
+        if bins[slot] is None:
+            distance = 1
+            while bins[(slot + distance) % num_bins] is None:
+                distance += 1
+            bins[slot] = ~((distance << 40) ^ bins[(slot + distance) % num_bins]) & HASH_MASK
+    return bins
+
+
+class DuplicateDetector:
+    """LSH index of review signatures for near-duplicate lookups"""
+
+    def __init__(self, threshold=0.8, num_bins=32, bands=8, by_student=True):
+        if num_bins % bands:
+            raise ValueError("num_bins must be a multiple of bands")
+        self.threshold = threshold
+        self.num_bins = num_bins
+        self.bands = bands
+        self.rows = num_bins // bands
+        self.by_student = by_student
+        self.review_ids = []
+        # Low 32 bits of each bin are plenty to compare; zeros for reviews without text
+        self.signatures = array('I')
+        self.band_hashes = array('q')
+        # student_id -> docs, or band hash -> docs across all students
+        self.buckets = {}
+
+    def __len__(self):
+        return len(self.review_ids)
+
+    def _band_hashes(self, signature):
+        rows = self.rows
+        return [hash((band, *signature[band * rows:(band + 1) * rows])) for band in range(self.bands)]
+
+    def _candidates(self, review, bands):
+        if not self.by_student:
+            docs = set()
+            for band_hash in bands:
+                docs.update(self.buckets.get(band_hash, ()))
+            return docs
+        docs = []
+        for doc in self.buckets.get(review.get('student_id'), ()):
+            stored = self.band_hashes[doc * self.bands:(doc + 1) * self.bands]
+            if any(a == b for a, b in zip(bands, stored)):
+                docs.append(doc)
+        return docs
+
+    def similarity(self, signature, doc):
+        """Estimated Jaccard similarity between a signature and indexed review `doc`"""
+        stored = self.signatures[doc * self.num_bins:(doc + 1) * self.num_bins]
+        return sum((a & 0xFFFFFFFF) == b for a, b in zip(signature, stored)) / self.num_bins
+
+    def _matches(self, review, signature, bands):
+        matches = []
+        for doc in self._candidates(review, bands):
+            score = self.similarity(signature, doc)
+            if score >= self.threshold:
+                matches.append((self.review_ids[doc], score))
+        matches.sort(key=lambda match: match[1], reverse=True)
+        return matches
+
+    def check(self, review):
+        """(review_id, similarity) of indexed near-duplicates of review, most similar first"""
+        signature = minhash_signature(review.get('review_text', ''), self.num_bins)
+        if signature is None:
+            return []
+        return self._matches(review, signature, self._band_hashes(signature))
+
+    def add(self, review):
+        """Index a review and return its near-duplicates among those indexed before it"""
+        signature = minhash_signature(review.get('review_text', ''), self.num_bins)
+        doc = len(self.review_ids)
+        self.review_ids.append(review.get('id'))
+        if signature is None:
+            self.signatures.extend([0] * self.num_bins)
+            self.band_hashes.extend([0] * self.bands)
+            return []
+        bands = self._band_hashes(signature)
+        matches = self._matches(review, signature, bands)
+        self.signatures.extend(value & 0xFFFFFFFF for value in signature)
+        self.band_hashes.extend(bands)
+        if self.by_student:
+            self.buckets.setdefault(review.get('student_id'), []).append(doc)
+        else:
+            for band_hash in bands:
+                self.buckets.setdefault(band_hash, []).append(doc)
+        return matches
+
+
+def find_duplicate_clusters(reviews, threshold=0.8, by_student=True):
+    """Group near-duplicate reviews; returns lists of review IDs, largest cluster first"""
+    detector = DuplicateDetector(threshold=threshold, by_student=by_student)
+    parent = {}
+
+    def root(review_id):
+        while parent[review_id] != review_id:
+            parent[review_id] = parent[parent[review_id]]
+            review_id = parent[review_id]
+        return review_id
+
+    for review in reviews:
+        review_id = review.get('id')
+        parent[review_id] = review_id
+        for other_id, _ in detector.add(review):
+            parent[root(other_id)] = root(review_id)
+
+    clusters = {}
+    for review_id in parent:
+        clusters.setdefault(root(review_id), []).append(review_id)
+    return sorted((ids for ids in clusters.values() if len(ids) > 1), key=len, reverse=True)
+
+
+def main(argv=None):
+    from review_store import open_store
+
+    parser = argparse.ArgumentParser(description="Flag clusters of near-duplicate reviews")
+    parser.add_argument('--storage', choices=['journal', 'shared', 'columnar', 'sqlite', 'json'],
+                        default='journal')
+    parser.add_argument('--data-file', default="teacher_reviews.json")
+    parser.add_argument('--db-file', default="teacher_reviews.db")
+    parser.add_argument('--threshold', type=float, default=0.8)
+    parser.add_argument('--any-student', action='store_true',
+                        help="also match reviews written by different students")
+    args = parser.parse_args(argv)
+
+    store = open_store(args.storage, args.data_file, args.db_file)
+    store.load()
+    try:
+        clusters = find_duplicate_clusters(store.iter_reviews(), args.threshold,
+                                           by_student=not args.any_student)
+        for ids in clusters:
+            reviews = store.get_many(ids)
+            sample = reviews[ids[0]]
+            teachers = sorted({reviews[i]['teacher_name'] for i in ids})
+            print(f"{len(ids)} reviews, teachers: {', '.join(teachers)}")
+            print(f"    \"{sample['review_text'][:80]}\"")
+            print(f"    {' '.join(ids)}")
+        print(f"{len(clusters)} near-duplicate clusters, "
+              f"{sum(len(ids) for ids in clusters)} reviews flagged")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
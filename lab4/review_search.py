@@ -0,0 +1,141 @@
+"""
+Inverted full-text index over reviews.
+
+review_text, teacher_name and subject are tokenized (lowercase alphanumeric
+words, stopwords dropped) into posting lists of document numbers. Documents are
+numbered in store order, so posting lists stay sorted and the index can catch
+up with reviews written since it was last saved by reading the store from
+`len(index)` onwards. Department and rating are kept per document for filters.
+
+The index is saved as JSON next to the review store (e.g. teacher_reviews.json.index)
+when the app closes, never while reviews are being submitted. It is only a cache:
+after a crash, catch_up re-indexes whatever the saved copy is missing.
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset("""
+a about above after again all also am an and any are as at be because been
+before being below between both but by can could did do does doing down during
+each few for from further had has have having he her here hers him his how i if
+in into is it its itself just me more most my no nor not now of off on once only
+or other our ours out over own same she should so some such than that the their
+theirs them then there these they this those through to too under until up very
+was we were what when where which while who whom why will with would you your
+""".split())
+
+
+def tokenize(text):
+    """Lowercase word tokens with stopwords and single characters removed"""
+    return [t for t in TOKEN_PATTERN.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+class ReviewIndex:
+    """Term -> sorted document numbers, plus per-document filter columns"""
+
+    def __init__(self, index_file=None):
+        self.index_file = Path(index_file) if index_file else None
+        self.clear()
+        self.unsaved = 0
+
+    def clear(self):
+        self.postings = {}
+        self.review_ids = []
+        self.departments = []
+        self.ratings = []
+        # An emptied index no longer matches the saved copy
+        self.unsaved = 1
+
+    def __len__(self):
+        return len(self.review_ids)
+
+    def add(self, review):
+        """Index one review; it must be the next one in store order"""
+        doc = len(self.review_ids)
+        self.review_ids.append(review['id'])
+        self.departments.append(review['department'])
+        self.ratings.append(review['rating'])
+        text = ' '.join((review['review_text'], review['teacher_name'], review['subject']))
+        for term in set(tokenize(text)):
+            self.postings.setdefault(term, []).append(doc)
+        self.unsaved += 1
+
+    def catch_up(self, store):
+        """Index reviews the store holds beyond what this index has seen (caller saves)"""
+        added = 0
+        for review in store.iter_reviews(start=len(self)):
+            self.add(review)
+            added += 1
+        return added
+
+    def search(self, query="", department=None, min_rating=None, max_rating=None, limit=100):
+        """(IDs of the newest `limit` matches, total number of matches) for the query terms and filters"""
+        terms = set(tokenize(query))
+        if terms:
+            lists = sorted((self.postings.get(t, []) for t in terms), key=len)
+            if not lists[0]:
+                return [], 0
+            candidates = set(lists[0])
+            for docs in lists[1:]:
+                candidates.intersection_update(docs)
+                if not candidates:
+                    return [], 0
+            docs = sorted(candidates, reverse=True)
+        elif query.strip():
+            # Only stopwords were typed
+            return [], 0
+        elif not department and min_rating is None and max_rating is None:
+            return self.review_ids[:-limit - 1:-1] if limit else [], len(self.review_ids)
+        else:
+            docs = range(len(self.review_ids) - 1, -1, -1)
+
+        results = []
+        total = 0
+        for doc in docs:
+            if department and self.departments[doc] != department:
+                continue
+            rating = self.ratings[doc]
+            if min_rating is not None and rating < min_rating:
+                continue
+            if max_rating is not None and rating > max_rating:
+                continue
+            total += 1
+            if len(results) < limit:
+                results.append(self.review_ids[doc])
+        return results, total
+
+    def load(self):
+        """Load a saved index; returns False when there is none or it is unreadable"""
+        self.clear()
+        if not self.index_file or not self.index_file.exists():
+            return False
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.review_ids = data['review_ids']
+            self.departments = data['departments']
+            self.ratings = data['ratings']
+            self.postings = data['postings']
+        except (ValueError, KeyError):
+            self.clear()
+            return False
+        self.unsaved = 0
+        return True
+
+    def save(self):
+        """Write the index atomically next to the review store, if anything changed"""
+        if not self.index_file or not self.unsaved:
+            return
+        tmp_file = self.index_file.with_name(self.index_file.name + '.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'review_ids': self.review_ids,
+                       'departments': self.departments,
+                       'ratings': self.ratings,
+                       'postings': self.postings}, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_file, self.index_file)
+        self.unsaved = 0
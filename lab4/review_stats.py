@@ -0,0 +1,134 @@
+"""
+Running review aggregates for the Teacher Review System.
+
+Counts, rating sums and a rating histogram are kept per department, teacher
+and subject, along with a lazily pruned heap per rollup for the current leader.
+Adding a review is O(log n) at worst; a full rebuild only happens on load or
+when a reindex is requested. RecentReviews keeps the bounded window shown in
+the side panel.
+"""
+
+import datetime
+import heapq
+from collections import deque
+
+RATINGS = (1, 2, 3, 4, 5)
+
+
+class Rollup:
+    """Count and rating sum for one department, teacher or subject"""
+
+    __slots__ = ('count', 'rating_sum')
+
+    def __init__(self):
+        self.count = 0
+        self.rating_sum = 0
+
+    @property
+    def average(self):
+        return self.rating_sum / self.count if self.count else 0
+
+
+class ReviewStatistics:
+    """Incrementally maintained review statistics"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.total_reviews = 0
+        self.rating_sum = 0
+        self.rating_histogram = {rating: 0 for rating in RATINGS}
+        self.departments = {}
+        self.teachers = {}
+        self.subjects = {}
+        # (-average, -count, name) per change; entries whose count is out of date are stale
+        self.rankings = {'departments': [], 'teachers': [], 'subjects': []}
+        self.last_updated = None
+
+    def add_group(self, department, teacher_name, subject, rating, count=1):
+        """Fold `count` reviews sharing the same keys and rating into the totals"""
+        self.total_reviews += count
+        self.rating_sum += rating * count
+        self.rating_histogram[rating] = self.rating_histogram.get(rating, 0) + count
+        for kind, key in (('departments', department), ('teachers', teacher_name), ('subjects', subject)):
+            rollups = getattr(self, kind)
+            rollup = rollups.get(key)
+            if rollup is None:
+                rollup = rollups[key] = Rollup()
+            rollup.count += count
+            rollup.rating_sum += rating * count
+            ranking = self.rankings[kind]
+            heapq.heappush(ranking, (-rollup.average, -rollup.count, key))
+            if len(ranking) > 2 * len(rollups) + 16:
+                # Drop the stale entries once they outnumber the live ones
+                ranking[:] = [(-r.average, -r.count, name) for name, r in rollups.items()]
+                heapq.heapify(ranking)
+        self.last_updated = datetime.datetime.now()
+
+    def add(self, review):
+        """Account for one newly submitted review"""
+        self.add_group(review['department'], review['teacher_name'],
+                       review['subject'], review['rating'])
+
+    def rebuild(self, groups):
+        """Recompute from (department, teacher, subject, rating, count) groups"""
+        self.reset()
+        for department, teacher_name, subject, rating, count in groups:
+            self.add_group(department, teacher_name, subject, rating, count)
+        return self
+
+    @property
+    def average_rating(self):
+        return self.rating_sum / self.total_reviews if self.total_reviews else 0
+
+    def leader(self, kind):
+        """Highest-average (name, Rollup) of 'departments', 'teachers' or 'subjects', or None"""
+        rollups, ranking = getattr(self, kind), self.rankings[kind]
+        while ranking:
+            _, count, name = ranking[0]
+            rollup = rollups[name]
+            if rollup.count == -count:
+                return name, rollup
+            heapq.heappop(ranking)
+        return None
+
+    def as_dict(self):
+        """Statistics in the shape stored in teacher_reviews.json"""
+        if not self.total_reviews:
+            return {}
+        return {
+            'total_reviews': self.total_reviews,
+            'average_rating': round(self.average_rating, 2),
+            'department_breakdown': {name: r.count for name, r in self.departments.items()},
+            'rating_histogram': {str(rating): n for rating, n in self.rating_histogram.items()},
+            'teacher_averages': {name: round(r.average, 2) for name, r in self.teachers.items()},
+            'subject_averages': {name: round(r.average, 2) for name, r in self.subjects.items()},
+            'last_updated': (self.last_updated or datetime.datetime.now()).isoformat()
+        }
+
+
+class RecentReviews:
+    """Bounded newest-first window of recent reviews.
+
+    push() is O(1) and returns the item that fell off the end (or None), so a
+    view can apply just that insertion and eviction.
+    """
+
+    def __init__(self, limit=20):
+        self.limit = limit
+        self.items = deque(maxlen=limit)
+
+    def push(self, item):
+        evicted = self.items[-1] if len(self.items) == self.limit else None
+        self.items.appendleft(item)
+        return evicted
+
+    def clear(self):
+        self.items.clear()
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
@@ -0,0 +1,783 @@
+"""
+Storage backends for the Teacher Review System.
+
+JsonReviewStore    - whole-file JSON (original behaviour, rewrites on every save)
+JournalReviewStore - JSON snapshot plus an append-only JSON-lines journal
+ColumnarReviewStore - memory-mapped columnar snapshot (.rvc) plus a journal
+SharedJournalReviewStore - journal shared by several kiosks under a file lock
+SqliteReviewStore  - SQLite table indexed on teacher, department, subject, timestamp
+
+All backends share the same small interface: load(), add(review), add_many(),
+refresh(), save(), sync(), count(), recent(limit), rating_groups(),
+statistics(), iter_reviews(start) and get_many(ids). Reviews are append-only
+and iterate in insertion order. add_many() and refresh() return every review
+that became visible, in store order, including ones written by other kiosks.
+Writes reach the OS immediately; sync() forces them to disk.
+"""
+
+import argparse
+import heapq
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from itertools import islice
+from pathlib import Path
+
+from review_columns import ReviewColumns, encode_review_columns, save_review_columns, write_review_columns
+from review_stats import ReviewStatistics
+
+REVIEW_FIELDS = ('id', 'student_id', 'student_name', 'department', 'teacher_name',
+                 'subject', 'rating', 'review_text', 'anonymous', 'timestamp', 'ip_hash')
+# Reviews decoded per lock hold while iterating a columnar store
+READ_CHUNK = 200
+
+
+CROCKFORD_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+_id_lock = threading.Lock()
+_last_id = [0, 0]
+
+try:
+    import fcntl
+except ImportError:  # Windows lab machines
+    fcntl = None
+    import msvcrt
+
+
+
+def empty_reviews_data():
+    """Return a fresh, empty reviews document"""
+    return {"reviews": [], "statistics": {}}
+
+
+def new_review_id():
+    """ULID-style review ID: 48-bit millisecond time + 80 random bits.
+
+    IDs from different kiosks do not collide, sort by creation time, and are
+    strictly increasing within a process even inside one millisecond.
+    """
+    with _id_lock:
+        millis = time.time_ns() // 1_000_000
+        last_millis, last_random = _last_id
+        if millis <= last_millis:
+            millis, random_part = last_millis, last_random + 1
+            if random_part >= 1 << 80:
+                millis, random_part = millis + 1, int.from_bytes(os.urandom(10), 'big')
+        else:
+            random_part = int.from_bytes(os.urandom(10), 'big')
+        _last_id[:] = [millis, random_part]
+    value = (millis << 80) | random_part
+    chars = []
+    for _ in range(26):
+        chars.append(CROCKFORD_ALPHABET[value & 31])
+        value >>= 5
+    return "REV_" + ''.join(reversed(chars))
+
+
+class FileLock:
+    """Exclusive advisory lock on a side file, usable as a context manager"""
+
+    def __init__(self, lock_file):
+        self.lock_file = Path(lock_file)
+        self.handle = None
+
+    def __enter__(self):
+        self.handle = open(self.lock_file, 'a+b')
+        if fcntl is not None:
+            fcntl.flock(self.handle.fileno(), fcntl.LOCK_EX)
+        else:
+            self.handle.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(self.handle.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK gives up after ~10 s of contention; keep waiting
+                    continue
+        return self
+
+    def __exit__(self, *exc):
+        if fcntl is not None:
+            fcntl.flock(self.handle.fileno(), fcntl.LOCK_UN)
+        else:
+            self.handle.seek(0)
+            msvcrt.locking(self.handle.fileno(), msvcrt.LK_UNLCK, 1)
+        self.handle.close()
+        self.handle = None
+
+
+class JsonReviewStore:
+    """Keep every review in one indented JSON file"""
+
+    def __init__(self, data_file):
+        self.data_file = Path(data_file)
+        self.data = empty_reviews_data()
+        self.by_id = None
+
+    def load(self):
+        """Load the JSON document, returning the shared reviews dict"""
+        if self.data_file.exists():
+            with open(self.data_file, 'r', encoding='utf-8') as f:
+                self.data = json.load(f)
+        self.data.setdefault('reviews', [])
+        self.data.setdefault('statistics', {})
+        self.by_id = None
+        return self.data
+
+    def add(self, review):
+        """Add a review and persist it"""
+        self.add_many([review])
+
+    def add_many(self, reviews):
+        """Add a batch of reviews with a single persist; returns the reviews added"""
+        reviews = list(reviews)
+        self.extend(reviews)
+        try:
+            self.append_many(reviews)
+        except Exception:
+            # Keep memory consistent with disk so a retry does not duplicate
+            del self.data['reviews'][-len(reviews):]
+            self.by_id = None
+            raise
+        return reviews
+
+    def extend(self, reviews):
+        """Add already-persisted reviews to the in-memory copy"""
+        self.data['reviews'].extend(reviews)
+        if self.by_id is not None:
+            self.by_id.update((r.get('id'), r) for r in reviews)
+
+    def refresh(self):
+        """A single-writer file has nothing new from elsewhere"""
+        return []
+
+    def append_many(self, reviews):
+        """Persist reviews already added to self.data"""
+        self.save()
+
+    def save(self):
+        """Rewrite the whole document atomically"""
+        self.data['statistics'] = self.statistics()
+        tmp_file = self.data_file.with_name(self.data_file.name + '.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.data_file)
+
+    def sync(self):
+        """save() already fsyncs the snapshot"""
+
+    def close(self):
+        """Nothing to release for whole-file stores"""
+
+    def count(self):
+        return len(self.data['reviews'])
+
+    def iter_reviews(self, start=0):
+        return islice(self.data['reviews'], start, None)
+
+    def get_many(self, ids):
+        """Map of id -> review for the ids that exist"""
+        if self.by_id is None:
+            self.by_id = {r.get('id'): r for r in self.data['reviews']}
+        return {i: self.by_id[i] for i in ids if i in self.by_id}
+
+    def recent(self, limit=20):
+        """Newest reviews first"""
+        return heapq.nlargest(limit, self.data['reviews'], key=lambda r: r['timestamp'])
+
+    def rating_groups(self):
+        """(department, teacher, subject, rating, count) for every distinct combination"""
+        groups = Counter((r['department'], r['teacher_name'], r['subject'], r['rating'])
+                         for r in self.data['reviews'])
+        return [(*key, count) for key, count in groups.items()]
+
+    def statistics(self):
+        """Full statistics rebuilt from scratch"""
+        return ReviewStatistics().rebuild(self.rating_groups()).as_dict()
+
+
+class JournalReviewStore(JsonReviewStore):
+    """JSON snapshot plus one appended JSON line per submitted review.
+
+    Each submit costs a single small write. Once the journal holds at least
+    `compact_every` reviews, and at least as many as the snapshot, it is folded
+    into the snapshot and truncated, keeping bulk loads linear overall. On load
+    the snapshot is read and the journal replayed on top of it.
+    """
+
+    def __init__(self, data_file, compact_every=500):
+        super().__init__(data_file)
+        self.journal_file = self.data_file.with_suffix('.journal')
+        self.compact_every = compact_every
+        self.pending = 0
+        self.journal = None
+
+    def load(self):
+        """Load the snapshot and replay any journaled reviews"""
+        super().load()
+        reviews = self.data['reviews']
+        known_ids = {r.get('id') for r in reviews}
+        self.pending = 0
+        for review in self.read_journal():
+            self.pending += 1
+            # Already folded in by a compaction that crashed before truncating
+            if review.get('id') in known_ids:
+                continue
+            reviews.append(review)
+            known_ids.add(review.get('id'))
+        return self.data
+
+    def read_journal(self):
+        """Yield the journaled reviews, stopping at a torn final line"""
+        if not self.journal_file.exists():
+            return
+        with open(self.journal_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    review = json.loads(line)
+                except ValueError:
+                    # Torn final line from a crash mid-write
+                    break
+                if 'id' not in review:
+                    # Generation header written by the shared store
+                    continue
+                yield review
+
+    def append_many(self, reviews):
+        """Append a batch of reviews to the journal in one write, compacting when large"""
+        lines = ''.join(json.dumps(r, ensure_ascii=False) + '\n' for r in reviews)
+        if self.journal is None:
+            self.journal = open(self.journal_file, 'a', encoding='utf-8')
+        self.journal.write(lines)
+        self.journal.flush()
+        self.pending += len(reviews)
+        if self.should_compact():
+            self.compact()
+
+    def should_compact(self):
+        """True once the journal holds compact_every reviews and at least as many as the snapshot.
+
+        A compaction rewrites the whole snapshot, so compacting every
+        compact_every appends would make a bulk load quadratic. Letting the
+        journal grow with the snapshot keeps the total rewrite work linear.
+        """
+        return self.pending >= max(self.compact_every, self.count() - self.pending)
+
+    def save(self):
+        """Full save is a compaction in journal mode"""
+        self.compact()
+
+    def sync(self):
+        """fsync the journal"""
+        if self.journal is not None:
+            os.fsync(self.journal.fileno())
+
+    def close(self):
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
+
+    def compact(self):
+        """Fold the journal into the snapshot and truncate it"""
+        super().save()
+        self.close()
+        if self.journal_file.exists():
+            self.journal_file.unlink()
+        self.pending = 0
+
+
+class ColumnarReviewStore(JournalReviewStore):
+    """Columnar snapshot (teacher_reviews.rvc) plus a JSON-lines journal.
+
+    The snapshot is memory-mapped on load and decoded only where a review is
+    actually read (see review_columns), so startup no longer grows with the
+    history. self.data['reviews'] holds just the journaled tail.
+
+    Compaction runs on the writer thread while the Tk thread reads, so readers
+    and the snapshot swap share a lock. iter_reviews takes it for one chunk at
+    a time; a compaction keeps every review at its position, so an iteration
+    carries on from the new snapshot.
+    """
+
+    def __init__(self, data_file, compact_every=500):
+        super().__init__(data_file, compact_every)
+        self.columns_file = self.data_file.with_suffix('.rvc')
+        self.journal_file = self.columns_file.with_name(self.columns_file.name + '.journal')
+        self.columns = None
+        self.lock = threading.RLock()
+
+    def load(self):
+        """Map the snapshot and replay any journaled reviews"""
+        self.close()
+        self.data = empty_reviews_data()
+        self.by_id = None
+        if self.columns_file.exists():
+            self.columns = ReviewColumns(self.columns_file)
+        self.pending = 0
+        for review in self.read_journal():
+            self.pending += 1
+            # Already folded in by a compaction that crashed before truncating
+            if self.get_many([review.get('id')]):
+                continue
+            self.extend([review])
+        return self.data
+
+    def snapshot_count(self):
+        return len(self.columns) if self.columns is not None else 0
+
+    def count(self):
+        with self.lock:
+            return self.snapshot_count() + len(self.data['reviews'])
+
+    def iter_reviews(self, start=0):
+        position = start
+        while True:
+            with self.lock:
+                snapshot_count = self.snapshot_count()
+                if position < snapshot_count:
+                    chunk = list(islice(self.columns.reviews(position), READ_CHUNK))
+                else:
+                    tail_start = position - snapshot_count
+                    chunk = self.data['reviews'][tail_start:tail_start + READ_CHUNK]
+            if not chunk:
+                return
+            yield from chunk
+            position += len(chunk)
+
+    def get_many(self, ids):
+        ids = list(ids)
+        with self.lock:
+            found = JsonReviewStore.get_many(self, ids)
+            if self.columns is not None:
+                for review_id in ids:
+                    if review_id not in found:
+                        position = self.columns.find(review_id)
+                        if position is not None:
+                            found[review_id] = self.columns.review(position)
+        return found
+
+    def recent(self, limit=20):
+        """Newest reviews first, decoding only `limit` snapshot rows"""
+        with self.lock:
+            candidates = list(self.data['reviews'])
+            if self.columns is not None:
+                candidates.extend(self.columns.review(i) for i in self.columns.newest(limit))
+        return heapq.nlargest(limit, candidates, key=lambda r: r['timestamp'])
+
+    def rating_groups(self):
+        """Snapshot groups from the file header plus the journaled tail"""
+        with self.lock:
+            if self.columns is not None and not self.data['reviews']:
+                return self.columns.rating_groups()
+            groups = Counter()
+            if self.columns is not None:
+                for *key, count in self.columns.rating_groups():
+                    groups[tuple(key)] += count
+            for *key, count in JsonReviewStore.rating_groups(self):
+                groups[tuple(key)] += count
+        return [(*key, count) for key, count in groups.items()]
+
+    def compact(self):
+        """Fold the journal into a new columnar snapshot"""
+        # Encoding reads chunk by chunk, so readers keep going meanwhile
+        encoded = encode_review_columns(self.iter_reviews())
+        with self.lock:
+            # The old snapshot must be unmapped before it can be replaced on Windows
+            self.close()
+            save_review_columns(self.columns_file, encoded)
+            if self.journal_file.exists():
+                self.journal_file.unlink()
+            self.columns = ReviewColumns(self.columns_file)
+            self.data['reviews'] = []
+            self.by_id = None
+            self.pending = 0
+
+    def close(self):
+        with self.lock:
+            super().close()
+            if self.columns is not None:
+                self.columns.close()
+                self.columns = None
+
+    def import_json(self, json_file):
+        """Import reviews from a JSON snapshot (and its journal); safe to re-run"""
+        source = JournalReviewStore(json_file)
+        source.load()
+        reviews = source.data['reviews']
+        existing = self.get_many(r.get('id') for r in reviews)
+        new_reviews = [r for r in reviews if r.get('id') not in existing]
+        if new_reviews:
+            self.data['reviews'].extend(new_reviews)
+            self.compact()
+        return len(new_reviews)
+
+
+class SharedJournalReviewStore(JournalReviewStore):
+    """Journal store that several kiosks can write to at the same time.
+
+    Every append happens under an exclusive lock on teacher_reviews.lock. Before
+    appending, an instance reads whatever other kiosks appended since its last
+    visit, so each copy sees the reviews in exactly the order of the file. The
+    journal starts with a {"generation": n} header matching the snapshot. A
+    compaction bumps the generation, and the other kiosks then pick up the
+    reviews they have not seen yet from the new snapshot. The lock is advisory
+    (flock / msvcrt), so the shared folder must support file locking.
+    """
+
+    def __init__(self, data_file, compact_every=500):
+        super().__init__(data_file, compact_every)
+        self.lock = FileLock(self.data_file.with_suffix('.lock'))
+        self.generation = 0
+        self.offset = 0
+        # Other kiosks' reviews read before a failed append, handed out by refresh()
+        self.unreported = []
+
+    def load(self):
+        """Load snapshot plus journal under the lock"""
+        with self.lock:
+            JsonReviewStore.load(self)
+            self.generation = self.data.get('generation', 0)
+            self.pending = 0
+            self.offset = 0
+            self._catch_up()
+        return self.data
+
+    def _header_generation(self, line):
+        try:
+            header = json.loads(line)
+        except ValueError:
+            return None
+        if not isinstance(header, dict) or 'id' in header:
+            return None
+        return header.get('generation')
+
+    def _catch_up(self):
+        """Take in reviews other kiosks wrote since the last visit (lock held)"""
+        if not self.journal_file.exists():
+            return []
+        new_reviews = []
+        with open(self.journal_file, 'rb') as f:
+            generation = self._header_generation(f.readline())
+            header_end = f.tell() if generation is not None else 0
+            if generation != self.generation and self.data_file.exists():
+                with open(self.data_file, 'r', encoding='utf-8') as snapshot_file:
+                    snapshot = json.load(snapshot_file)
+                if snapshot.get('generation', 0) > self.generation:
+                    # Another kiosk compacted; its snapshot extends our copy
+                    new_reviews = snapshot['reviews'][len(self.data['reviews']):]
+                    self.generation = snapshot['generation']
+                    self.pending = 0
+                    self.offset = header_end
+            # Journal from the single-writer store, or from a compaction that
+            # died before resetting it: fold in whatever is not known yet
+            stale = generation != self.generation
+            known_ids = {r.get('id') for r in self.data['reviews']} if stale else None
+            if not stale:
+                self.offset = max(self.offset, header_end)
+            f.seek(header_end if stale else self.offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    # Torn final line from a crash mid-write
+                    break
+                review = json.loads(line)
+                if stale:
+                    if review.get('id') in known_ids:
+                        continue
+                    known_ids.add(review.get('id'))
+                else:
+                    self.offset += len(line)
+                    self.pending += 1
+                new_reviews.append(review)
+        self.extend(new_reviews)
+        if stale:
+            self._compact_locked()
+        return new_reviews
+
+    def add_many(self, reviews):
+        """Append under the lock; returns other kiosks' new reviews followed by ours"""
+        reviews = list(reviews)
+        with self.lock:
+            visible = self.unreported + self._catch_up()
+            self.unreported = []
+            lines = b''.join(json.dumps(r, ensure_ascii=False).encode('utf-8') + b'\n'
+                             for r in reviews)
+            try:
+                if not self.journal_file.exists():
+                    self._reset_journal()
+                with open(self.journal_file, 'ab') as f:
+                    f.write(lines)
+            except Exception:
+                self.unreported = visible
+                raise
+            self.offset += len(lines)
+            self.pending += len(reviews)
+            self.extend(reviews)
+            if self.should_compact():
+                self._compact_locked()
+        return visible + reviews
+
+    def refresh(self):
+        """Reviews other kiosks appended since the last visit"""
+        with self.lock:
+            visible = self.unreported + self._catch_up()
+            self.unreported = []
+            return visible
+
+    def sync(self):
+        """fsync the journal"""
+        if self.journal_file.exists():
+            with open(self.journal_file, 'ab') as f:
+                os.fsync(f.fileno())
+
+    def compact(self):
+        """Fold the shared journal into a new snapshot generation"""
+        with self.lock:
+            self._catch_up()
+            self._compact_locked()
+
+    def _compact_locked(self):
+        self.generation += 1
+        self.data['generation'] = self.generation
+        JsonReviewStore.save(self)
+        self._reset_journal()
+        self.pending = 0
+
+    def _reset_journal(self):
+        """Replace the journal with just the header for the current generation"""
+        header = json.dumps({'generation': self.generation}).encode('utf-8') + b'\n'
+        tmp_file = self.journal_file.with_name(self.journal_file.name + '.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(header)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.journal_file)
+        self.offset = len(header)
+
+
+class SqliteReviewStore:
+    """Reviews in an indexed SQLite table; nothing is loaded up front"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS reviews (
+            id TEXT PRIMARY KEY,
+            student_id TEXT NOT NULL,
+            student_name TEXT,
+            department TEXT NOT NULL,
+            teacher_name TEXT NOT NULL,
+            subject TEXT NOT NULL,
+            rating INTEGER NOT NULL,
+            review_text TEXT NOT NULL,
+            anonymous INTEGER NOT NULL DEFAULT 0,
+            timestamp TEXT NOT NULL,
+            ip_hash TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_reviews_timestamp ON reviews (timestamp);
+        -- Covers rating_groups(), so its GROUP BY never touches the table
+        CREATE INDEX IF NOT EXISTS idx_reviews_groups ON reviews (department, teacher_name, subject, rating);
+        DROP INDEX IF EXISTS idx_reviews_teacher;
+        DROP INDEX IF EXISTS idx_reviews_department;
+        DROP INDEX IF EXISTS idx_reviews_subject;
+    """
+
+    def __init__(self, db_file):
+        self.db_file = Path(db_file)
+        self.conn = None
+        self.last_rowid = 0
+
+    def load(self):
+        """Open the database and make sure the schema exists"""
+        if self.conn is None:
+            self.conn = sqlite3.connect(str(self.db_file), check_same_thread=False)
+            self.conn.row_factory = sqlite3.Row
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.executescript(self.SCHEMA)
+            self.last_rowid = self.conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM reviews").fetchone()[0]
+        return self
+
+    def add(self, review):
+        """Insert one review"""
+        self.add_many([review])
+
+    def add_many(self, reviews, ignore_existing=False, return_new=True):
+        """Insert reviews in a single transaction; returns every row new since the last visit.
+
+        Other kiosks sharing the database may have inserted rows in between, so
+        the result is read back in rowid order rather than echoing `reviews`.
+        """
+        verb = "INSERT OR IGNORE" if ignore_existing else "INSERT"
+        sql = (f"{verb} INTO reviews ({', '.join(REVIEW_FIELDS)}) "
+               f"VALUES ({', '.join('?' * len(REVIEW_FIELDS))})")
+        with self.conn:
+            self.conn.executemany(sql, (tuple(r.get(k) for k in REVIEW_FIELDS) for r in reviews))
+            if not return_new:
+                self.last_rowid = self.conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM reviews").fetchone()[0]
+                return []
+            return self.refresh()
+
+    def refresh(self):
+        """Rows inserted (by any kiosk) since the last visit, in insertion order"""
+        rows = self.conn.execute(
+            f"SELECT rowid, {', '.join(REVIEW_FIELDS)} FROM reviews WHERE rowid > ? ORDER BY rowid",
+            (self.last_rowid,)).fetchall()
+        if rows:
+            self.last_rowid = rows[-1]['rowid']
+        return [self._to_review(row) for row in rows]
+
+    def save(self):
+        """Every insert is already committed"""
+
+    def sync(self):
+        """Checkpoint the WAL, which fsyncs everything committed so far"""
+        self.conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM reviews").fetchone()[0]
+
+    def _to_review(self, row):
+        review = dict(row)
+        review.pop('rowid', None)
+        review['anonymous'] = bool(review['anonymous'])
+        return review
+
+    def iter_reviews(self, start=0):
+        cursor = self.conn.execute(
+            f"SELECT {', '.join(REVIEW_FIELDS)} FROM reviews ORDER BY rowid LIMIT -1 OFFSET ?",
+            (start,))
+        return (self._to_review(row) for row in cursor)
+
+    def get_many(self, ids):
+        """Map of id -> review for the ids that exist, via the primary key"""
+        found = {}
+        ids = list(ids)
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT {', '.join(REVIEW_FIELDS)} FROM reviews "
+                f"WHERE id IN ({', '.join('?' * len(chunk))})", chunk)
+            for row in rows:
+                found[row['id']] = self._to_review(row)
+        return found
+
+    def recent(self, limit=20):
+        """Newest reviews first, served from the timestamp index"""
+        rows = self.conn.execute(
+            f"SELECT {', '.join(REVIEW_FIELDS)} FROM reviews ORDER BY timestamp DESC LIMIT ?",
+            (limit,))
+        return [self._to_review(row) for row in rows]
+
+    def rating_groups(self):
+        """Aggregated in SQL from the covering index, so only distinct combinations reach Python"""
+        return self.conn.execute(
+            "SELECT department, teacher_name, subject, rating, COUNT(*) FROM reviews "
+            "GROUP BY department, teacher_name, subject, rating").fetchall()
+
+    def statistics(self):
+        """Full statistics rebuilt from scratch"""
+        return ReviewStatistics().rebuild(self.rating_groups()).as_dict()
+
+    def import_json(self, json_file):
+        """Import reviews from a JSON snapshot (and its journal); safe to re-run"""
+        source = JournalReviewStore(json_file)
+        source.load()
+        before = self.count()
+        self.add_many(source.iter_reviews(), ignore_existing=True, return_new=False)
+        return self.count() - before
+
+
+def open_store(storage_mode, data_file="teacher_reviews.json", db_file="teacher_reviews.db"):
+    """Create (but do not load) the backend for a storage mode"""
+    if storage_mode == "sqlite":
+        return SqliteReviewStore(db_file)
+    if storage_mode == "journal":
+        return JournalReviewStore(data_file)
+    if storage_mode == "shared":
+        return SharedJournalReviewStore(data_file)
+    if storage_mode == "columnar":
+        return ColumnarReviewStore(data_file)
+    if storage_mode == "json":
+        return JsonReviewStore(data_file)
+    raise ValueError(f"Unknown storage mode: {storage_mode}")
+
+
+def migrate_json_to_sqlite(json_file, db_file):
+    """Copy an existing teacher_reviews.json into a SQLite store"""
+    store = SqliteReviewStore(db_file).load()
+    try:
+        return store.import_json(json_file)
+    finally:
+        store.close()
+
+
+def convert_json_to_columns(json_file, columns_file=None):
+    """Write a JSON review file (and its journal) as a columnar .rvc snapshot"""
+    source = JournalReviewStore(json_file)
+    source.load()
+    columns_file = columns_file or Path(json_file).with_suffix('.rvc')
+    return write_review_columns(columns_file, source.iter_reviews())
+
+
+def merge_review_files(target_file, source_files):
+    """Fold reviews from other review files (e.g. offline kiosks) into a shared store.
+
+    Reviews already present are skipped by ID; the rest are appended oldest first.
+    Returns the number of reviews added.
+    """
+    target = SharedJournalReviewStore(target_file)
+    target.load()
+    known_ids = {r.get('id') for r in target.iter_reviews()}
+    incoming = []
+    for source_file in source_files:
+        source = JournalReviewStore(source_file)
+        source.load()
+        for review in source.iter_reviews():
+            if review.get('id') not in known_ids:
+                known_ids.add(review.get('id'))
+                incoming.append(review)
+    incoming.sort(key=lambda r: r['timestamp'])
+    if incoming:
+        target.add_many(incoming)
+    target.compact()
+    return len(incoming)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Review store maintenance")
+    commands = parser.add_subparsers(dest='command', required=True)
+    migrate = commands.add_parser('migrate', help="copy a JSON review file into SQLite")
+    migrate.add_argument('json_file')
+    migrate.add_argument('db_file')
+    convert = commands.add_parser('convert', help="write a JSON review file in the columnar format")
+    convert.add_argument('json_file')
+    convert.add_argument('columns_file', nargs='?', help="default: the JSON path with a .rvc suffix")
+    merge = commands.add_parser('merge', help="merge review files into a shared review file")
+    merge.add_argument('target')
+    merge.add_argument('sources', nargs='+')
+    args = parser.parse_args(argv)
+
+    if args.command == 'migrate':
+        imported = migrate_json_to_sqlite(args.json_file, args.db_file)
+        print(f"Imported {imported} reviews into {args.db_file}")
+    elif args.command == 'convert':
+        converted = convert_json_to_columns(args.json_file, args.columns_file)
+        print(f"Wrote {converted} reviews in columnar format")
+    else:
+        added = merge_review_files(args.target, args.sources)
+        print(f"Merged {added} new reviews into {args.target}")
+
+
+if __name__ == "__main__":
+    # python review_store.py migrate teacher_reviews.json teacher_reviews.db
+    # python review_store.py convert teacher_reviews.json teacher_reviews.rvc
+    # python review_store.py merge teacher_reviews.json kiosk2/teacher_reviews.json
+    main()
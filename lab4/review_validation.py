@@ -0,0 +1,157 @@
+"""
+Validation and hashing rules shared by the Tk form and headless tools.
+
+Malicious-content checks go through ContentScanner, which compiles the whole
+blocklist into a single trie-shaped regular expression once, so a review is
+scanned in one pass no matter how many patterns are configured. Extra patterns
+are read from blocked_patterns.txt (one per line, # for comments) next to this
+module when it exists.
+"""
+
+import hashlib
+import re
+from pathlib import Path
+
+STUDENT_ID_PATTERN = re.compile(r'^[A-Za-z0-9]+$')
+DANGEROUS_PATTERNS = ['<script', 'javascript:', 'eval(', 'exec(']
+BLOCKLIST_FILE = Path(__file__).with_name("blocked_patterns.txt")
+
+
+def _trie_regex(node):
+    """Regex source for a character trie; a terminal node ends the match"""
+    if '' in node:
+        # A blocked pattern ends here, so any longer continuation is redundant
+        return ''
+    branches, single_chars = [], []
+    for char in sorted(node):
+        tail = _trie_regex(node[char])
+        if tail:
+            branches.append(re.escape(char) + tail)
+        else:
+            single_chars.append(re.escape(char))
+    if len(single_chars) == 1:
+        branches.append(single_chars[0])
+    elif single_chars:
+        branches.append('[' + ''.join(single_chars) + ']')
+    return branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+
+
+class ContentScanner:
+    """Single-pass, case-insensitive matcher for a blocklist of literal patterns.
+
+    Very small blocklists are faster as plain substring checks, so the regex is
+    only used above `regex_threshold` patterns.
+    """
+
+    regex_threshold = 16
+
+    def __init__(self, patterns):
+        self.patterns = sorted({p.lower() for p in patterns if p.strip()})
+        trie = {}
+        for pattern in self.patterns:
+            node = trie
+            for char in pattern:
+                node = node.setdefault(char, {})
+            node[''] = {}
+        self.regex = re.compile(_trie_regex(trie)) if self.patterns else None
+        self.use_regex = len(self.patterns) > self.regex_threshold
+
+    def find(self, text):
+        """First blocked pattern found in text, or None"""
+        content = text.lower()
+        if not self.use_regex:
+            for pattern in self.patterns:
+                if pattern in content:
+                    return pattern
+            return None
+        match = self.regex.search(content)
+        return match.group() if match else None
+
+    def find_all(self, text):
+        """Every (non-overlapping) blocked pattern occurrence in text"""
+        if self.regex is None:
+            return []
+        return self.regex.findall(text.lower())
+
+    def scan_many(self, texts):
+        """Indexes of the texts that contain a blocked pattern"""
+        return [i for i, text in enumerate(texts) if self.find(text) is not None]
+
+
+def load_patterns(path=BLOCKLIST_FILE):
+    """Built-in patterns plus any configured in the blocklist file"""
+    patterns = list(DANGEROUS_PATTERNS)
+    path = Path(path)
+    if path.exists():
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    patterns.append(line)
+    return patterns
+
+
+_default_scanner = None
+
+
+def default_scanner():
+    """Scanner for the configured blocklist, built once per process"""
+    global _default_scanner
+    if _default_scanner is None:
+        _default_scanner = ContentScanner(load_patterns())
+    return _default_scanner
+
+
+def hash_sensitive_data(data):
+    """Hash sensitive data for security"""
+    return hashlib.sha256(data.encode()).hexdigest()[:16]
+
+
+def validate_review_fields(student_id, department, teacher_name, subject, review_text, rating=5,
+                           scanner=None):
+    """Return a list of validation errors for one review (empty when valid)"""
+    errors = []
+    student_id = student_id.strip()
+    teacher_name = teacher_name.strip()
+    review_body = review_text.strip()
+
+    # Required field validation
+    if not student_id:
+        errors.append("Student ID is required")
+    elif not STUDENT_ID_PATTERN.match(student_id):
+        errors.append("Student ID must contain only letters and numbers")
+
+    if not department.strip():
+        errors.append("Department is required")
+
+    if not teacher_name:
+        errors.append("Teacher name is required")
+    elif len(teacher_name) < 2:
+        errors.append("Teacher name must be at least 2 characters")
+
+    if not subject.strip():
+        errors.append("Subject is required")
+
+    if not review_body:
+        errors.append("Review comments are required")
+    elif len(review_body) < 10:
+        errors.append("Review must be at least 10 characters long")
+
+    if rating not in (1, 2, 3, 4, 5):
+        errors.append("Rating must be between 1 and 5")
+
+    # Security validation - check for malicious input
+    scanner = scanner or default_scanner()
+    if scanner.find(review_text) is not None:
+        errors.append("Invalid characters detected in review")
+
+    return errors
+
+
+def validate_reviews(reviews, scanner=None):
+    """Validate a batch of review dicts; returns one error list per review"""
+    scanner = scanner or default_scanner()
+    return [validate_review_fields(r.get('student_id', ''), r.get('department', ''),
+                                   r.get('teacher_name', ''), r.get('subject', ''),
+                                   r.get('review_text', ''), r.get('rating', 5), scanner)
+            for r in reviews]
@@ -0,0 +1,126 @@
+"""
+Background review writer with group commit.
+
+Submitted reviews are queued and written by a single worker thread. Whatever
+has piled up while the previous write was in progress goes out as one batch.
+Results are collected on a queue that the Tk thread polls with root.after, so
+the UI never waits on the disk. When the store is shared with other kiosks, the
+writer also picks up their reviews while idle, so every kiosk's display keeps up.
+
+Durability settings:
+    "review"   - write and fsync each review on its own
+    "batch"    - one write and one fsync per group of pending reviews
+    "interval" - writes reach the OS per batch, fsync at most every N seconds
+"""
+
+import queue
+import threading
+import time
+
+DURABILITY_MODES = ("review", "batch", "interval")
+
+_STOP = object()
+
+
+class ReviewWriter:
+    """Single writer thread in front of a review store"""
+
+    def __init__(self, store, durability="batch", max_batch=256, sync_interval=2.0,
+                 refresh_interval=5.0):
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"Unknown durability mode: {durability}")
+        self.store = store
+        self.durability = durability
+        self.max_batch = 1 if durability == "review" else max_batch
+        self.sync_interval = sync_interval
+        self.refresh_interval = refresh_interval
+        self.last_refresh = time.monotonic()
+        self.requests = queue.Queue()
+        self.results = queue.Queue()
+        self.unsynced = False
+        self.last_sync = time.monotonic()
+        self.thread = threading.Thread(target=self._run, name="review-writer", daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def submit(self, review):
+        """Queue a review for writing; returns immediately"""
+        self.requests.put(review)
+
+    def stop(self):
+        """Write everything still queued, sync, and end the thread"""
+        if self.thread.is_alive():
+            self.requests.put(_STOP)
+            self.thread.join()
+
+    def poll(self):
+        """Drain finished batches as (written, error, sync_error, submitted); call from the UI thread.
+
+        `written` is every review that became visible in the store, in store
+        order, including other kiosks' reviews; `submitted` is this kiosk's batch.
+        `error` means the batch was not written. `sync_error` means it was
+        written but the fsync failed; the writer retries the sync later, so
+        the batch must not be submitted again.
+        """
+        finished = []
+        while True:
+            try:
+                finished.append(self.results.get_nowait())
+            except queue.Empty:
+                return finished
+
+    def _next_batch(self):
+        """Block for the first review, then take whatever else is already waiting"""
+        timeout = max(0.0, self.last_refresh + self.refresh_interval - time.monotonic())
+        if self.durability == "interval" and self.unsynced:
+            timeout = min(timeout, max(0.0, self.last_sync + self.sync_interval - time.monotonic()))
+        try:
+            first = self.requests.get(timeout=timeout)
+        except queue.Empty:
+            return []
+        batch = [first]
+        while first is not _STOP and len(batch) < self.max_batch:
+            try:
+                item = self.requests.get_nowait()
+            except queue.Empty:
+                break
+            batch.append(item)
+            if item is _STOP:
+                break
+        return batch
+
+    def _sync(self):
+        # A failed sync is retried after sync_interval rather than in a tight loop
+        self.last_sync = time.monotonic()
+        self.store.sync()
+        self.unsynced = False
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            stopping = bool(batch) and batch[-1] is _STOP
+            reviews = [r for r in batch if r is not _STOP]
+            written = []
+            error = sync_error = None
+            try:
+                if reviews:
+                    written = self.store.add_many(reviews)
+                    self.unsynced = True
+                elif time.monotonic() - self.last_refresh >= self.refresh_interval:
+                    written = self.store.refresh()
+                if reviews or not batch:
+                    self.last_refresh = time.monotonic()
+            except Exception as e:
+                error = e
+            if self.unsynced and (self.durability != "interval" or stopping or
+                                  time.monotonic() - self.last_sync >= self.sync_interval):
+                try:
+                    self._sync()
+                except Exception as e:
+                    sync_error = e
+            if reviews or written or sync_error is not None:
+                self.results.put((written, error, sync_error, reviews))
+            if stopping:
+                return
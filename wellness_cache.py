@@ -0,0 +1,77 @@
+"""
+Columnar sidecar cache for Excel wellness workbooks.
+
+read_workbook() returns the first sheet of a workbook as a DataFrame, like
+pd.read_excel. The first read also writes a Parquet copy to .wellness_cache/
+next to the workbook. Later reads load that copy instead of parsing the
+workbook. The sidecar name carries the workbook's size and mtime, so a
+changed workbook simply misses the cache and its old sidecar is replaced.
+
+Parquet needs pyarrow (or fastparquet); without it, or for columns Parquet
+cannot store, the sidecar is a pandas pickle instead.
+"""
+
+import os
+from pathlib import Path
+
+CACHE_DIR = ".wellness_cache"
+
+
+def sidecar_key(workbook):
+    stat = os.stat(workbook)
+    return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+
+def find_sidecar(workbook):
+    """Path of a fresh sidecar for workbook, or None"""
+    workbook = Path(workbook)
+    key = sidecar_key(workbook)
+    for suffix in (".parquet", ".pkl"):
+        sidecar = workbook.parent / CACHE_DIR / f"{workbook.name}.{key}{suffix}"
+        if sidecar.exists():
+            return sidecar
+    return None
+
+
+def read_sidecar(sidecar):
+    import pandas as pd
+    if sidecar.suffix == ".parquet":
+        return pd.read_parquet(sidecar)
+    return pd.read_pickle(sidecar)
+
+
+def write_sidecar(workbook, df):
+    """Store df as the sidecar of workbook, dropping sidecars of older versions"""
+    workbook = Path(workbook)
+    cache_dir = workbook.parent / CACHE_DIR
+    cache_dir.mkdir(exist_ok=True)
+    base = cache_dir / f"{workbook.name}.{sidecar_key(workbook)}"
+    tmp_file = base.with_name(base.name + ".tmp")
+    try:
+        df.to_parquet(tmp_file, index=False)
+        sidecar = base.with_name(base.name + ".parquet")
+    except (ImportError, ValueError, TypeError):
+        df.to_pickle(tmp_file)
+        sidecar = base.with_name(base.name + ".pkl")
+    os.replace(tmp_file, sidecar)
+    for old in cache_dir.glob(f"{workbook.name}.*"):
+        if old != sidecar:
+            old.unlink(missing_ok=True)
+    return sidecar
+
+
+def read_workbook(workbook):
+    """First sheet of workbook as a DataFrame, from the sidecar when it is fresh"""
+    sidecar = find_sidecar(workbook)
+    if sidecar is not None:
+        try:
+            return read_sidecar(sidecar)
+        except Exception:
+            pass  # unreadable sidecar (e.g. written by another pyarrow): rebuild it
+    import pandas as pd
+    df = pd.read_excel(workbook)
+    try:
+        write_sidecar(workbook, df)
+    except OSError:
+        pass  # read-only folder: still return the data
+    return df
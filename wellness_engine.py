@@ -0,0 +1,198 @@
+"""
+UI-independent wellness logging engine shared by the MindBloom apps.
+
+WellnessRules holds what used to be copied into every app: the field checks
+and the status rule (enough screen-free minutes plus a me-time activity, and
+for some apps a wellness activity). WellnessEngine validates, classifies and
+stores entries in an EntryStore and hands every change to an optional storage
+object (for example an EntryJournal). The apps only read their widgets and
+show the errors, so the same code can ingest a CSV file or run in a benchmark
+without a display.
+
+    python wellness_engine.py entries.csv        # ingest a CSV export headless
+"""
+
+import argparse
+import csv
+import re
+import time
+from datetime import datetime
+
+from wellness_entries import ENTRY_LABELS, EntryStore
+
+HEALTHY = "Healthy"
+NEEDS_MORE = "Needs More Me-Time"
+
+FIELD_NAMES = {
+    "name": "Student name",
+    "wellness": "Mental wellness activity",
+    "metime": "Me-time activity",
+    "screen_free": "Screen-free time",
+}
+LETTERS = re.compile(r"[A-Za-z ]+")
+
+# CSV header -> entry field, for both the lab3.1 (ENTRY_LABELS) and lab3.2 column layouts
+COLUMN_ALIASES = {
+    **{label: field for field, label in ENTRY_LABELS.items()},
+    "Timestamp": "date",
+    "Name": "name",
+    "Off-screen Time (min)": "screen_free",
+    "Frequency": "frequency",
+}
+
+
+class EntryError(ValueError):
+    """An entry failed validation; the message is meant for the user"""
+
+    def __init__(self, message, row=None):
+        super().__init__(message)
+        self.row = row
+
+
+class WellnessRules:
+    def __init__(self, min_minutes=60, needs_wellness=False, letters_only=("name",), whole_minutes=False):
+        self.min_minutes = min_minutes
+        self.needs_wellness = needs_wellness
+        self.letters_only = letters_only
+        self.whole_minutes = whole_minutes
+
+    def status(self, screen_free, metime, wellness=""):
+        healthy = screen_free >= self.min_minutes and bool(metime)
+        if self.needs_wellness:
+            healthy = healthy and bool(wellness)
+        return HEALTHY if healthy else NEEDS_MORE
+
+    def statuses(self, screen_free, metime, wellness=None):
+        """Statuses for parallel sequences of screen-free times and activities"""
+        try:
+            import numpy as np
+        except ImportError:
+            wellness = wellness if self.needs_wellness else [""] * len(screen_free)
+            return [self.status(*values) for values in zip(screen_free, metime, wellness)]
+        if not len(screen_free):
+            return []
+        healthy = np.asarray(screen_free, dtype=float) >= self.min_minutes
+        healthy &= np.char.str_len(np.asarray(metime, dtype=str)) > 0
+        if self.needs_wellness:
+            healthy &= np.char.str_len(np.asarray(wellness, dtype=str)) > 0
+        return np.where(healthy, HEALTHY, NEEDS_MORE).tolist()
+
+    def minutes(self, screen_free):
+        """Parse a screen-free time; raises EntryError unless it is a positive number"""
+        try:
+            value = int(str(screen_free).strip()) if self.whole_minutes else float(screen_free)
+            if value <= 0:
+                raise ValueError
+        except ValueError:
+            kind = "whole number" if self.whole_minutes else "number"
+            raise EntryError(f"Screen-free time must be a positive {kind} (in minutes)!") from None
+        return value
+
+    def validate(self, name, wellness, metime, screen_free, notes="", **extra):
+        """Cleaned entry fields; raises EntryError for the first problem found"""
+        fields = {"name": str(name).strip(), "wellness": str(wellness).strip(),
+                  "metime": str(metime).strip(), "screen_free": str(screen_free).strip()}
+        for field, value in fields.items():
+            if not value:
+                raise EntryError(f"{FIELD_NAMES[field]} cannot be empty!")
+        for field in self.letters_only:
+            if not LETTERS.fullmatch(fields[field]):
+                raise EntryError(f"{FIELD_NAMES[field]} must only contain alphabets and spaces!")
+        fields["screen_free"] = self.minutes(fields["screen_free"])
+        fields["notes"] = str(notes or "").strip()
+        return {**fields, **extra}
+
+
+class WellnessEngine:
+    def __init__(self, rules=None, storage=None, entries=None):
+        self.rules = rules or WellnessRules()
+        self.entries = entries if entries is not None else EntryStore()
+        # Anything with record_many(entries) and forget(entry_id), e.g. an EntryJournal
+        self.storage = storage
+
+    def add_entry(self, **fields):
+        return self.add_entries([fields])[0]
+
+    def add_entries(self, rows):
+        """Validate, classify and store a batch of entry field dicts; returns the new entries.
+
+        Nothing is stored if any row is invalid; the EntryError says which row.
+        """
+        clean = []
+        for number, row in enumerate(rows, 1):
+            try:
+                clean.append(self.rules.validate(**row))
+            except EntryError as e:
+                raise EntryError(str(e), row=number) from None
+        statuses = self.rules.statuses([row["screen_free"] for row in clean],
+                                       [row["metime"] for row in clean],
+                                       [row["wellness"] for row in clean])
+        now = datetime.now().strftime("%Y-%m-%d %H:%M")
+        added = []
+        for row, status in zip(clean, statuses):
+            row.setdefault("date", now)
+            added.append(self.entries.add(**row, status=status))
+        if self.storage is not None:
+            self.storage.record_many(added)
+        return added
+
+    def update_entry(self, entry_id, **fields):
+        row = self.rules.validate(**fields)
+        row.setdefault("date", datetime.now().strftime("%Y-%m-%d %H:%M"))
+        status = self.rules.status(row["screen_free"], row["metime"], row["wellness"])
+        entry = self.entries.update(entry_id, **row, status=status)
+        if self.storage is not None:
+            self.storage.record_many([entry])
+        return entry
+
+    def delete_entry(self, entry_id):
+        entry = self.entries.delete(entry_id)
+        if self.storage is not None:
+            self.storage.forget(entry.entry_id)
+        return entry
+
+    def clear(self):
+        if self.storage is not None:
+            for entry_id in list(self.entries.records):
+                self.storage.forget(entry_id)
+        self.entries.clear()
+
+    def ingest_csv(self, path, aliases=COLUMN_ALIASES):
+        """Add every row of a lab3.1 or lab3.2 CSV export; Status is recomputed"""
+        fields = {label: field for label, field in aliases.items() if field != "status"}
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            missing = set(FIELD_NAMES) - {fields.get(label) for label in reader.fieldnames or ()}
+            if missing:
+                names = ", ".join(FIELD_NAMES[field] for field in FIELD_NAMES if field in missing)
+                raise EntryError(f"Missing columns: {names}")
+            rows = [{fields[label]: value for label, value in row.items() if label in fields}
+                    for row in reader]
+        return self.add_entries(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ingest wellness entries from CSV without a display")
+    parser.add_argument('csv_files', nargs='+')
+    parser.add_argument('--min-minutes', type=float, default=60)
+    args = parser.parse_args(argv)
+
+    engine = WellnessEngine(WellnessRules(args.min_minutes))
+    for path in args.csv_files:
+        started = time.perf_counter()
+        try:
+            added = engine.ingest_csv(path)
+        except EntryError as e:
+            where = f"line {e.row + 1}: " if e.row is not None else ""
+            print(f"{path}: {where}{e}")
+            continue
+        elapsed = time.perf_counter() - started
+        print(f"{path}: {len(added):,} entries in {elapsed * 1000:.0f} ms "
+              f"({len(added) / max(elapsed, 1e-9):,.0f}/s)")
+    summary = engine.entries.summary
+    print(f"{summary.count:,} entries, {summary.healthy:,} healthy, "
+          f"average screen-free {summary.average:.1f} min")
+
+
+if __name__ == "__main__":
+    main()
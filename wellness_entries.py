@@ -0,0 +1,223 @@
+"""
+Keyed in-memory store for MindBloom wellness entries.
+
+Entries are __slots__ records instead of dicts with long string keys. Each one
+gets a stable integer ID, and the apps use that ID as the Treeview item ID, so a
+selected row maps straight to its entry whatever filtering or reordering the
+table shows. Lookup, edit and delete are O(1) dict operations; iteration keeps
+insertion order.
+
+EntrySearch keeps a trigram index over the distinct student names and statuses
+so the data table can search without scanning every entry. EntrySummary keeps
+the overview statistics up to date as entries change.
+"""
+
+from bisect import bisect_left, insort
+from itertools import islice
+
+# Column labels used by the workbook and the original dict entries
+ENTRY_LABELS = {
+    "name": "Student Name",
+    "wellness": "Wellness Activity",
+    "metime": "Me-Time Activity",
+    "screen_free": "Screen-Free Time (minutes)",
+    "status": "Status",
+    "notes": "Notes",
+    "date": "Date",
+}
+
+
+class WellnessEntry:
+    __slots__ = ("entry_id", "name", "wellness", "metime", "screen_free", "status", "notes", "date",
+                 "frequency")
+
+    def __init__(self, entry_id, name, wellness, metime, screen_free, status, notes="", date="",
+                 frequency=None):
+        self.entry_id = entry_id
+        self.name = name
+        self.wellness = wellness
+        self.metime = metime
+        self.screen_free = screen_free
+        self.status = status
+        self.notes = notes
+        self.date = date
+        self.frequency = frequency
+
+    @property
+    def iid(self):
+        """Treeview item ID for this entry"""
+        return str(self.entry_id)
+
+    def as_dict(self, labels=ENTRY_LABELS):
+        return {label: getattr(self, field) for field, label in labels.items()}
+
+    def fields(self):
+        """Field values by attribute name, without the ID"""
+        return {field: getattr(self, field) for field in self.__slots__[1:]}
+
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class EntrySearch:
+    """Case-insensitive substring search over entry names and statuses.
+
+    Names and statuses repeat a lot, so the index maps each distinct lowercased
+    term to its entry IDs and each trigram to the terms containing it. A query
+    that extends the previous one (typing another character) only re-checks
+    the previous matches.
+    """
+
+    def __init__(self):
+        self.ids_by_term = {}
+        self.terms_by_gram = {}
+        self.last_query = None
+        self.last_terms = None
+
+    def terms(self, entry):
+        return {entry.name.lower(), entry.status.lower()}
+
+    def add(self, entry):
+        for term in self.terms(entry):
+            ids = self.ids_by_term.get(term)
+            if ids is None:
+                ids = self.ids_by_term[term] = set()
+                for gram in trigrams(term):
+                    self.terms_by_gram.setdefault(gram, set()).add(term)
+            ids.add(entry.entry_id)
+        self.last_query = None
+
+    def remove(self, entry):
+        for term in self.terms(entry):
+            ids = self.ids_by_term[term]
+            ids.discard(entry.entry_id)
+            if not ids:
+                del self.ids_by_term[term]
+                for gram in trigrams(term):
+                    self.terms_by_gram[gram].discard(term)
+        self.last_query = None
+
+    def matching_terms(self, query):
+        if self.last_query is not None and self.last_query in query:
+            candidates = self.last_terms
+        elif len(query) >= 3:
+            grams = sorted((self.terms_by_gram.get(g, set()) for g in trigrams(query)), key=len)
+            candidates = grams[0].intersection(*grams[1:])
+        else:
+            candidates = self.ids_by_term
+        terms = {term for term in candidates if query in term}
+        self.last_query, self.last_terms = query, terms
+        return terms
+
+    def search(self, query):
+        """Sorted IDs of entries whose name or status contains query"""
+        ids = set()
+        for term in self.matching_terms(query.lower()):
+            ids.update(self.ids_by_term[term])
+        return sorted(ids)
+
+
+class EntrySummary:
+    """Count, healthy count and screen-free total/min/max, updated per entry.
+
+    Screen-free times are kept in a sorted list (a multiset: equal times are
+    separate items), so removing an entry's time still leaves the right
+    minimum and maximum.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.healthy = 0
+        self.total = 0.0
+        self.times = []
+
+    def add(self, entry):
+        self.count += 1
+        self.healthy += entry.status == "Healthy"
+        self.total += entry.screen_free
+        insort(self.times, entry.screen_free)
+
+    def remove(self, entry):
+        self.count -= 1
+        self.healthy -= entry.status == "Healthy"
+        self.total = self.total - entry.screen_free if self.count else 0.0
+        del self.times[bisect_left(self.times, entry.screen_free)]
+
+    @property
+    def average(self):
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def lowest(self):
+        return self.times[0] if self.times else 0.0
+
+    @property
+    def best(self):
+        return self.times[-1] if self.times else 0.0
+
+
+class EntryStore:
+    def __init__(self):
+        self.records = {}
+        self.next_id = 1
+        self.index = EntrySearch()
+        self.summary = EntrySummary()
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records.values())
+
+    def add(self, **fields):
+        return self.put(self.next_id, **fields)
+
+    def put(self, entry_id, **fields):
+        """Insert or replace the entry with this ID, e.g. when restoring saved entries"""
+        entry_id = int(entry_id)
+        if entry_id in self.records:
+            return self.update(entry_id, **fields)
+        entry = WellnessEntry(entry_id, **fields)
+        self.records[entry_id] = entry
+        self.index.add(entry)
+        self.summary.add(entry)
+        self.next_id = max(self.next_id, entry_id + 1)
+        return entry
+
+    def get(self, entry_id):
+        return self.records[int(entry_id)]
+
+    def update(self, entry_id, **fields):
+        entry = self.get(entry_id)
+        self.index.remove(entry)
+        self.summary.remove(entry)
+        for field, value in fields.items():
+            setattr(entry, field, value)
+        self.index.add(entry)
+        self.summary.add(entry)
+        return entry
+
+    def delete(self, entry_id):
+        entry = self.records.pop(int(entry_id))
+        self.index.remove(entry)
+        self.summary.remove(entry)
+        return entry
+
+    def clear(self):
+        self.records.clear()
+        self.index = EntrySearch()
+        self.summary = EntrySummary()
+
+    def search(self, query):
+        """IDs of the entries matching a search box query, in insertion order"""
+        if not query.strip():
+            return list(self.records)
+        return self.index.search(query)
+
+    def newest(self, n):
+        """The last n entries added, newest first"""
+        return list(islice(reversed(self.records.values()), n))
+
+    def as_dicts(self, labels=ENTRY_LABELS):
+        return [entry.as_dict(labels) for entry in self]
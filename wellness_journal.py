@@ -0,0 +1,118 @@
+"""
+Crash-safe autosave for MindBloom wellness entries.
+
+Every add or edit is appended to <name>.wal as one JSON line holding the whole
+entry and flushed to the OS, so an app crash loses nothing and a save costs
+microseconds. A delete is logged as {"id": ..., "deleted": true}. Records are
+complete entries keyed by ID, so replaying one twice is harmless.
+
+checkpoint() writes all entries to <name>.json in a background thread. The
+current log is first renamed to <name>.wal.old, and is removed only once the
+snapshot is on disk. load() reads the snapshot and replays .wal.old and .wal on
+top of it. Until a checkpoint has finished, a power cut can lose the records
+that are still in the OS cache.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+
+
+class EntryJournal:
+    def __init__(self, name):
+        base = Path(name)
+        self.snapshot_file = base.with_name(base.name + ".json")
+        self.wal_file = base.with_name(base.name + ".wal")
+        self.old_wal_file = base.with_name(base.name + ".wal.old")
+        self.wal = None
+        # Log records not yet covered by a snapshot
+        self.pending = 0
+        self.writer = None
+
+    def load(self, entries):
+        """Fill an EntryStore from the snapshot and the logs; returns the number of entries"""
+        if self.snapshot_file.exists():
+            with open(self.snapshot_file, encoding="utf-8") as f:
+                for record in json.load(f):
+                    entries.put(record.pop("id"), **record)
+        for log in (self.old_wal_file, self.wal_file):
+            self.pending += self.replay(log, entries)
+        self.wal = open(self.wal_file, "a", encoding="utf-8")
+        return len(entries)
+
+    def replay(self, path, entries):
+        """Apply the complete records of a log; a torn last line is cut off"""
+        if not path.exists():
+            return 0
+        count = size = 0
+        with open(path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                record = json.loads(line)
+                if record.get("deleted"):
+                    if int(record["id"]) in entries.records:
+                        entries.delete(record["id"])
+                else:
+                    entries.put(record.pop("id"), **record)
+                count += 1
+                size += len(line)
+        if size < path.stat().st_size:
+            os.truncate(path, size)
+        return count
+
+    def record(self, entry):
+        """Append an added or edited entry to the log"""
+        self.record_many([entry])
+
+    def record_many(self, entries):
+        self.wal.write("".join(json.dumps({"id": entry.entry_id, **entry.fields()}) + "\n"
+                               for entry in entries))
+        self.wal.flush()
+        self.pending += len(entries)
+
+    def forget(self, entry_id):
+        """Log that an entry was deleted"""
+        self.wal.write(json.dumps({"id": int(entry_id), "deleted": True}) + "\n")
+        self.wal.flush()
+        self.pending += 1
+
+    def checkpoint(self, entries, wait=False):
+        """Snapshot all entries in the background; returns False if there was nothing to do"""
+        if self.writer is not None and self.writer.is_alive():
+            if not wait:
+                return False
+            self.writer.join()
+        if not self.pending:
+            return False
+        self.wal.close()
+        if self.old_wal_file.exists():
+            # An earlier snapshot never finished: keep its records ahead of the new ones
+            with open(self.old_wal_file, "a", encoding="utf-8") as old, \
+                    open(self.wal_file, encoding="utf-8") as new:
+                old.write(new.read())
+            os.remove(self.wal_file)
+        else:
+            os.replace(self.wal_file, self.old_wal_file)
+        self.wal = open(self.wal_file, "a", encoding="utf-8")
+        self.pending = 0
+        rows = [{"id": entry.entry_id, **entry.fields()} for entry in entries]
+        self.writer = threading.Thread(target=self.write_snapshot, args=(rows,), daemon=True)
+        self.writer.start()
+        if wait:
+            self.writer.join()
+        return True
+
+    def write_snapshot(self, rows):
+        tmp_file = self.snapshot_file.with_name(self.snapshot_file.name + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(rows, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.snapshot_file)
+        os.remove(self.old_wal_file)
+
+    def close(self, entries):
+        self.checkpoint(entries, wait=True)
+        self.wal.close()
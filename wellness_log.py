@@ -0,0 +1,64 @@
+"""
+Append-only storage for MindBloom wellness entries.
+
+Saving appends rows to one CSV file per day in <workbook>_log/, so a save costs
+the same however much history there is. The Excel workbook is rebuilt from the
+log only when it is exported. An existing workbook is copied into the log once,
+the first time the log is used, so no earlier rows are lost.
+"""
+
+import csv
+import os
+from datetime import datetime
+from pathlib import Path
+
+from wellness_cache import read_workbook
+
+LEGACY_PART = "part-0000-00-00.csv"
+
+
+class WellnessLog:
+    def __init__(self, workbook):
+        self.workbook = Path(workbook)
+        self.log_dir = self.workbook.with_name(self.workbook.stem + "_log")
+
+    def parts(self):
+        if not self.log_dir.exists():
+            return []
+        return sorted(self.log_dir.glob("part-*.csv"))
+
+    def append(self, entries):
+        """Append entry dicts to today's partition; returns how many were written"""
+        if not entries:
+            return 0
+        if not self.log_dir.exists():
+            self.start_log()
+        part = self.log_dir / f"part-{datetime.now():%Y-%m-%d}.csv"
+        with open(part, "a", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(entries[0]), extrasaction="ignore")
+            if f.tell() == 0:
+                writer.writeheader()
+            writer.writerows(entries)
+            f.flush()
+            os.fsync(f.fileno())
+        return len(entries)
+
+    def start_log(self):
+        """Create the log directory, seeded with the rows of an existing workbook"""
+        tmp_dir = self.log_dir.with_name(self.log_dir.name + ".tmp")
+        tmp_dir.mkdir(exist_ok=True)
+        if self.workbook.exists():
+            read_workbook(self.workbook).to_csv(tmp_dir / LEGACY_PART, index=False)
+        os.replace(tmp_dir, self.log_dir)
+
+    def export(self):
+        """Rebuild the workbook from every partition; returns the number of rows"""
+        import pandas as pd
+        parts = self.parts()
+        if not parts:
+            return 0
+        df = pd.concat((pd.read_csv(part) for part in parts), ignore_index=True)
+        tmp_file = self.workbook.with_name(self.workbook.stem + ".tmp.xlsx")
+        df.to_excel(tmp_file, index=False)
+        os.replace(tmp_file, self.workbook)
+        return len(df)
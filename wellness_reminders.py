@@ -0,0 +1,121 @@
+"""
+Reminder scheduling for the MindBloom apps.
+
+Reminder rules (optionally tied to one student) fire every `interval` seconds.
+Their next wall-clock deadlines sit in a heap, and a single Tk timer is armed
+for the nearest one. Deadlines advance on a fixed grid from the rule's start,
+so time spent handling a notification never shifts later reminders. Intervals
+missed while the app was closed or the machine slept collapse into one
+notification. Rules and their next deadlines are saved to a JSON file, so
+reminders survive restarts.
+
+The timer never waits longer than MAX_WAIT_MS, so a wall-clock jump or a
+suspend is noticed within a minute.
+"""
+
+import heapq
+import json
+import math
+import os
+import time
+from pathlib import Path
+
+MAX_WAIT_MS = 60000
+
+
+class ReminderRule:
+    __slots__ = ("rule_id", "message", "interval", "next_fire", "student")
+
+    def __init__(self, rule_id, message, interval, next_fire, student=None):
+        self.rule_id = rule_id
+        self.message = message
+        self.interval = interval
+        self.next_fire = next_fire
+        self.student = student
+
+    def as_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def advance(self, now):
+        """Move next_fire to the first grid point after now"""
+        missed = math.floor((now - self.next_fire) / self.interval) + 1
+        self.next_fire += max(missed, 1) * self.interval
+
+
+class ReminderScheduler:
+    def __init__(self, root, path, notify):
+        """notify(rules) is called with the rules that are due; it must not block"""
+        self.root = root
+        self.path = Path(path)
+        self.notify = notify
+        self.rules = {}
+        self.heap = []
+        self.timer = None
+        self.load()
+        self.arm()
+
+    def load(self):
+        if not self.path.exists():
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for data in json.load(f):
+                rule = ReminderRule(**data)
+                self.rules[rule.rule_id] = rule
+                heapq.heappush(self.heap, (rule.next_fire, rule.rule_id))
+
+    def save(self):
+        tmp_file = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump([rule.as_dict() for rule in self.rules.values()], f, indent=2)
+        os.replace(tmp_file, self.path)
+
+    def add_rule(self, message, interval, student=None, first_fire=None):
+        """Add a reminder every `interval` seconds, first at `first_fire` (default: one interval from now)"""
+        rule_id = max(self.rules, default=0) + 1
+        rule = ReminderRule(rule_id, message, interval, first_fire or time.time() + interval, student)
+        self.rules[rule_id] = rule
+        heapq.heappush(self.heap, (rule.next_fire, rule_id))
+        self.save()
+        self.arm()
+        return rule
+
+    def remove_rule(self, rule_id):
+        # Its heap item is skipped when it comes up
+        del self.rules[rule_id]
+        self.save()
+
+    def rules_for(self, student):
+        return [rule for rule in self.rules.values() if rule.student == student]
+
+    def _valid(self, item):
+        when, rule_id = item
+        rule = self.rules.get(rule_id)
+        return rule is not None and rule.next_fire == when
+
+    def arm(self):
+        """(Re)arm the one Tk timer for the nearest deadline"""
+        if self.timer is not None:
+            self.root.after_cancel(self.timer)
+            self.timer = None
+        while self.heap and not self._valid(self.heap[0]):
+            heapq.heappop(self.heap)
+        if not self.heap:
+            return
+        delay_ms = max(0, int((self.heap[0][0] - time.time()) * 1000))
+        self.timer = self.root.after(min(delay_ms, MAX_WAIT_MS), self.fire_due)
+
+    def fire_due(self):
+        self.timer = None
+        now = time.time()
+        due = []
+        while self.heap and self.heap[0][0] <= now:
+            item = heapq.heappop(self.heap)
+            if self._valid(item):
+                rule = self.rules[item[1]]
+                due.append(rule)
+                rule.advance(now)
+                heapq.heappush(self.heap, (rule.next_fire, rule.rule_id))
+        if due:
+            self.save()
+            self.notify(due)
+        self.arm()
@@ -0,0 +1,180 @@
+"""
+Class-level wellness report over many section workbooks.
+
+Every *.xlsx in a folder is one class section, saved by lab3.1 or lab3.2 (both
+column layouts are understood). Workbooks are loaded in worker processes
+through the sidecar cache, combined into one DataFrame, and summarised with
+grouped pandas/NumPy operations only:
+
+- weekly mean screen-free minutes per student and the slope of that trend
+  (minutes per week, least squares over the student's weeks)
+- healthy-day streaks: a day is healthy when every entry that day is
+  Healthy; longest and current run of consecutive healthy days
+- where each student's average sits in their section (percentile), and the
+  10th/50th/90th percentile of screen-free time per section
+
+    python wellness_report.py sections/ --out wellness_report
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from wellness_cache import read_workbook
+
+# Workbook column -> report column, for both app layouts
+COLUMN_ALIASES = {
+    "Timestamp": "date", "Date": "date",
+    "Name": "name", "Student Name": "name",
+    "Off-screen Time (min)": "screen_free", "Screen-Free Time (minutes)": "screen_free",
+    "Status": "status",
+}
+REPORT_COLUMNS = ["date", "name", "screen_free", "status"]
+
+
+def load_section(path):
+    """One section workbook as date/name/screen_free/status/section columns (runs in a worker)"""
+    df = read_workbook(path).rename(columns=COLUMN_ALIASES)
+    missing = set(REPORT_COLUMNS) - set(df.columns)
+    if missing:
+        raise ValueError(f"{Path(path).name}: missing columns {', '.join(sorted(missing))}")
+    df = df[REPORT_COLUMNS].copy()
+    df["section"] = Path(path).stem
+    return df
+
+
+def load_sections(paths, workers=None):
+    import pandas as pd
+    paths = sorted(paths)
+    workers = workers or min(len(paths), os.cpu_count() or 1)
+    if workers <= 1:
+        frames = [load_section(path) for path in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            frames = list(pool.map(load_section, paths, chunksize=max(1, len(paths) // (workers * 4))))
+    return pd.concat(frames, ignore_index=True)
+
+
+def clean_entries(df):
+    import pandas as pd
+    df = df.assign(
+        date=pd.to_datetime(df["date"], errors="coerce"),
+        name=df["name"].astype(str).str.strip().str.title(),
+        screen_free=pd.to_numeric(df["screen_free"], errors="coerce"),
+        healthy=df["status"].astype(str).str.strip().eq("Healthy"),
+    )
+    return df.dropna(subset=["date", "screen_free"])
+
+
+def weekly_trends(df):
+    """Weekly mean minutes per student, with each student's slope in minutes per week"""
+    keys = ["section", "name"]
+    weekly = (df.assign(week=df["date"].dt.to_period("W").dt.start_time)
+              .groupby(keys + ["week"], sort=True)
+              .agg(minutes=("screen_free", "mean"), entries=("screen_free", "size"))
+              .reset_index())
+    x = (weekly["week"] - weekly["week"].min()).dt.days / 7
+    groups = weekly.assign(x=x).groupby(keys)
+    dx = x - groups["x"].transform("mean")
+    dy = weekly["minutes"] - groups["minutes"].transform("mean")
+    sums = weekly[keys].assign(xy=dx * dy, xx=dx * dx).groupby(keys)[["xy", "xx"]].sum()
+    # A student seen in a single week has no trend (0 / 0 -> NaN)
+    slope = (sums["xy"] / sums["xx"].where(sums["xx"] > 0)).rename("trend_per_week")
+    return weekly, slope
+
+
+def healthy_streaks(df):
+    """Longest and current run of consecutive healthy days per student"""
+    import pandas as pd
+    keys = ["section", "name"]
+    days = (df.assign(day=df["date"].dt.normalize())
+            .groupby(keys + ["day"], sort=True)["healthy"].min()
+            .reset_index())
+    last_day = days.groupby(keys)["day"].max().rename("last_day")
+    good = days[days["healthy"]]
+    # A new run starts at a student's first healthy day or after a gap of more than one day
+    new_student = (good[keys] != good[keys].shift()).any(axis=1)
+    gap = good["day"].diff() != pd.Timedelta(days=1)
+    run = (new_student | gap).cumsum()
+    runs = (good.assign(run=run)
+            .groupby(keys + ["run"]).agg(length=("day", "size"), end=("day", "max"))
+            .reset_index()
+            .join(last_day, on=keys))
+    longest = runs.groupby(keys)["length"].max().rename("longest_streak")
+    # The current streak is the run that reaches the student's last logged day
+    current = runs[runs["end"] == runs["last_day"]].groupby(keys)["length"].max().rename("current_streak")
+    return pd.concat([longest, current], axis=1)
+
+
+def build_report(df):
+    """(students, sections, weekly) summary DataFrames from the combined entries"""
+    import pandas as pd
+    df = clean_entries(df)
+    keys = ["section", "name"]
+    students = df.groupby(keys).agg(
+        entries=("screen_free", "size"),
+        avg_screen_free=("screen_free", "mean"),
+        healthy_share=("healthy", "mean"),
+        first_entry=("date", "min"),
+        last_entry=("date", "max"),
+    )
+    students["section_percentile"] = students.groupby(level="section")["avg_screen_free"].rank(pct=True) * 100
+    weekly, slope = weekly_trends(df)
+    students = students.join(slope).join(healthy_streaks(df))
+    students[["longest_streak", "current_streak"]] = students[["longest_streak", "current_streak"]].fillna(0).astype(int)
+
+    grouped = df.groupby("section")["screen_free"]
+    sections = pd.concat([
+        df.groupby("section").agg(students=("name", "nunique"), entries=("name", "size"),
+                                  healthy_share=("healthy", "mean")),
+        grouped.quantile([0.1, 0.5, 0.9]).unstack().rename(columns=lambda q: f"p{int(q * 100)}_screen_free"),
+    ], axis=1)
+    return students.reset_index().round(2), sections.reset_index().round(2), weekly.round(2)
+
+
+def write_report(students, sections, weekly, out):
+    """Write <out>.csv (one row per student), <out>_weekly.csv and <out>.html (sections, then students)"""
+    out = Path(out)
+    students.to_csv(out.with_suffix(".csv"), index=False)
+    weekly.to_csv(out.with_name(out.name + "_weekly.csv"), index=False)
+    html_output = """
+<html>
+<head><title>Class Wellness Report</title></head>
+<body>
+<h1>Class Wellness Report</h1>
+<h2>Sections</h2>
+{sections}
+<h2>Students</h2>
+{students}
+</body>
+</html>
+""".format(sections=sections.to_html(index=False), students=students.to_html(index=False))
+    with open(out.with_suffix(".html"), "w", encoding="utf-8") as f:
+        f.write(html_output)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarise a folder of class section wellness workbooks")
+    parser.add_argument('folder')
+    parser.add_argument('--out', default="wellness_report")
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    paths = sorted(Path(args.folder).glob("*.xlsx"))
+    if not paths:
+        parser.error(f"no .xlsx workbooks in {args.folder}")
+    started = time.perf_counter()
+    df = load_sections(paths, args.workers)
+    loaded = time.perf_counter()
+    students, sections, weekly = build_report(df)
+    write_report(students, sections, weekly, args.out)
+    done = time.perf_counter()
+    print(f"{len(paths)} workbooks, {len(df):,} entries, {len(students):,} students: "
+          f"load {loaded - started:.2f} s, report {done - loaded:.2f} s")
+    print(f"Report generated: {Path(args.out).with_suffix('.html')}, {Path(args.out).with_suffix('.csv')}")
+
+
+if __name__ == "__main__":
+    main()
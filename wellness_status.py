@@ -0,0 +1,64 @@
+"""
+Coalesced live status preview for the MindBloom entry forms.
+
+Key and combobox events only mark the preview dirty; one after_idle callback
+per burst reads the inputs. The status is recomputed only when the inputs that
+decide it have changed, and the label is reconfigured only when what it shows
+changes.
+
+Set MINDBLOOM_STATUS_STATS=1 to print, once a second while typing, how many
+events, evaluations and label updates there were.
+"""
+
+import os
+import sys
+
+STATS_ENABLED = bool(os.environ.get("MINDBLOOM_STATUS_STATS"))
+
+
+class LiveStatus:
+    def __init__(self, root, label, read_inputs, describe):
+        """read_inputs() returns the status inputs as a tuple; describe(*inputs) the label options"""
+        self.root = root
+        self.label = label
+        self.read_inputs = read_inputs
+        self.describe = describe
+        self.pending = None
+        self.last_inputs = None
+        self.last_shown = None
+        self.events = self.evaluations = self.redraws = 0
+        if STATS_ENABLED:
+            self.root.after(1000, self.report, (0, 0, 0))
+
+    def changed(self, event=None):
+        """Event handler: schedule one refresh for the current burst of events"""
+        self.events += 1
+        if self.pending is None:
+            self.pending = self.root.after_idle(self.refresh)
+
+    def refresh(self):
+        self.pending = None
+        inputs = self.read_inputs()
+        if inputs == self.last_inputs:
+            return
+        self.last_inputs = inputs
+        self.evaluations += 1
+        shown = self.describe(*inputs)
+        if shown != self.last_shown:
+            self.last_shown = shown
+            self.label.config(**shown)
+            self.redraws += 1
+
+    def show(self, **options):
+        """Set the label directly (e.g. after clearing the form) and forget the cached inputs"""
+        self.label.config(**options)
+        self.last_inputs = None
+        self.last_shown = options
+
+    def report(self, previous):
+        counts = (self.events, self.evaluations, self.redraws)
+        if counts != previous:
+            events, evaluations, redraws = (now - before for now, before in zip(counts, previous))
+            print(f"status: {events} events, {evaluations} evaluations, {redraws} label updates /s",
+                  file=sys.stderr)
+        self.root.after(1000, self.report, counts)
@@ -0,0 +1,150 @@
+"""
+Virtualized Treeview for the MindBloom entry tables.
+
+The rows stay in the entry store; the table only holds their keys (entry IDs,
+ascending) and materializes the rows on screen plus `overscan` rows either
+side as Treeview items. Mouse wheel and keyboard scrolling move inside that
+window as usual. Once the view gets close to its edge the window is rebuilt
+around the current position. The scrollbar is driven from the
+position in the full key list, so its thumb size and position match the whole
+table rather than the few rows Tk actually holds.
+
+The item ID of a row is str(key), so selection() returns entry IDs like a
+plain Treeview filled with iid=entry.iid. Selected rows that scroll out of the
+window stay selected until the user picks something else.
+"""
+
+import tkinter as tk
+from bisect import bisect_left
+from tkinter import ttk
+
+
+class VirtualTable:
+    def __init__(self, parent, columns, row_values, stripes=None, overscan=20, height=10, **options):
+        """row_values(key) returns the column values of a row; stripes is an (odd, even) tag pair"""
+        self.tree = ttk.Treeview(parent, columns=columns, show="headings", height=height, **options)
+        self.scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self.yview)
+        self.tree.configure(yscrollcommand=self._tree_scrolled)
+        self.tree.bind("<<TreeviewSelect>>", self._selection_changed, add="+")
+        self.row_values = row_values
+        self.stripes = stripes
+        self.overscan = overscan
+        self.visible = height
+        self.keys = []
+        self.top = 0
+        self.start = self.end = 0
+        self.window = set()
+        # Selected rows that have been scrolled out of the materialized window
+        self.selected_outside = set()
+        # What render() last selected in the tree, to tell its select events from the user's
+        self.rendered_selection = ()
+        self.pending = None
+
+    def __len__(self):
+        return len(self.keys)
+
+    def set_rows(self, keys, top=0):
+        """Show these keys (ascending) starting at row `top`"""
+        self.keys = list(keys)
+        kept = {str(key) for key in self.keys}
+        self.selected_outside &= kept
+        self.render(top)
+
+    def append(self, key):
+        self.keys.append(key)
+        if self.end >= len(self.keys) - 1:
+            self.render(self.top)
+        else:
+            self.scrollbar.set(*self._fractions())
+
+    def remove(self, key):
+        i = bisect_left(self.keys, key)
+        if i < len(self.keys) and self.keys[i] == key:
+            del self.keys[i]
+            self.selected_outside.discard(str(key))
+            self.render(self.top)
+
+    def clear(self):
+        self.set_rows([])
+
+    def refresh(self):
+        """Redraw the materialized rows, e.g. after an entry was edited"""
+        self.render(self.top)
+
+    def selection(self):
+        """Selected keys as strings: the visible rows in table order, then any scrolled out of the window"""
+        shown = self.tree.selection()
+        return tuple(shown) + tuple(sorted(self.selected_outside - set(shown), key=int))
+
+    def render(self, top):
+        n = len(self.keys)
+        top = max(0, min(top, n - self.visible))
+        selected = self.selection()
+        self.tree.delete(*self.tree.get_children())
+        self.top = top
+        self.start = max(0, top - self.overscan)
+        self.end = min(n, top + self.visible + self.overscan)
+        for index in range(self.start, self.end):
+            key = self.keys[index]
+            tags = (self.stripes[index % 2],) if self.stripes else ()
+            self.tree.insert("", "end", iid=str(key), values=self.row_values(key), tags=tags)
+        self.window = {str(key) for key in self.keys[self.start:self.end]}
+        self.selected_outside = {iid for iid in selected if iid not in self.window}
+        shown = [iid for iid in selected if iid in self.window]
+        if shown:
+            self.tree.selection_set(shown)
+        self.rendered_selection = self.tree.selection()
+        if self.end > self.start:
+            self.tree.yview_moveto((top - self.start) / (self.end - self.start))
+        self.scrollbar.set(*self._fractions())
+
+    def yview(self, *args):
+        """Scrollbar command: moveto/scroll over the full key list"""
+        n = len(self.keys)
+        if not n:
+            return
+        if args[0] == tk.MOVETO:
+            top = round(float(args[1]) * n)
+        else:
+            step = self.visible if args[2] == tk.PAGES else 1
+            top = self.top + int(args[1]) * step
+        top = max(0, min(top, n - self.visible))
+        if self._window_covers(top):
+            self.tree.yview_moveto((top - self.start) / (self.end - self.start))
+        else:
+            self.render(top)
+
+    def _fractions(self):
+        n = len(self.keys)
+        if not n:
+            return 0.0, 1.0
+        return self.top / n, min(1.0, (self.top + self.visible) / n)
+
+    def _window_covers(self, top):
+        margin = self.overscan // 2
+        n = len(self.keys)
+        return (self.start <= max(0, top - margin)
+                and min(n, top + self.visible + margin) <= self.end)
+
+    def _tree_scrolled(self, first, last):
+        # Called by the Treeview with fractions of the materialized rows only
+        size = self.end - self.start
+        if not size:
+            self.scrollbar.set(0.0, 1.0)
+            return
+        first, last = float(first), float(last)
+        self.top = self.start + round(first * size)
+        self.visible = max(1, round((last - first) * size))
+        self.scrollbar.set(*self._fractions())
+        if not self._window_covers(self.top) and self.pending is None:
+            self.pending = self.tree.after_idle(self._recenter)
+
+    def _selection_changed(self, event=None):
+        # A new pick by the user replaces the rows remembered outside the window
+        if self.tree.selection() != self.rendered_selection:
+            self.selected_outside.clear()
+            self.rendered_selection = self.tree.selection()
+
+    def _recenter(self):
+        self.pending = None
+        self.render(self.top)